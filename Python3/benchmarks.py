@@ -0,0 +1,402 @@
+""" Benchmarks for the Rabbits & Foxes hot paths
+
+Times a whole time period (Simulation.Step) and its phases on their own - Warren.AdvanceGeneration, Simulation.__FoxesEatRabbitsInWarren, Warren.EatRabbits, Warren.__CompressRabbitList, Simulation.__DrawLandscape and Warren/Rabbit construction - with fixed seeds. Each is run along four scaling axes, changing one of LandscapeSize, InitialWarrenCount, InitialFoxCount and Variability at a time from a base configuration. Along the LandscapeSize axis the warren and fox counts grow with the area, so the landscape is as crowded as the base one. Benchmarks of a single warren or rabbit only depend on Variability, so they are only run along that axis.
+
+Whole-simulation benchmarks are timed on a warmed-up state that still has warrens, foxes and rabbits, and each result records those populations. A config whose populations die out during warm-up with every seed tried is skipped and flagged, rather than timing an empty landscape.
+
+It also checks engines against the reference, Warren with the original Shift compaction. Warren with InPlace compaction must give identical seeded results. SwapWithLast reorders rabbits, and ArrayWarren, CohortWarren and VectorisedSimulation draw their numbers differently, so for those only the average populations over many seeds are compared. Every warren variant is also checkpointed half way through a seeded run, and the restored run must carry on exactly as the original, or for ArrayWarren and CohortWarren, which can't be checkpointed, GetCheckpoint must refuse. Branches forked from one checkpoint are stepped in turn with the run they came from, and FindAnimal must keep finding each one's animals. FastForward with Jump must end exactly where Run would.
+
+Results are written as JSON so runs on different commits can be compared.
+
+Example:
+  python benchmarks.py --output before.json
+  python benchmarks.py --quick --only Step EatRabbits
+"""
+
+import argparse
+import functools
+import io
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+
+from skeleton_with_documentation import Simulation, Warren, ArrayWarren, CohortWarren, Rabbit, CompactionStrategies, LandscapeRenderer, RandomBufferModes, numpy
+
+BASE_CONFIG = {"LandscapeSize": 15, "InitialWarrenCount": 20, "InitialFoxCount": 10, "Variability": 0}
+AXES = {"LandscapeSize": [15, 30, 60], "InitialWarrenCount": [20, 40, 80], "InitialFoxCount": [5, 10, 15], "Variability": [0, 10, 50]}
+SEED = 1
+WARM_UP_PERIODS = 5
+WARM_UP_SEEDS = 10
+
+def Measure(Setup, Run, Repeats):
+  """
+  Times Run(Setup()) Repeats times, leaving Setup out of the timings
+
+  Args:
+    Setup (function): Makes fresh state for one timing
+    Run (function): The code being timed, given what Setup returned
+    Repeats (int): Number of timings
+
+  Returns:
+    dict: MinSeconds, MedianSeconds and MeanSeconds
+  """
+  Times = []
+  for Count in range (0, Repeats):
+    State = Setup()
+    Start = time.perf_counter()
+    Run(State)
+    Times.append(time.perf_counter() - Start)
+  return {"Repeats": Repeats, "MinSeconds": min(Times), "MedianSeconds": statistics.median(Times), "MeanSeconds": statistics.mean(Times)}
+
+def MakeConfigs(Quick):
+  """
+  Returns:
+    list: (Axis, Config) for the base configuration changed along each axis in turn
+  """
+  Configs = []
+  for Axis, Values in AXES.items():
+    if Quick:
+      Values = Values[:2]
+    for Value in Values:
+      Config = dict(BASE_CONFIG)
+      Config[Axis] = Value
+      if Axis == "LandscapeSize":
+        Scale = (Value / BASE_CONFIG["LandscapeSize"]) ** 2
+        Config["InitialWarrenCount"] = int(BASE_CONFIG["InitialWarrenCount"] * Scale)
+        Config["InitialFoxCount"] = int(BASE_CONFIG["InitialFoxCount"] * Scale)
+      Configs.append((Axis, Config))
+  return Configs
+
+def MakeWarmedUpCheckpoint(Config):
+  """
+  Runs a seeded simulation through WARM_UP_PERIODS so the phases are timed on a typical state rather than the initial one
+
+  Note:
+    A state with no foxes or no warrens left would only time an empty loop, so seeds from SEED on are tried in turn, up to WARM_UP_SEEDS of them, until one keeps warrens, foxes and rabbits all alive. Warm-ups are cached, as every whole-simulation benchmark restores from the same one
+
+  Returns:
+    tuple: (checkpoint each timing restores from, or None if every seed died out, dict of the Seed used and the Warrens, Foxes and Rabbits it left)
+  """
+  return WarmUp(Config["LandscapeSize"], Config["InitialWarrenCount"], Config["InitialFoxCount"], Config["Variability"])
+
+@functools.lru_cache(maxsize = None)
+def WarmUp(LandscapeSize, InitialWarrenCount, InitialFoxCount, Variability):
+  """
+  MakeWarmedUpCheckpoint for one config's values, cached
+  """
+  for Seed in range (SEED, SEED + WARM_UP_SEEDS):
+    Sim = Simulation(LandscapeSize, InitialWarrenCount, InitialFoxCount, Variability, False, Interactive = False, Seed = Seed)
+    Sim.Run(WARM_UP_PERIODS)
+    Populations = {"Seed": Seed, "Warrens": Sim.GetWarrenCount(), "Foxes": Sim.GetFoxCount(), "Rabbits": Sim.GetRabbitCount()}
+    if Populations["Warrens"] > 0 and Populations["Foxes"] > 0 and Populations["Rabbits"] > 0:
+      return Sim.GetCheckpoint(), Populations
+  return None, Populations
+
+def BenchmarkStep(Config, Repeats):
+  Checkpoint = MakeWarmedUpCheckpoint(Config)[0]
+  return Measure(lambda: Simulation.FromCheckpoint(Checkpoint), lambda Sim: Sim.Step(), Repeats)
+
+def BenchmarkFoxesEatRabbitsInWarren(Config, Repeats):
+  """
+  Times one predation pass over every warren, as in a time period
+  """
+  Checkpoint = MakeWarmedUpCheckpoint(Config)[0]
+  def Setup():
+    Sim = Simulation.FromCheckpoint(Checkpoint)
+    return Sim, list(Sim._Simulation__WarrenLocations)
+  def Run(State):
+    Sim, WarrenLocations = State
+    for x, y in WarrenLocations:
+      Sim._Simulation__FoxesEatRabbitsInWarren(x, y)
+  return Measure(Setup, Run, Repeats)
+
+def BenchmarkDrawLandscape(Config, Repeats):
+  Checkpoint = MakeWarmedUpCheckpoint(Config)[0]
+  Output = io.StringIO()
+  Renderer = LandscapeRenderer(Config["LandscapeSize"], Output = Output)
+  Sim = Simulation.FromCheckpoint(Checkpoint, Renderer = Renderer)
+  def Setup():
+    Output.seek(0)
+    Output.truncate()
+    return Sim
+  return Measure(Setup, lambda Sim: Sim.Draw(), Repeats)
+
+def MakeWarrens(Config, Count = 50):
+  """
+  Returns:
+    list: Count seeded warrens of 80 rabbits, with Config's Variability
+  """
+  Rng = random.Random(SEED)
+  return [Warren(Config["Variability"], 80, Rng = random.Random(Rng.getrandbits(64))) for Count in range (0, Count)]
+
+def BenchmarkAdvanceGeneration(Config, Repeats):
+  def Run(Warrens):
+    for CurrentWarren in Warrens:
+      CurrentWarren.AdvanceGeneration(False)
+  return Measure(lambda: MakeWarrens(Config), Run, Repeats)
+
+def BenchmarkEatRabbits(Config, Repeats):
+  def Run(Warrens):
+    for CurrentWarren in Warrens:
+      CurrentWarren.EatRabbits(40)
+  return Measure(lambda: MakeWarrens(Config), Run, Repeats)
+
+def BenchmarkCompressRabbitList(Config, Repeats, Strategy):
+  """
+  Times closing the gaps left by killing every third rabbit in each warren
+  """
+  def Setup():
+    Warrens = MakeWarrens(Config)
+    for CurrentWarren in Warrens:
+      CurrentWarren._Warren__CompactionStrategy = Strategy
+      for r in range (0, CurrentWarren.GetRabbitCount(), 3):
+        CurrentWarren._Warren__Rabbits[r] = None
+    return Warrens
+  def Run(Warrens):
+    for CurrentWarren in Warrens:
+      CurrentWarren._Warren__CompressRabbitList((CurrentWarren.GetRabbitCount() + 2) // 3)
+  return Measure(Setup, Run, Repeats)
+
+def BenchmarkWarrenConstruction(Config, Repeats):
+  Rng = random.Random(SEED)
+  return Measure(lambda: None, lambda State: [Warren(Config["Variability"], 80, Rng = Rng) for Count in range (0, 50)], Repeats)
+
+def BenchmarkRabbitConstruction(Config, Repeats):
+  Rng = random.Random(SEED)
+  return Measure(lambda: None, lambda State: [Rabbit(Config["Variability"], Rng = Rng) for Count in range (0, 5000)], Repeats)
+
+WARREN_BENCHMARKS = ("AdvanceGeneration", "EatRabbits", "CompressRabbitList.Shift", "CompressRabbitList.InPlace", "CompressRabbitList.SwapWithLast", "WarrenConstruction", "RabbitConstruction")
+
+BENCHMARKS = {
+  "Step": BenchmarkStep,
+  "FoxesEatRabbitsInWarren": BenchmarkFoxesEatRabbitsInWarren,
+  "DrawLandscape": BenchmarkDrawLandscape,
+  "AdvanceGeneration": BenchmarkAdvanceGeneration,
+  "EatRabbits": BenchmarkEatRabbits,
+  "CompressRabbitList.Shift": functools.partial(BenchmarkCompressRabbitList, Strategy = CompactionStrategies.Shift),
+  "CompressRabbitList.InPlace": functools.partial(BenchmarkCompressRabbitList, Strategy = CompactionStrategies.InPlace),
+  "CompressRabbitList.SwapWithLast": functools.partial(BenchmarkCompressRabbitList, Strategy = CompactionStrategies.SwapWithLast),
+  "WarrenConstruction": BenchmarkWarrenConstruction,
+  "RabbitConstruction": BenchmarkRabbitConstruction,
+}
+
+def RunTrace(Config, Periods, WarrenType, RandomBuffering = RandomBufferModes.Off):
+  """
+  Returns:
+    tuple: (metrics record of every period, drawing of the final landscape) of a seeded run
+  """
+  Output = io.StringIO()
+  Sim = Simulation(Config["LandscapeSize"], Config["InitialWarrenCount"], Config["InitialFoxCount"], Config["Variability"], False, Interactive = False, Seed = SEED, WarrenType = WarrenType, Renderer = LandscapeRenderer(Config["LandscapeSize"], Output = Output), RandomBuffering = RandomBuffering)
+  Records = list(Sim.StreamMetrics(Periods))
+  Sim.Draw()
+  return Records, Output.getvalue()
+
+def CheckIdentical(Name, WarrenType, Configs, Periods, RandomBuffering = RandomBufferModes.Off):
+  """
+  Returns:
+    dict: Whether every config gives exactly the reference's metrics and final state, and the first period that differs if not
+  """
+  Reference = functools.partial(Warren, CompactionStrategy = CompactionStrategies.Shift)
+  Mismatches = []
+  for Axis, Config in Configs:
+    ReferenceRecords, ReferenceLandscape = RunTrace(Config, Periods, Reference)
+    Records, Landscape = RunTrace(Config, Periods, WarrenType, RandomBuffering)
+    if Records != ReferenceRecords or Landscape != ReferenceLandscape:
+      FirstDifference = next((ReferenceRecord["TimePeriod"] for ReferenceRecord, Record in zip(ReferenceRecords, Records) if ReferenceRecord != Record), None)
+      Mismatches.append({"Config": Config, "FirstDifferentPeriod": FirstDifference})
+  return {"Engine": Name, "Check": "Identical", "Passed": not Mismatches, "Mismatches": Mismatches}
+
+def CheckCheckpointRoundTrip(Name, WarrenType, Configs, Periods, RandomBuffering = RandomBufferModes.Off):
+  """
+  Checkpoints a seeded run half way through and restores it, then runs both to the end
+
+  Returns:
+    dict: Whether the restored run carries on exactly as the one that was never saved, for every config. For an engine that can't be checkpointed, whether GetCheckpoint refuses it with a TypeError instead
+  """
+  Mismatches = []
+  Refused = False
+  for Axis, Config in Configs:
+    Output = io.StringIO()
+    Sim = Simulation(Config["LandscapeSize"], Config["InitialWarrenCount"], Config["InitialFoxCount"], Config["Variability"], False, Interactive = False, Seed = SEED, WarrenType = WarrenType, Renderer = LandscapeRenderer(Config["LandscapeSize"], Output = Output), RandomBuffering = RandomBuffering)
+    Sim.Run(Periods // 2)
+    try:
+      Checkpoint = Sim.GetCheckpoint()
+    except TypeError:
+      Refused = True
+      continue
+    Records = list(Sim.StreamMetrics(Periods - Periods // 2))
+    Sim.Draw()
+    RestoredOutput = io.StringIO()
+    Restored = Simulation.FromCheckpoint(Checkpoint, Renderer = LandscapeRenderer(Config["LandscapeSize"], Output = RestoredOutput))
+    RestoredRecords = list(Restored.StreamMetrics(Periods - Periods // 2))
+    Restored.Draw()
+    if RestoredRecords != Records or RestoredOutput.getvalue() != Output.getvalue():
+      FirstDifference = next((Record["TimePeriod"] for Record, RestoredRecord in zip(Records, RestoredRecords) if Record != RestoredRecord), None)
+      Mismatches.append({"Config": Config, "FirstDifferentPeriod": FirstDifference})
+  return {"Engine": Name, "Check": "CheckpointRoundTrip", "Passed": not Mismatches, "Refused": Refused, "Mismatches": Mismatches}
+
+def FindAnimalMismatches(Sim, RabbitsPerWarren = 5):
+  """
+  Returns:
+    int: Living foxes, and up to RabbitsPerWarren rabbits from each warren, that FindAnimal doesn't find where the Query methods say they are
+  """
+  Mismatches = 0
+  for Record in Sim.QueryFoxes():
+    Mismatches += Sim.FindAnimal(Record["ID"]) != dict({"Type": "Fox"}, **Record)
+  for WarrenRecord in Sim.QueryWarrens():
+    x, y = WarrenRecord["x"], WarrenRecord["y"]
+    for Record in Sim.QueryRabbits(x, y, 0, RabbitsPerWarren):
+      Mismatches += Sim.FindAnimal(Record["ID"]) != dict({"Type": "Rabbit", "x": x, "y": y}, **Record)
+  return Mismatches
+
+def CheckInterleavedBranches(Periods, Seeds, Branches = 3):
+  """
+  Forks branches from a checkpoint of a seeded run one period apart, stepping the run and every branch so far in turn, as a server hosting them all would
+
+  Returns:
+    dict: Whether every simulation kept stepping and FindAnimal found every animal checked, whatever the others did
+  """
+  Config = {"LandscapeSize": 30, "InitialWarrenCount": 30, "InitialFoxCount": 25, "Variability": 10}
+  Mismatches = []
+  for Seed in range (0, Seeds):
+    Sims = [Simulation(Config["LandscapeSize"], Config["InitialWarrenCount"], Config["InitialFoxCount"], Config["Variability"], False, Interactive = False, Seed = Seed)]
+    Sims[0].Run(WARM_UP_PERIODS)
+    Checkpoint = Sims[0].GetCheckpoint()
+    for Period in range (0, Periods):
+      if Period < Branches:
+        Sims.append(Simulation.FromCheckpoint(Checkpoint, Seed = Seed * Branches + Period))
+      try:
+        for Sim in Sims:
+          Sim.Step()
+          Missed = FindAnimalMismatches(Sim)
+          if Missed > 0:
+            Mismatches.append({"Seed": Seed, "Period": Period, "Missed": Missed})
+      except KeyError as Error:
+        Mismatches.append({"Seed": Seed, "Period": Period, "Error": repr(Error)})
+        break
+  return {"Engine": "Warren", "Check": "InterleavedBranches", "Passed": not Mismatches, "Config": Config, "Mismatches": Mismatches}
+
+def CheckFastForwardJump(Seeds, Periods = 200):
+  """
+  Fast forwards seeded runs with Jump set, from the original game's fixed starting layout, where several seeds only look like they are cycling for a while
+
+  Returns:
+    dict: Whether each run ends in exactly the same state, checkpoint for checkpoint, as one made with Run(Periods)
+  """
+  Mismatches = []
+  for Seed in Seeds:
+    FastForwarded = Simulation(15, 5, 5, 0, True, Interactive = False, Seed = Seed)
+    State, ClassifiedAt = FastForwarded.FastForward(Periods, Jump = True)
+    Reference = Simulation(15, 5, 5, 0, True, Interactive = False, Seed = Seed)
+    Reference.Run(Periods)
+    if FastForwarded.GetCheckpoint() != Reference.GetCheckpoint():
+      Mismatches.append({"Seed": Seed, "State": None if State is None else State.name, "TimePeriod": FastForwarded.GetTimePeriod(), "ReferenceTimePeriod": Reference.GetTimePeriod()})
+  return {"Engine": "Warren", "Check": "FastForwardJump", "Passed": not Mismatches, "Mismatches": Mismatches}
+
+def SamplePopulations(MakeSimulation, Config, Periods, Seeds):
+  """
+  Returns:
+    list: Rabbit, warren and fox counts after Periods for each of Seeds seeded runs
+  """
+  Samples = []
+  for Seed in range (0, Seeds):
+    Sim = MakeSimulation(Config, Seed)
+    Sim.Run(Periods)
+    Samples.append((Sim.GetRabbitCount(), Sim.GetWarrenCount(), Sim.GetFoxCount()))
+  return Samples
+
+def MakeReferenceSimulation(Config, Seed):
+  return Simulation(Config["LandscapeSize"], Config["InitialWarrenCount"], Config["InitialFoxCount"], Config["Variability"], False, Interactive = False, Seed = Seed, WarrenType = functools.partial(Warren, CompactionStrategy = CompactionStrategies.Shift))
+
+def CheckStatistical(Name, MakeSimulation, Config, Periods, Seeds, StandardErrors = 4):
+  """
+  Returns:
+    dict: Whether the engine's mean rabbit, warren and fox counts are each within StandardErrors standard errors of the reference's
+  """
+  Reference = SamplePopulations(MakeReferenceSimulation, Config, Periods, Seeds)
+  Samples = SamplePopulations(MakeSimulation, Config, Periods, Seeds)
+  ReferenceMeans = []
+  Means = []
+  Passed = True
+  for ReferenceValues, Values in zip(zip(*Reference), zip(*Samples)):
+    StandardError = ((statistics.variance(ReferenceValues) + statistics.variance(Values)) / Seeds) ** 0.5
+    ReferenceMeans.append(statistics.mean(ReferenceValues))
+    Means.append(statistics.mean(Values))
+    Passed = Passed and abs(Means[-1] - ReferenceMeans[-1]) <= StandardErrors * StandardError
+  return {"Engine": Name, "Check": "Statistical", "Passed": Passed, "Config": Config, "Periods": Periods, "Seeds": Seeds, "ReferenceMeans": ReferenceMeans, "Means": Means}
+
+def RunEquivalenceChecks(Configs, Quick):
+  """
+  Returns:
+    list: One result per engine
+  """
+  Periods = 20 if Quick else 40
+  Config = {"LandscapeSize": 20, "InitialWarrenCount": 10, "InitialFoxCount": 8, "Variability": 10}
+  Seeds = 30 if Quick else 100
+  def MakeWithWarrenType(WarrenType):
+    return lambda Config, Seed: Simulation(Config["LandscapeSize"], Config["InitialWarrenCount"], Config["InitialFoxCount"], Config["Variability"], False, Interactive = False, Seed = Seed, WarrenType = WarrenType)
+  Results = [
+    CheckIdentical("Warren.InPlace", functools.partial(Warren, CompactionStrategy = CompactionStrategies.InPlace), Configs, Periods),
+    CheckIdentical("RandomBuffering.Strict", functools.partial(Warren, CompactionStrategy = CompactionStrategies.InPlace), Configs, Periods, RandomBufferModes.Strict),
+    CheckStatistical("Warren.SwapWithLast", MakeWithWarrenType(functools.partial(Warren, CompactionStrategy = CompactionStrategies.SwapWithLast)), Config, 10, Seeds)
+  ]
+  for Strategy in CompactionStrategies:
+    Results.append(CheckCheckpointRoundTrip("Warren." + Strategy.name, functools.partial(Warren, CompactionStrategy = Strategy), Configs, Periods))
+  Results.append(CheckCheckpointRoundTrip("Warren.SwapWithLast.Capacity50", functools.partial(Warren, CompactionStrategy = CompactionStrategies.SwapWithLast, MaxRabbits = 50), Configs, Periods))
+  Results.append(CheckCheckpointRoundTrip("RandomBuffering.Strict", Warren, Configs, Periods, RandomBufferModes.Strict))
+  Results.append(CheckInterleavedBranches(Periods, 3 if Quick else 10))
+  Results.append(CheckFastForwardJump([30, 115] if Quick else [30, 115] + list(range (0, 10))))
+  if not numpy is None:
+    Results.append(CheckCheckpointRoundTrip("ArrayWarren", ArrayWarren, Configs, Periods))
+    Results.append(CheckCheckpointRoundTrip("CohortWarren", CohortWarren, Configs, Periods))
+    from vectorised_simulation import VectorisedSimulation
+    Results.append(CheckStatistical("ArrayWarren", MakeWithWarrenType(ArrayWarren), Config, 10, Seeds))
+    Results.append(CheckStatistical("CohortWarren", MakeWithWarrenType(CohortWarren), Config, 10, Seeds))
+    Results.append(CheckStatistical("RandomBuffering.Fast", lambda Config, Seed: Simulation(Config["LandscapeSize"], Config["InitialWarrenCount"], Config["InitialFoxCount"], Config["Variability"], False, Interactive = False, Seed = Seed, RandomBuffering = RandomBufferModes.Fast), Config, 10, Seeds))
+    Results.append(CheckStatistical("VectorisedSimulation", lambda Config, Seed: VectorisedSimulation(Config["LandscapeSize"], Config["InitialWarrenCount"], Config["InitialFoxCount"], Config["Variability"], False, Seed = Seed), Config, 10, Seeds))
+  return Results
+
+def Main():
+  """
+  Command line front end: runs the benchmarks and equivalence checks and writes them as JSON
+  """
+  Parser = argparse.ArgumentParser(description = "Benchmark the Rabbits & Foxes hot paths")
+  Parser.add_argument("--output", default = "-", help = "JSON file to write (defaults to stdout)")
+  Parser.add_argument("--repeats", type = int, default = 5)
+  Parser.add_argument("--quick", action = "store_true", help = "Two values per axis and shorter equivalence checks")
+  Parser.add_argument("--only", nargs = "+", choices = sorted(BENCHMARKS), help = "Benchmarks to run (defaults to all)")
+  Parser.add_argument("--skip-equivalence", action = "store_true")
+  Arguments = Parser.parse_args()
+  Configs = MakeConfigs(Arguments.quick)
+  Results = []
+  for Name in Arguments.only or BENCHMARKS:
+    for Axis, Config in Configs:
+      if Name in WARREN_BENCHMARKS and Axis != "Variability":
+        continue
+      Result = {"Benchmark": Name, "Axis": Axis, "Config": Config}
+      if not Name in WARREN_BENCHMARKS:
+        Checkpoint, Result["WarmUp"] = MakeWarmedUpCheckpoint(Config)
+        if Checkpoint is None:
+          Result["Skipped"] = "Warrens, foxes or rabbits died out during warm-up with every seed tried"
+          Results.append(Result)
+          print(Name, Axis, Config[Axis], "skipped, died out during warm-up", file = sys.stderr)
+          continue
+      Result.update(BENCHMARKS[Name](Config, Arguments.repeats))
+      Results.append(Result)
+      print(Name, Axis, Config[Axis], round(Result["MedianSeconds"] * 1000, 3), "ms", file = sys.stderr)
+  Report = {"Python": platform.python_version(), "Platform": platform.platform(), "NumPy": None if numpy is None else numpy.__version__, "Seed": SEED, "Results": Results}
+  if not Arguments.skip_equivalence:
+    Report["Equivalence"] = RunEquivalenceChecks(Configs, Arguments.quick)
+    for Check in Report["Equivalence"]:
+      print(Check["Engine"], Check["Check"], "passed" if Check["Passed"] else "FAILED", file = sys.stderr)
+  if Arguments.output == "-":
+    json.dump(Report, sys.stdout, indent = 1)
+  else:
+    with open(Arguments.output, "w") as OutputFile:
+      json.dump(Report, OutputFile, indent = 1)
+
+if __name__ == "__main__":
+  Main()
@@ -0,0 +1,357 @@
+""" Memory-mapped run history for Rabbits & Foxes
+
+Records a compact copy of the landscape after every time period into a file of records, and reads any period back through mmap without copying, so a long run can be scrubbed back and forth without keeping every frame in memory or re-simulating it.
+
+File layout: a header of HISTORY_MAGIC, the format version, LandscapeSize and the record size (0, as records vary in size), then one record per period. Each record is the time period and the warren and fox counts, then one column per field in COLUMNS, with one entry per warren or per fox in landscape scan order, padded to a multiple of 8 bytes:
+  WarrenX, WarrenY (uint32): Cell of each warren, including one with no rabbits left, which Simulation draws as 0 until it is removed
+  RabbitCounts (uint32): Rabbits in each warren
+  FoxX, FoxY (uint32): Cell of each fox
+  FoxAges, FoxLifespans, FoxFoodNeeded (uint16): Each fox's age, natural lifespan and food units needed
+So a record grows with the number of animals rather than with LandscapeSize squared, like a SparseLandscape.
+
+Version 1 and 2 files, which stored a LandscapeSize * LandscapeSize grid per field in fixed-size records, can still be read and added to, and their frames are turned into the same columns. Version 1 files, from before WarrenPresent was recorded, have no record of warrens with no rabbits in them, so those are drawn as an empty cell.
+
+Example:
+  with HistoryStore("run.rfh", 15) as History:
+    Sim = Simulation(15, 5, 5, 0, True, Interactive = False, History = History)
+    Sim.Run(1000)
+    Frame = History.GetFrame(500)
+    list(zip(Frame["WarrenX"], Frame["WarrenY"], Frame["RabbitCounts"]))
+
+  python history.py run.rfh --landscape-size 15 --warrens 5 --foxes 5
+  python history.py run.rfh --show 500
+"""
+
+import argparse
+import array
+import bisect
+import mmap
+import os
+import struct
+import sys
+
+from skeleton_with_documentation import Simulation, LandscapeRenderer
+
+HISTORY_MAGIC = b"RFHS"
+HISTORY_VERSION = 3
+HEADER_FORMAT = "<4sHIQ"
+RECORD_HEADER_FORMAT = "<qII"
+COLUMNS = (("WarrenX", "I", "Warrens"), ("WarrenY", "I", "Warrens"), ("RabbitCounts", "I", "Warrens"), ("FoxX", "I", "Foxes"), ("FoxY", "I", "Foxes"), ("FoxAges", "H", "Foxes"), ("FoxLifespans", "H", "Foxes"), ("FoxFoodNeeded", "H", "Foxes"))
+GRIDS = (("RabbitCounts", "I"), ("FoxAges", "H"), ("FoxLifespans", "H"), ("FoxFoodNeeded", "H"), ("FoxPresent", "B"), ("WarrenPresent", "B"))
+VERSION_1_GRIDS = GRIDS[:5]
+
+class HistoryStore:
+  """
+  HistoryStore appends one record per time period to a file and reads records back as zero-copy views of a memory map
+
+  Note:
+    Records are written with ordinary appends and the map is only remade when a period past its end is asked for, so recording never waits on the map.
+    Columns are ordered widest first after a 16 byte record header, and records are padded to 8 bytes, so every column starts on a boundary of its own item size.
+    Opening a file reads each record's header to find where the records start, and cuts off a last record that was only partly written
+
+  Args:
+      FileName (str): History file
+      LandscapeSize (int, optional): Start a new, empty history for this size of landscape. Leave out to open an existing history
+
+  Attributes:
+      __File (file)
+      __LandscapeSize (int)
+      __Version (int): Format version of the file, HISTORY_VERSION unless an older file was opened
+      __RecordSize (int): Bytes in one period's record for a version 1 or 2 file, 0 for a version 3 file, where it depends on the warren and fox counts
+      __GridOffsets (list): (Name, Typecode, Offset) of each grid inside a version 1 or 2 record
+      __Periods (list): Time period of each record, in the order they were written
+      __Offsets (list): Where each record starts in the file
+      __End (int): Where the last complete record ends, and the next one will be written
+      __Map (mmap.mmap): Read-only map of the file, or None until a record is read
+      __MappedRecords (int): Records covered by __Map
+  """
+  def __init__(self, FileName, LandscapeSize = None):
+    HeaderSize = struct.calcsize(HEADER_FORMAT)
+    if LandscapeSize is None:
+      self.__File = open(FileName, "r+b")
+      Magic, Version, LandscapeSize, RecordSize = struct.unpack(HEADER_FORMAT, self.__File.read(HeaderSize))
+      if Magic != HISTORY_MAGIC or not 1 <= Version <= HISTORY_VERSION:
+        raise ValueError(FileName + " is not a version 1 to " + str(HISTORY_VERSION) + " history file")
+    else:
+      self.__File = open(FileName, "w+b")
+      Version = HISTORY_VERSION
+    self.__LandscapeSize = LandscapeSize
+    self.__Version = Version
+    self.__GridOffsets = []
+    self.__RecordSize = 0
+    if Version <= 2:
+      Offset = struct.calcsize(RECORD_HEADER_FORMAT)
+      for Name, Typecode in (GRIDS if Version == 2 else VERSION_1_GRIDS):
+        self.__GridOffsets.append((Name, Typecode, Offset))
+        Offset += LandscapeSize * LandscapeSize * struct.calcsize(Typecode)
+      self.__RecordSize = Offset + (-Offset) % 8
+    self.__Map = None
+    self.__MappedRecords = 0
+    self.__Periods = []
+    self.__Offsets = []
+    self.__End = HeaderSize
+    if self.__File.tell() == 0:
+      self.__File.write(struct.pack(HEADER_FORMAT, HISTORY_MAGIC, Version, LandscapeSize, self.__RecordSize))
+      self.__File.flush()
+    else:
+      if RecordSize != self.__RecordSize:
+        raise ValueError(FileName + " has records of the wrong size")
+      self.__ReadRecordHeaders(os.fstat(self.__File.fileno()).st_size)
+      self.__File.seek(self.__End)
+      self.__File.truncate()
+
+  def Record(self, Sim):
+    """
+    Appends the simulation's current landscape as a new record, called by Simulation after every time period
+
+    Args:
+      Sim (Simulation): Simulation to record. Its time period must be later than the last one recorded
+    """
+    TimePeriod = Sim.GetTimePeriod()
+    if len(self.__Periods) > 0 and TimePeriod <= self.__Periods[-1]:
+      raise ValueError("Period " + str(TimePeriod) + " is not after the last recorded period")
+    if self.__Version <= 2:
+      Record = self.__MakeGridRecord(Sim, TimePeriod)
+    else:
+      Record = self.__MakeRecord(Sim, TimePeriod)
+    self.__File.seek(self.__End)
+    self.__File.write(Record)
+    self.__File.flush()
+    self.__Periods.append(TimePeriod)
+    self.__Offsets.append(self.__End)
+    self.__End += len(Record)
+
+  def HasPeriod(self, TimePeriod):
+    """
+    Returns:
+      bool: True if TimePeriod has been recorded
+    """
+    return self.__FindRecord(TimePeriod) >= 0
+
+  def GetPeriods(self):
+    """
+    Returns:
+      list: Copy of every recorded time period, in order
+    """
+    return list(self.__Periods)
+
+  def GetLandscapeSize(self):
+    """Getter for self.__LandscapeSize"""
+    return self.__LandscapeSize
+
+  def GetFrame(self, TimePeriod):
+    """
+    Reads one recorded period straight out of the memory map
+
+    Note:
+      The columns are memoryviews of the map rather than copies, so they stay valid while the store is open and cost nothing to take. numpy.asarray() turns one into an array without copying.
+      A version 1 or 2 file's grids are turned into lists with the same columns, so reading one of its frames does copy
+
+    Args:
+      TimePeriod (int): Recorded time period
+
+    Returns:
+      dict: TimePeriod, Warrens and Foxes, then each column in COLUMNS, with one entry per warren or per fox in landscape scan order
+    """
+    Record = self.__FindRecord(TimePeriod)
+    if Record < 0:
+      raise KeyError("Period " + str(TimePeriod) + " has not been recorded")
+    if Record >= self.__MappedRecords:
+      self.__File.flush()
+      self.__Map = mmap.mmap(self.__File.fileno(), 0, access = mmap.ACCESS_READ)
+      self.__MappedRecords = len(self.__Periods)
+    Start = self.__Offsets[Record]
+    End = self.__Offsets[Record + 1] if Record + 1 < len(self.__Offsets) else self.__End
+    View = memoryview(self.__Map)[Start:End]
+    Frame = dict(zip(("TimePeriod", "Warrens", "Foxes"), struct.unpack_from(RECORD_HEADER_FORMAT, View)))
+    if self.__Version <= 2:
+      Frame.update(self.__GridsToColumns(self.__GetGrids(View)))
+    else:
+      Frame.update(self.__GetColumns(View, Frame["Warrens"], Frame["Foxes"]))
+    return Frame
+
+  def Draw(self, TimePeriod, Renderer = None):
+    """
+    Draws a recorded period the same way Simulation draws the live landscape
+
+    Args:
+      TimePeriod (int): Recorded time period
+      Renderer (LandscapeRenderer, optional): Defaults to a Full renderer of the whole landscape
+    """
+    Frame = self.GetFrame(TimePeriod)
+    if Renderer is None:
+      Renderer = LandscapeRenderer(self.__LandscapeSize)
+    RabbitCounts = dict(zip(zip(Frame["WarrenX"], Frame["WarrenY"]), Frame["RabbitCounts"]))
+    FoxCells = set(zip(Frame["FoxX"], Frame["FoxY"]))
+    def GetCellText(x, y):
+      RabbitCount = RabbitCounts.get((x, y))
+      if RabbitCount is None:
+        CellText = "  "
+      else:
+        CellText = str(RabbitCount).rjust(2)
+      if (x, y) in FoxCells:
+        return CellText + "F"
+      return CellText + " "
+    Renderer.Draw(TimePeriod, GetCellText)
+
+  def Close(self):
+    """
+    Closes the file. Views from GetFrame() keep the map itself alive until they are released
+    """
+    self.__Map = None
+    self.__MappedRecords = 0
+    self.__File.close()
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, ExceptionType, ExceptionValue, Traceback):
+    self.Close()
+
+  def __ReadRecordHeaders(self, FileSize):
+    """
+    Finds every complete record in a file being opened, filling in __Periods and __Offsets and leaving __End after the last one
+
+    Args:
+      FileSize (int): Bytes in the file
+    """
+    RecordHeaderSize = struct.calcsize(RECORD_HEADER_FORMAT)
+    while self.__End + RecordHeaderSize <= FileSize:
+      self.__File.seek(self.__End)
+      TimePeriod, WarrenCount, FoxCount = struct.unpack(RECORD_HEADER_FORMAT, self.__File.read(RecordHeaderSize))
+      RecordSize = self.__RecordSize or self.__GetRecordSize(WarrenCount, FoxCount)
+      if self.__End + RecordSize > FileSize:
+        break
+      self.__Periods.append(TimePeriod)
+      self.__Offsets.append(self.__End)
+      self.__End += RecordSize
+
+  def __GetRecordSize(self, WarrenCount, FoxCount):
+    """
+    Returns:
+      int: Bytes in a version 3 record of WarrenCount warrens and FoxCount foxes, padding included
+    """
+    Counts = {"Warrens": WarrenCount, "Foxes": FoxCount}
+    Size = struct.calcsize(RECORD_HEADER_FORMAT) + sum(Counts[CountName] * struct.calcsize(Typecode) for Name, Typecode, CountName in COLUMNS)
+    return Size + (-Size) % 8
+
+  def __MakeRecord(self, Sim, TimePeriod):
+    """
+    Returns:
+      bytearray: A version 3 record of the simulation's warrens and foxes
+    """
+    Warrens = Sim.GetWarrenRabbitCounts()
+    Foxes = list(Sim.QueryFoxes())
+    Values = {"WarrenX": [x for x, y, RabbitCount in Warrens], "WarrenY": [y for x, y, RabbitCount in Warrens], "RabbitCounts": [RabbitCount for x, y, RabbitCount in Warrens]}
+    for Name, Field in (("FoxX", "x"), ("FoxY", "y"), ("FoxAges", "Age"), ("FoxLifespans", "NaturalLifespan"), ("FoxFoodNeeded", "FoodUnitsNeeded")):
+      Values[Name] = [Fox[Field] for Fox in Foxes]
+    Record = bytearray(struct.pack(RECORD_HEADER_FORMAT, TimePeriod, len(Warrens), len(Foxes)))
+    for Name, Typecode, CountName in COLUMNS:
+      Record += array.array(Typecode, Values[Name]).tobytes()
+    Record += bytes((-len(Record)) % 8)
+    return Record
+
+  def __MakeGridRecord(self, Sim, TimePeriod):
+    """
+    Returns:
+      bytearray: A fixed-size record of the simulation's warrens and foxes, for adding to a version 1 or 2 file
+    """
+    Size = self.__LandscapeSize
+    Record = bytearray(self.__RecordSize)
+    struct.pack_into(RECORD_HEADER_FORMAT, Record, 0, TimePeriod, Sim.GetWarrenCount(), Sim.GetFoxCount())
+    Grids = self.__GetGrids(memoryview(Record))
+    RabbitCounts = Grids["RabbitCounts"]
+    WarrenPresent = Grids.get("WarrenPresent")
+    for x, y, RabbitCount in Sim.GetWarrenRabbitCounts():
+      RabbitCounts[x * Size + y] = RabbitCount
+      if not WarrenPresent is None:
+        WarrenPresent[x * Size + y] = 1
+    for Fox in Sim.QueryFoxes():
+      Cell = Fox["x"] * Size + Fox["y"]
+      Grids["FoxPresent"][Cell] = 1
+      Grids["FoxAges"][Cell] = Fox["Age"]
+      Grids["FoxLifespans"][Cell] = Fox["NaturalLifespan"]
+      Grids["FoxFoodNeeded"][Cell] = Fox["FoodUnitsNeeded"]
+    return Record
+
+  def __FindRecord(self, TimePeriod):
+    """
+    Returns:
+      int: Index of the record for TimePeriod, or -1. Periods are normally consecutive, so this is one lookup, with a binary search for runs that skipped periods
+    """
+    if len(self.__Periods) == 0:
+      return -1
+    Record = TimePeriod - self.__Periods[0]
+    if 0 <= Record < len(self.__Periods) and self.__Periods[Record] == TimePeriod:
+      return Record
+    Record = bisect.bisect_left(self.__Periods, TimePeriod)
+    if Record < len(self.__Periods) and self.__Periods[Record] == TimePeriod:
+      return Record
+    return -1
+
+  def __GetColumns(self, View, WarrenCount, FoxCount):
+    """
+    Returns:
+      dict: A typed memoryview of each column within the version 3 record View
+    """
+    Counts = {"Warrens": WarrenCount, "Foxes": FoxCount}
+    Columns = {}
+    Offset = struct.calcsize(RECORD_HEADER_FORMAT)
+    for Name, Typecode, CountName in COLUMNS:
+      Length = Counts[CountName] * struct.calcsize(Typecode)
+      Columns[Name] = View[Offset:Offset + Length].cast(Typecode)
+      Offset += Length
+    return Columns
+
+  def __GetGrids(self, View):
+    """
+    Returns:
+      dict: A typed memoryview of each grid within the version 1 or 2 record View
+    """
+    Cells = self.__LandscapeSize * self.__LandscapeSize
+    Grids = {}
+    for Name, Typecode, Offset in self.__GridOffsets:
+      Grids[Name] = View[Offset:Offset + Cells * struct.calcsize(Typecode)].cast(Typecode)
+    return Grids
+
+  def __GridsToColumns(self, Grids):
+    """
+    Returns:
+      dict: The columns in COLUMNS, as lists, for the warrens and foxes in a version 1 or 2 record's grids. A version 1 record has no WarrenPresent grid, so only warrens with rabbits are found
+    """
+    Size = self.__LandscapeSize
+    WarrenPresent = Grids.get("WarrenPresent", Grids["RabbitCounts"])
+    WarrenCells = [Cell for Cell in range (0, Size * Size) if WarrenPresent[Cell]]
+    FoxCells = [Cell for Cell in range (0, Size * Size) if Grids["FoxPresent"][Cell]]
+    Columns = {"WarrenX": [Cell // Size for Cell in WarrenCells], "WarrenY": [Cell % Size for Cell in WarrenCells], "RabbitCounts": [Grids["RabbitCounts"][Cell] for Cell in WarrenCells]}
+    Columns["FoxX"] = [Cell // Size for Cell in FoxCells]
+    Columns["FoxY"] = [Cell % Size for Cell in FoxCells]
+    for Name in ("FoxAges", "FoxLifespans", "FoxFoodNeeded"):
+      Columns[Name] = [Grids[Name][Cell] for Cell in FoxCells]
+    return Columns
+
+def Main():
+  """
+  Command line front end: runs an interactive simulation recording to a history file, or draws one period from an existing file
+  """
+  Parser = argparse.ArgumentParser(description = "Record or replay a Rabbits & Foxes history file")
+  Parser.add_argument("file")
+  Parser.add_argument("--show", type = int, default = None, help = "draw this period from an existing file and exit")
+  Parser.add_argument("--landscape-size", type = int, default = 15)
+  Parser.add_argument("--warrens", type = int, default = 5)
+  Parser.add_argument("--foxes", type = int, default = 5)
+  Parser.add_argument("--variability", type = int, default = 0)
+  Parser.add_argument("--random-locations", action = "store_true")
+  Parser.add_argument("--seed", type = int, default = None)
+  Arguments = Parser.parse_args()
+  if not Arguments.show is None:
+    with HistoryStore(Arguments.file) as History:
+      if not History.HasPeriod(Arguments.show):
+        sys.exit("Period " + str(Arguments.show) + " has not been recorded")
+      History.Draw(Arguments.show)
+    return
+  with HistoryStore(Arguments.file, Arguments.landscape_size) as History:
+    Simulation(Arguments.landscape_size, Arguments.warrens, Arguments.foxes, Arguments.variability, not Arguments.random_locations, Seed = Arguments.seed, History = History)
+
+if __name__ == "__main__":
+  Main()
@@ -0,0 +1,202 @@
+""" Per-period metrics sinks for Rabbits & Foxes
+
+Writes the records from Simulation.StreamMetrics() (or GetPeriodMetrics()) to disk in fixed-size batches, so memory stays constant however many periods are run and nothing is printed per event.
+
+Deaths are split by cause, for foxes (FoxesStarved, FoxesKilledByOtherFactors, FoxesDiedOfOldAge) as for rabbits. Files written before that have a single FoxesDied column instead, and ReadBinaryMetrics gives them back as they were written.
+
+Example:
+  Sim = Simulation(50, 20, 10, 10, False, Interactive = False, Seed = 1)
+  with BinaryMetricsSink("run.rfm") as Sink:
+    WriteMetrics(Sim, Sink, 100000)
+  for Record in ReadBinaryMetrics("run.rfm"):
+    ...
+"""
+
+import array
+import csv
+import struct
+import sys
+
+from skeleton_with_documentation import Simulation
+
+BINARY_MAGIC = b"RFMT"
+
+def CheckFields(Fields):
+  """
+  Raises:
+    ValueError: If any of Fields isn't in Simulation.METRIC_FIELDS, e.g. the FoxesDied column from before fox deaths were split by cause
+  """
+  Unknown = [Field for Field in Fields if not Field in Simulation.METRIC_FIELDS]
+  if Unknown:
+    raise ValueError("Unknown metric fields " + ", ".join(Unknown))
+
+class CsvMetricsSink:
+  """
+  CsvMetricsSink appends metrics records to a CSV file, one row per period, with a header row first
+
+  Args:
+      FileName (str): File to write
+      BatchSize (int, optional): Records held before they are written out (defaults to 1000)
+      Fields (tuple, optional): Columns to write (defaults to Simulation.METRIC_FIELDS)
+
+  Attributes:
+      __File (file)
+      __Writer (csv.writer)
+      __Fields (tuple)
+      __BatchSize (int)
+      __Batch (list): Rows not yet written
+  """
+  def __init__(self, FileName, BatchSize = 1000, Fields = Simulation.METRIC_FIELDS):
+    CheckFields(Fields)
+    self.__File = open(FileName, "w", newline = "")
+    self.__Writer = csv.writer(self.__File)
+    self.__Fields = Fields
+    self.__BatchSize = BatchSize
+    self.__Batch = []
+    self.__Writer.writerow(Fields)
+
+  def Write(self, Record):
+    """
+    Args:
+      Record (dict): A value for each field
+    """
+    self.__Batch.append([Record[Field] for Field in self.__Fields])
+    if len(self.__Batch) >= self.__BatchSize:
+      self.Flush()
+
+  def Flush(self):
+    """
+    Writes out any records held in the current batch
+    """
+    self.__Writer.writerows(self.__Batch)
+    self.__Batch = []
+    self.__File.flush()
+
+  def Close(self):
+    """
+    Flushes and closes the file
+    """
+    self.Flush()
+    self.__File.close()
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, ExceptionType, ExceptionValue, Traceback):
+    self.Close()
+
+class BinaryMetricsSink:
+  """
+  BinaryMetricsSink appends metrics records to a compact columnar file
+
+  Note:
+    The file starts with BINARY_MAGIC, the number of fields and their names (one per line). Each batch follows as a little-endian record count, then one array of 64-bit ints per field. Read it back with ReadBinaryMetrics
+
+  Args:
+      FileName (str): File to write
+      BatchSize (int, optional): Records held before a batch is written out (defaults to 4096)
+      Fields (tuple, optional): Columns to write (defaults to Simulation.METRIC_FIELDS)
+
+  Attributes:
+      __File (file)
+      __Fields (tuple)
+      __BatchSize (int)
+      __Columns (list): One array.array per field for the current batch
+  """
+  def __init__(self, FileName, BatchSize = 4096, Fields = Simulation.METRIC_FIELDS):
+    CheckFields(Fields)
+    self.__File = open(FileName, "wb")
+    self.__Fields = Fields
+    self.__BatchSize = BatchSize
+    self.__Columns = [array.array("q") for Field in Fields]
+    Names = "\n".join(Fields).encode()
+    self.__File.write(BINARY_MAGIC + struct.pack("<II", len(Fields), len(Names)) + Names)
+
+  def Write(self, Record):
+    """
+    Args:
+      Record (dict): An int value for each field
+    """
+    for Column, Field in zip(self.__Columns, self.__Fields):
+      Column.append(Record[Field])
+    if len(self.__Columns[0]) >= self.__BatchSize:
+      self.Flush()
+
+  def Flush(self):
+    """
+    Writes out the current batch, if it has any records
+    """
+    if len(self.__Columns[0]) == 0:
+      return
+    Parts = [struct.pack("<I", len(self.__Columns[0]))]
+    for Column in self.__Columns:
+      if sys.byteorder != "little":
+        Column.byteswap()
+      Parts.append(Column.tobytes())
+    self.__File.write(b"".join(Parts))
+    self.__File.flush()
+    self.__Columns = [array.array("q") for Field in self.__Fields]
+
+  def Close(self):
+    """
+    Flushes and closes the file
+    """
+    self.Flush()
+    self.__File.close()
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, ExceptionType, ExceptionValue, Traceback):
+    self.Close()
+
+def ReadBinaryMetrics(FileName):
+  """
+  Reads a file written by BinaryMetricsSink one batch at a time
+
+  Args:
+    FileName (str): File to read
+
+  Yields:
+    dict: One record per period, in the order they were written, with the fields the file was written with
+  """
+  with open(FileName, "rb") as MetricsFile:
+    if MetricsFile.read(len(BINARY_MAGIC)) != BINARY_MAGIC:
+      raise ValueError(FileName + " is not a binary metrics file")
+    FieldCount, NamesLength = struct.unpack("<II", MetricsFile.read(8))
+    Fields = MetricsFile.read(NamesLength).decode().split("\n")
+    if len(Fields) != FieldCount:
+      raise ValueError(FileName + " has a damaged field list")
+    while True:
+      Header = MetricsFile.read(4)
+      if len(Header) < 4:
+        return
+      RecordCount = struct.unpack("<I", Header)[0]
+      Columns = []
+      for Field in Fields:
+        Column = array.array("q")
+        Column.frombytes(MetricsFile.read(RecordCount * Column.itemsize))
+        if sys.byteorder != "little":
+          Column.byteswap()
+        Columns.append(Column)
+      for Values in zip(*Columns):
+        yield dict(zip(Fields, Values))
+
+def WriteMetrics(Sim, Sink, MaxPeriods = None):
+  """
+  Runs a simulation headlessly, writing every period's metrics to a sink
+
+  Args:
+    Sim (Simulation): Simulation to advance
+    Sink (CsvMetricsSink or BinaryMetricsSink): Where records go
+    MaxPeriods (int, optional): Stop after this many periods (defaults to running until everything dies out)
+
+  Returns:
+    int: Number of periods written
+  """
+  PeriodsWritten = 0
+  for Record in Sim.StreamMetrics(MaxPeriods):
+    Sink.Write(Record)
+    PeriodsWritten += 1
+  Sink.Flush()
+  return PeriodsWritten
@@ -0,0 +1,269 @@
+""" Simulation host for Rabbits & Foxes
+
+An asyncio server that hosts many headless Simulations in one process and drives them with JSON lines over a Unix socket or localhost TCP, instead of scripting the input() prompts.
+
+Each request is one JSON object on a line, and gets one JSON object back on a line, in order. Every response has "ok", plus either the command's results or an "error" message. Any error carrying out a request, such as a damaged snapshot to restore, is answered this way rather than dropping the connection. A "tag" in a request is copied into its response.
+
+Commands:
+  {"command": "create", "LandscapeSize": 15, "InitialWarrenCount": 5, "InitialFoxCount": 5, "Variability": 0, "FixedInitialLocations": true, "Seed": 1}
+      -> {"ok": true, "simulation": "1", "Seed": 1}. SparseLandscape is also accepted, and every setting but the five counts/flags is optional. Without a Seed one is picked at random and returned, so every hosted simulation has its own generators and can be replayed
+  {"command": "step", "simulation": "1", "periods": 10}
+      -> {"ok": true, "periods": 10, "metrics": {...}} with Simulation.GetPeriodMetrics() of the last period run
+  {"command": "inspect", "simulation": "1", "draw": false}
+      -> {"ok": true, "timeperiod": ..., "warrens": ..., "foxes": ..., "rabbits": ..., "extinct": ...}, plus "landscape" (the drawn frame) if draw is true
+  {"command": "query", "simulation": "1", "kind": "warrens", "offset": 0, "limit": 10}
+      -> {"ok": true, "records": [...]}, one page of Simulation.QueryWarrens. Kind "foxes" pages QueryFoxes, kind "rabbits" also takes "x" and "y" and pages QueryRabbits, and kind "animal" takes an "id" and gives FindAnimal's record (or null) as "record". Offset and limit can't be negative, and a null limit means no limit
+  {"command": "snapshot", "simulation": "1"}
+      -> {"ok": true, "checkpoint": "<base64 of Simulation.GetCheckpoint()>"}
+  {"command": "restore", "checkpoint": "...", "Seed": null}
+      -> {"ok": true, "simulation": "2"}, a new simulation from a snapshot, see Simulation.FromCheckpoint. A snapshot of an unseeded simulation (made outside this server) is refused without a Seed, as restoring it as saved would reset the random module
+  {"command": "delete", "simulation": "1"}
+  {"command": "list"}
+      -> {"ok": true, "simulations": ["1", "2"]}
+
+Example:
+  python server.py --unix /tmp/rabbits.sock
+  python server.py --host 127.0.0.1 --port 8765
+"""
+
+import argparse
+import asyncio
+import base64
+import concurrent.futures
+import io
+import json
+import random
+
+from skeleton_with_documentation import Simulation, LandscapeRenderer
+
+MAX_REQUEST_BYTES = 1 << 28
+
+class SimulationHost:
+  """
+  SimulationHost keeps every hosted Simulation and carries out commands on them
+
+  Note:
+    Request lines can be up to MAX_REQUEST_BYTES long, as a restore carries a whole snapshot. A longer line gets an error response and the connection is closed, since the rest of it can't be told apart from the next request.
+    Stepping, drawing and snapshotting run in a thread pool, so the event loop stays free to read and answer other clients meanwhile. Each simulation has its own lock, so two requests never work on the same simulation at once, while requests for different simulations overlap.
+    Every hosted simulation draws from its own seeded generators and hands out its own animal IDs, and nothing left running touches the random module, so simulations stepped or restored at the same time on different threads can't change each other's results
+
+  Args:
+      Workers (int, optional): Threads in the executor (defaults to the ThreadPoolExecutor default)
+
+  Attributes:
+      __Simulations (dict): Hosted Simulation keyed by its ID
+      __Locks (dict): asyncio.Lock for each hosted simulation
+      __NextID (int): ID for the next simulation
+      __Executor (concurrent.futures.ThreadPoolExecutor)
+      __Commands (dict): Coroutine for each command name
+  """
+  def __init__(self, Workers = None):
+    self.__Simulations = {}
+    self.__Locks = {}
+    self.__NextID = 1
+    self.__Executor = concurrent.futures.ThreadPoolExecutor(Workers)
+    self.__Commands = {"create": self.__Create, "step": self.__Step, "inspect": self.__Inspect, "query": self.__Query, "snapshot": self.__Snapshot, "restore": self.__Restore, "delete": self.__Delete, "list": self.__List}
+
+  def Close(self):
+    """
+    Waits for running steps to finish and shuts down the executor
+    """
+    self.__Executor.shutdown()
+
+  async def Handle(self, Request):
+    """
+    Carries out one request
+
+    Note:
+      This is the request boundary, so any exception the command raises becomes an error response, and the client stays connected
+
+    Args:
+      Request (dict): A decoded request line
+
+    Returns:
+      dict: The response
+    """
+    try:
+      Command = self.__Commands.get(Request.get("command"))
+      if Command is None:
+        raise ValueError("Unknown command " + repr(Request.get("command")))
+      Response = await Command(Request)
+      Response["ok"] = True
+    except Exception as Error:
+      Response = {"ok": False, "error": type(Error).__name__ + ": " + str(Error)}
+    if "tag" in Request:
+      Response["tag"] = Request["tag"]
+    return Response
+
+  async def ServeClient(self, Reader, Writer):
+    """
+    Answers one client's request lines in order until it disconnects
+
+    Args:
+      Reader (asyncio.StreamReader)
+      Writer (asyncio.StreamWriter)
+    """
+    try:
+      while True:
+        try:
+          Line = await Reader.readline()
+        except ValueError:
+          Writer.write(json.dumps({"ok": False, "error": "Bad request: longer than " + str(MAX_REQUEST_BYTES) + " bytes"}).encode() + b"\n")
+          await Writer.drain()
+          break
+        if not Line:
+          break
+        try:
+          Request = json.loads(Line)
+          if not isinstance(Request, dict):
+            raise ValueError("a request must be a JSON object")
+        except ValueError as Error:
+          Response = {"ok": False, "error": "Bad request: " + str(Error)}
+        else:
+          Response = await self.Handle(Request)
+        Writer.write(json.dumps(Response).encode() + b"\n")
+        await Writer.drain()
+    except ConnectionError:
+      pass
+    finally:
+      Writer.close()
+
+  async def __RunInExecutor(self, Function, *Args):
+    return await asyncio.get_running_loop().run_in_executor(self.__Executor, Function, *Args)
+
+  def __Add(self, Sim):
+    """
+    Returns:
+      str: The new simulation's ID
+    """
+    SimulationID = str(self.__NextID)
+    self.__NextID += 1
+    self.__Simulations[SimulationID] = Sim
+    self.__Locks[SimulationID] = asyncio.Lock()
+    return SimulationID
+
+  def __Get(self, Request):
+    """
+    Returns:
+      tuple: (ID, Simulation, asyncio.Lock) for the request's "simulation"
+    """
+    SimulationID = str(Request["simulation"])
+    if not SimulationID in self.__Simulations:
+      raise KeyError("no simulation " + SimulationID)
+    return SimulationID, self.__Simulations[SimulationID], self.__Locks[SimulationID]
+
+  async def __Create(self, Request):
+    Settings = (int(Request["LandscapeSize"]), int(Request["InitialWarrenCount"]), int(Request["InitialFoxCount"]), int(Request["Variability"]), bool(Request["FixedInitialLocations"]))
+    Seed = Request.get("Seed")
+    if Seed is None:
+      Seed = random.SystemRandom().getrandbits(63)
+    Sim = await self.__RunInExecutor(lambda: Simulation(*Settings, Interactive = False, SparseLandscape = bool(Request.get("SparseLandscape", False)), Seed = Seed))
+    return {"simulation": self.__Add(Sim), "Seed": Seed}
+
+  async def __Step(self, Request):
+    SimulationID, Sim, Lock = self.__Get(Request)
+    async with Lock:
+      PeriodsRun = await self.__RunInExecutor(Sim.Run, int(Request.get("periods", 1)))
+      return {"periods": PeriodsRun, "metrics": Sim.GetPeriodMetrics()}
+
+  async def __Inspect(self, Request):
+    SimulationID, Sim, Lock = self.__Get(Request)
+    async with Lock:
+      Response = {"timeperiod": Sim.GetTimePeriod(), "warrens": Sim.GetWarrenCount(), "foxes": Sim.GetFoxCount(), "rabbits": Sim.GetRabbitCount(), "extinct": Sim.IsExtinct()}
+      if Request.get("draw"):
+        Response["landscape"] = await self.__RunInExecutor(self.__DrawToString, Sim)
+      return Response
+
+  async def __Query(self, Request):
+    SimulationID, Sim, Lock = self.__Get(Request)
+    Kind = Request.get("kind")
+    Offset = int(Request.get("offset", 0))
+    Limit = Request.get("limit", 100)
+    if not Limit is None:
+      Limit = int(Limit)
+    if Offset < 0 or (not Limit is None and Limit < 0):
+      raise ValueError("offset and limit can't be negative")
+    async with Lock:
+      if Kind == "animal":
+        return {"record": await self.__RunInExecutor(Sim.FindAnimal, int(Request["id"]))}
+      if Kind == "warrens":
+        Records = Sim.QueryWarrens(Offset, Limit)
+      elif Kind == "foxes":
+        Records = Sim.QueryFoxes(Offset, Limit)
+      elif Kind == "rabbits":
+        Records = Sim.QueryRabbits(int(Request["x"]), int(Request["y"]), Offset, Limit)
+      else:
+        raise ValueError("Unknown query kind " + repr(Kind))
+      return {"records": await self.__RunInExecutor(list, Records)}
+
+  def __DrawToString(self, Sim):
+    """
+    Returns:
+      str: The frame Sim.Draw() would print
+    """
+    Output = io.StringIO()
+    Sim.Draw(LandscapeRenderer(Sim.GetLandscapeSize(), Output = Output))
+    return Output.getvalue()
+
+  async def __Snapshot(self, Request):
+    SimulationID, Sim, Lock = self.__Get(Request)
+    async with Lock:
+      Checkpoint = await self.__RunInExecutor(Sim.GetCheckpoint)
+    return {"checkpoint": base64.b64encode(Checkpoint).decode("ascii")}
+
+  async def __Restore(self, Request):
+    Checkpoint = base64.b64decode(Request["checkpoint"])
+    Seed = Request.get("Seed")
+    if Seed is None and not Simulation.IsSeededCheckpoint(Checkpoint):
+      raise ValueError("restoring a snapshot of an unseeded simulation needs a Seed")
+    Sim = await self.__RunInExecutor(Simulation.FromCheckpoint, Checkpoint, Seed)
+    return {"simulation": self.__Add(Sim)}
+
+  async def __Delete(self, Request):
+    SimulationID, Sim, Lock = self.__Get(Request)
+    async with Lock:
+      del self.__Simulations[SimulationID]
+      del self.__Locks[SimulationID]
+    return {}
+
+  async def __List(self, Request):
+    return {"simulations": list(self.__Simulations)}
+
+async def Serve(Host = "127.0.0.1", Port = 8765, UnixPath = None, Workers = None):
+  """
+  Runs a SimulationHost until cancelled
+
+  Args:
+    Host (str, optional): TCP address to listen on (defaults to localhost only)
+    Port (int, optional): TCP port (defaults to 8765)
+    UnixPath (str, optional): Listen on this Unix socket instead of TCP
+    Workers (int, optional): Executor threads
+  """
+  SimHost = SimulationHost(Workers)
+  if UnixPath is None:
+    Server = await asyncio.start_server(SimHost.ServeClient, Host, Port, limit = MAX_REQUEST_BYTES)
+  else:
+    Server = await asyncio.start_unix_server(SimHost.ServeClient, UnixPath, limit = MAX_REQUEST_BYTES)
+  try:
+    async with Server:
+      await Server.serve_forever()
+  finally:
+    SimHost.Close()
+
+def Main():
+  """
+  Command line front end: serves simulations until interrupted
+  """
+  Parser = argparse.ArgumentParser(description = "Host Rabbits & Foxes simulations over a local socket")
+  Parser.add_argument("--host", default = "127.0.0.1")
+  Parser.add_argument("--port", type = int, default = 8765)
+  Parser.add_argument("--unix", default = None)
+  Parser.add_argument("--workers", type = int, default = None)
+  Arguments = Parser.parse_args()
+  try:
+    asyncio.run(Serve(Arguments.host, Arguments.port, Arguments.unix, Arguments.workers))
+  except KeyboardInterrupt:
+    pass
+
+if __name__ == "__main__":
+  Main()
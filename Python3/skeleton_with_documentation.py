@@ -11,18 +11,564 @@ The documentation style is based on the Google documentation style, available he
 Version 3.0.2
 """
 
+import array
 import enum
+import functools
+import struct
+import sys
+import time
 import random
 import math
+import bisect
+import collections
+import itertools
+
+try:
+  import numpy
+except ImportError:
+  numpy = None
 
 class Location:
   """
   Location is used in the Simulation class as a very basic level grid
   """
+  __slots__ = ("Fox", "Warren")
+
   def __init__(self):
     self.Fox = None
     self.Warren = None
- 
+
+class FreeCells:
+  """
+  FreeCells tracks which cells of one landscape layer (warrens or foxes) are empty, so a random empty cell can always be found quickly
+
+  Note:
+    While at most half the layer is occupied, ChooseFreeCell retries random (x, y) draws exactly like the original placement loops, which takes fewer than two tries on average and keeps seeded runs unchanged.
+    Once the layer is at least half full it switches to a list of the free cells, picking one with a single draw and removing it by swapping with the last entry, both O(1). The list is dropped again when occupancy falls below a quarter
+
+  Args:
+      LandscapeSize (int): Width and Height of the landscape
+      Rng (random.Random, optional): Where random cells are drawn from (defaults to the random module)
+
+  Attributes:
+      __LandscapeSize (int)
+      __Random (random.Random)
+      __Occupied (set): (x, y) of every occupied cell
+      __FreeList (list): Free cells as x * LandscapeSize + y, or None while retrying draws
+      __FreeListPositions (dict): Index of each free cell in __FreeList
+  """
+  def __init__(self, LandscapeSize, Rng = None):
+    if Rng is None:
+      Rng = random
+    self.__LandscapeSize = LandscapeSize
+    self.__Random = Rng
+    self.__Occupied = set()
+    self.__FreeList = None
+    self.__FreeListPositions = None
+
+  def Take(self, x, y):
+    """
+    Marks a cell as occupied
+
+    Args:
+      x (int): Cell x coordinate
+      y (int): Cell y coordinate
+    """
+    self.__Occupied.add((x, y))
+    if self.__FreeList is None:
+      if len(self.__Occupied) * 2 >= self.__LandscapeSize * self.__LandscapeSize:
+        self.__BuildFreeList()
+    else:
+      Cell = x * self.__LandscapeSize + y
+      Position = self.__FreeListPositions.pop(Cell)
+      LastCell = self.__FreeList.pop()
+      if LastCell != Cell:
+        self.__FreeList[Position] = LastCell
+        self.__FreeListPositions[LastCell] = Position
+
+  def Release(self, x, y):
+    """
+    Marks a cell as empty again
+
+    Args:
+      x (int): Cell x coordinate
+      y (int): Cell y coordinate
+    """
+    self.__Occupied.remove((x, y))
+    if not self.__FreeList is None:
+      if len(self.__Occupied) * 4 < self.__LandscapeSize * self.__LandscapeSize:
+        self.__FreeList = None
+        self.__FreeListPositions = None
+      else:
+        Cell = x * self.__LandscapeSize + y
+        self.__FreeListPositions[Cell] = len(self.__FreeList)
+        self.__FreeList.append(Cell)
+
+  def __BuildFreeList(self):
+    """
+    Lists every free cell, only done once the layer is half full so it never holds more cells than there are animals
+    """
+    self.__FreeList = []
+    self.__FreeListPositions = {}
+    for x in range (0, self.__LandscapeSize):
+      for y in range (0, self.__LandscapeSize):
+        if not (x, y) in self.__Occupied:
+          self.__FreeListPositions[x * self.__LandscapeSize + y] = len(self.__FreeList)
+          self.__FreeList.append(x * self.__LandscapeSize + y)
+
+  def GetFreeList(self):
+    """
+    Returns:
+      list: Copy of the free cells in their current order as x * LandscapeSize + y, or None while retrying draws. Used for checkpoints, as the order decides which cell a draw picks
+    """
+    if self.__FreeList is None:
+      return None
+    return list(self.__FreeList)
+
+  def SetFreeList(self, FreeList):
+    """
+    Puts back a list from GetFreeList, after every occupied cell has been Taken
+
+    Args:
+      FreeList (list): Free cells, or None to go back to retrying draws
+    """
+    self.__FreeList = FreeList
+    if FreeList is None:
+      self.__FreeListPositions = None
+    else:
+      self.__FreeListPositions = {Cell: Position for Position, Cell in enumerate(FreeList)}
+
+  def IsFull(self):
+    """
+    Returns:
+      bool: True if every cell is occupied
+    """
+    return len(self.__Occupied) == self.__LandscapeSize * self.__LandscapeSize
+
+  def ChooseFreeCell(self):
+    """
+    Picks an empty cell uniformly at random
+
+    Returns:
+      tuple: (x, y) of the chosen cell, or None if the layer is full
+    """
+    if self.IsFull():
+      return None
+    if self.__FreeList is None:
+      x = self.__Random.randint(0, self.__LandscapeSize - 1)
+      y = self.__Random.randint(0, self.__LandscapeSize - 1)
+      while (x, y) in self.__Occupied:
+        x = self.__Random.randint(0, self.__LandscapeSize - 1)
+        y = self.__Random.randint(0, self.__LandscapeSize - 1)
+      return (x, y)
+    Cell = self.__FreeList[self.__Random.randint(0, len(self.__FreeList) - 1)]
+    return (Cell // self.__LandscapeSize, Cell % self.__LandscapeSize)
+
+class RenderModes(enum.Enum):
+  """
+  How LandscapeRenderer draws each frame
+
+  Attributes:
+    Off (enum): Draws nothing, for batch runs
+    Full (enum): Redraws the whole frame every time, exactly like the original __DrawLandscape
+    Incremental (enum): Draws the whole frame once at the top of the screen, then uses ANSI cursor moves to rewrite only the cells that changed
+  """
+  Off = 1
+  Full = 2
+  Incremental = 3
+
+class LandscapeRenderer:
+  """
+  LandscapeRenderer turns the landscape into text, building each frame in one buffer and writing it with a single call
+
+  Note:
+    Incremental mode assumes nothing has scrolled the frame off the top of the screen since the last draw. Call Invalidate() after printing anything long (detail output, rabbit lists) so the next draw clears the screen and starts again
+
+  Args:
+      LandscapeSize (int): Width and Height of the landscape
+      Mode (RenderModes, optional): Defaults to Full
+      Viewport (tuple, optional): (Left, Top, Width, Height) window of cells to draw, clipped to the landscape (defaults to the whole landscape)
+      Output (file, optional): Where frames are written (defaults to sys.stdout at the time of drawing)
+
+  Attributes:
+      __Mode (RenderModes)
+      __Left, __Top, __Right, __Bottom (int): Cells drawn are Left <= x < Right and Top <= y < Bottom
+      __Output (file)
+      __LastRows (list): Cell texts of each row drawn last time in Incremental mode, or None when the next draw must be a full one
+  """
+  __FIRST_ROW_ON_SCREEN = 6
+
+  def __init__(self, LandscapeSize, Mode = RenderModes.Full, Viewport = None, Output = None):
+    self.__Mode = Mode
+    if Viewport is None:
+      Viewport = (0, 0, LandscapeSize, LandscapeSize)
+    Left, Top, Width, Height = Viewport
+    self.__Left = max(0, min(Left, LandscapeSize))
+    self.__Top = max(0, min(Top, LandscapeSize))
+    self.__Right = max(self.__Left, min(Left + Width, LandscapeSize))
+    self.__Bottom = max(self.__Top, min(Top + Height, LandscapeSize))
+    self.__Output = Output
+    self.__LastRows = None
+
+  def Invalidate(self):
+    """
+    Makes the next draw a full one
+    """
+    self.__LastRows = None
+
+  def Draw(self, TimePeriod, GetCellText):
+    """
+    Draws one frame
+
+    Args:
+      TimePeriod (int): Shown above the grid
+      GetCellText (function): Takes (x, y) and returns the characters drawn for that cell, e.g. "12F" or " 5 "
+    """
+    if self.__Mode == RenderModes.Off:
+      return
+    Rows = []
+    for y in range (self.__Top, self.__Bottom):
+      Rows.append([GetCellText(x, y) for x in range (self.__Left, self.__Right)])
+    if self.__Mode == RenderModes.Incremental and not self.__LastRows is None:
+      Text = self.__BuildChanges(TimePeriod, Rows)
+    else:
+      Text = self.__BuildFrame(TimePeriod, Rows)
+      if self.__Mode == RenderModes.Incremental:
+        Text = "\x1b[H\x1b[2J" + Text + "\x1b[J"
+    if self.__Mode == RenderModes.Incremental:
+      self.__LastRows = Rows
+    Output = self.__Output
+    if Output is None:
+      Output = sys.stdout
+    Output.write(Text)
+    Output.flush()
+
+  def __RowLabel(self, y):
+    """
+    Returns:
+      str: The row number and bar drawn before the cells of row y
+    """
+    if y < 10:
+      return " " + str(y) + "|"
+    return str(y) + "|"
+
+  def __BuildFrame(self, TimePeriod, Rows):
+    """
+    Returns:
+      str: The whole frame, laid out the same way as the original __DrawLandscape
+    """
+    Parts = ["\nTIME PERIOD: ", str(TimePeriod), "\n\n   "]
+    for x in range (self.__Left, self.__Right):
+      if x < 10:
+        Parts.append(" ")
+      Parts.append(str(x) + " |")
+    Parts.append("\n")
+    Parts.append("-" * ((self.__Right - self.__Left) * 4 + 3))
+    Parts.append("\n")
+    for y, Row in zip(range (self.__Top, self.__Bottom), Rows):
+      Parts.append(self.__RowLabel(y))
+      for CellText in Row:
+        Parts.append(CellText + "|")
+      Parts.append("\n")
+    return "".join(Parts)
+
+  def __BuildChanges(self, TimePeriod, Rows):
+    """
+    Rewrites the time period and every cell that changed since the last draw. A row whose cells changed width (warrens of 100 or more rabbits) is rewritten whole
+
+    Returns:
+      str: ANSI cursor moves and text, ending with the cursor below the frame
+    """
+    Parts = ["\x1b[2;1HTIME PERIOD: ", str(TimePeriod), "\x1b[K"]
+    for RowNumber, (y, Row, LastRow) in enumerate(zip(range (self.__Top, self.__Bottom), Rows, self.__LastRows)):
+      ScreenRow = self.__FIRST_ROW_ON_SCREEN + RowNumber
+      if Row == LastRow:
+        continue
+      if any(len(CellText) != len(LastText) for CellText, LastText in zip(Row, LastRow)):
+        Parts.append("\x1b[" + str(ScreenRow) + ";1H" + self.__RowLabel(y) + "".join(CellText + "|" for CellText in Row) + "\x1b[K")
+        continue
+      Column = len(self.__RowLabel(y)) + 1
+      for CellText, LastText in zip(Row, LastRow):
+        if CellText != LastText:
+          Parts.append("\x1b[" + str(ScreenRow) + ";" + str(Column) + "H" + CellText)
+        Column += len(CellText) + 1
+    Parts.append("\x1b[" + str(self.__FIRST_ROW_ON_SCREEN + len(Rows)) + ";1H\x1b[J")
+    return "".join(Parts)
+
+class PhaseProfiler:
+  """
+  PhaseProfiler records where the time in each time period goes: wall time, calls, random draws and animals created for each phase of Simulation.__AdvanceTimePeriod, and for drawing
+
+  Note:
+    Pass one to Simulation as its Profiler. Without one, the only cost left in the period loop is an "is None" test around each phase.
+    Random draws are counted by handing the simulation's warrens and foxes CountingRandom generators, so they are only counted for simulations made with a Seed. Animals created are counted from the simulation's AnimalIDs, which it hands over with StartPeriod
+
+  Attributes:
+      PHASES (tuple): Names of the phases, in the order they happen
+      RandomDraws (int): Running count of random draws, increased by CountingRandom
+      __TimePeriod (int): Period the current stats are for
+      __AnimalIDs (AnimalIDs): The profiled simulation's ID counter
+      __Periods (int): Periods profiled so far
+      __Current (dict): [Seconds, Calls, RandomDraws, AnimalsCreated] for each phase in the current period
+      __Totals (dict): The same, added up over every period
+  """
+  PHASES = ("Predation", "WarrenSpread", "WarrenGeneration", "WarrenRemoval", "FoxGeneration", "FoxBirths", "Drawing")
+
+  def __init__(self):
+    self.RandomDraws = 0
+    self.__TimePeriod = 0
+    self.__AnimalIDs = Animal._SharedIDs
+    self.__Periods = 0
+    self.__Current = {Phase: [0.0, 0, 0, 0] for Phase in self.PHASES}
+    self.__Totals = {Phase: [0.0, 0, 0, 0] for Phase in self.PHASES}
+
+  def StartPeriod(self, TimePeriod, IDs = None):
+    """
+    Clears the per-period stats, called by Simulation at the start of each time period
+
+    Args:
+      TimePeriod (int): The period starting
+      IDs (AnimalIDs, optional): Where the simulation's new animals get their IDs (defaults to Animal._SharedIDs)
+    """
+    self.__TimePeriod = TimePeriod
+    if not IDs is None:
+      self.__AnimalIDs = IDs
+    self.__Periods += 1
+    self.__Current = {Phase: [0.0, 0, 0, 0] for Phase in self.PHASES}
+
+  def StartPhase(self):
+    """
+    Returns:
+      tuple: Counters at the start of a phase, to pass to EndPhase
+    """
+    return (time.perf_counter(), self.RandomDraws, self.__AnimalIDs.GetNextID())
+
+  def EndPhase(self, Phase, Start):
+    """
+    Adds what happened since StartPhase to Phase
+
+    Args:
+      Phase (str): One of PHASES
+      Start (tuple): What StartPhase (or the last EndPhase) returned
+
+    Returns:
+      tuple: Counters now, so the next phase can start from here without another StartPhase call
+    """
+    Now = (time.perf_counter(), self.RandomDraws, self.__AnimalIDs.GetNextID())
+    for Stats in (self.__Current[Phase], self.__Totals[Phase]):
+      Stats[0] += Now[0] - Start[0]
+      Stats[1] += 1
+      Stats[2] += Now[1] - Start[1]
+      Stats[3] += Now[2] - Start[2]
+    return Now
+
+  def __AsDicts(self, Phases):
+    """
+    Returns:
+      dict: Seconds, Calls, RandomDraws and AnimalsCreated for each phase
+    """
+    return {Phase: dict(zip(("Seconds", "Calls", "RandomDraws", "AnimalsCreated"), Stats)) for Phase, Stats in Phases.items()}
+
+  def GetPeriodStats(self):
+    """
+    Returns:
+      dict: TimePeriod, and the stats of each phase in that period (drawing after it is counted too)
+    """
+    return {"TimePeriod": self.__TimePeriod, "Phases": self.__AsDicts(self.__Current)}
+
+  def GetSummary(self):
+    """
+    Returns:
+      dict: Periods profiled, and the stats of each phase added up over all of them
+    """
+    return {"Periods": self.__Periods, "Phases": self.__AsDicts(self.__Totals)}
+
+  def Report(self):
+    """
+    Prints the cumulative summary as a table
+    """
+    TotalSeconds = sum(Stats[0] for Stats in self.__Totals.values())
+    print("Profiled", self.__Periods, "periods")
+    print("Phase".ljust(18), "Seconds".rjust(10), "%".rjust(6), "Calls".rjust(10), "Draws".rjust(12), "Animals".rjust(10))
+    for Phase, Stats in self.__Totals.items():
+      print(Phase.ljust(18), ("%.4f" % Stats[0]).rjust(10), ("%.1f" % (100 * Stats[0] / TotalSeconds if TotalSeconds > 0 else 0)).rjust(6), str(Stats[1]).rjust(10), str(Stats[2]).rjust(12), str(Stats[3]).rjust(10))
+
+class CountingRandom(random.Random):
+  """
+  CountingRandom is a random.Random that adds one to its profiler's RandomDraws for every draw. It gives exactly the same numbers as random.Random with the same seed
+
+  Args:
+      Seed (int): Seed, as for random.Random
+      Profiler (PhaseProfiler): Profiler to count draws for
+  """
+  def __init__(self, Seed, Profiler):
+    self.__Profiler = Profiler
+    super(CountingRandom, self).__init__(Seed)
+
+  def random(self):
+    self.__Profiler.RandomDraws += 1
+    return super(CountingRandom, self).random()
+
+  def getrandbits(self, k):
+    self.__Profiler.RandomDraws += 1
+    return super(CountingRandom, self).getrandbits(k)
+
+class RandomBufferModes(enum.Enum):
+  """
+  How a seeded Simulation's generators are made
+
+  Attributes:
+    Off (enum): Plain random.Random, as before
+    Strict (enum): BufferedRandom over the Mersenne Twister, giving exactly the same numbers as Off. It isn't any faster than Off, as random.Random's randint() is already about as quick as a Python method can be, so it is there to check BufferedRandom against random.Random
+    Fast (enum): One BufferedRandom over a NumPy generator for the whole simulation, a different stream of numbers that can't be checkpointed, but quicker than Off
+  """
+  Off = 1
+  Strict = 2
+  Fast = 3
+
+class BufferedRandom(random.Random):
+  """
+  BufferedRandom is a random.Random that draws 32-bit words a block at a time and hands them out from a buffer, with a quick randint() for the small ranges every animal draws from
+
+  Note:
+    Each animal decision is a randint(), which in random.Random goes through randrange, _randbelow and getrandbits in turn. Here it is one method taking the next word from the buffer.
+    The first block is __FIRST_BLOCK_SIZE words, and each refill doubles it up to BlockSize, so a generator that is hardly drawn from (a fox's, say) never holds more than a few words it won't use. Words are kept in an array rather than a list, at 4 bytes each instead of an int object each.
+    In Strict mode the words come from the Mersenne Twister in the same order, and randint(), random() and getrandbits() use them exactly as random.Random does, so every draw (and sample, choice, shuffle, ...) matches random.Random with the same seed. getstate() gives the state as if only the words handed out so far had been drawn, so checkpoints carry on exactly. It gets there by replaying the words handed out since the seed or the last getstate()/setstate(), rather than saving the twister's state before every block, as saving it costs more than drawing a whole block
+    In Fast mode the words come from a NumPy generator seeded from Seed instead, and randint() goes further for CachedRanges, keeping a block of ready-drawn values for each, so those calls are one dict lookup and a pop(). Ranges that change from call to call, such as picking one of the current males, aren't worth a block each and use the words like Strict does. It falls back to Strict if NumPy isn't installed
+
+  Args:
+      Seed (int, optional): Seed, as for random.Random
+      Strict (bool, optional): Keep random.Random's sequence (defaults to True)
+      BlockSize (int, optional): Most words drawn per refill (defaults to 1024)
+      CachedRanges (tuple, optional): (a, b) of each randint() range to keep ready-drawn values for in Fast mode (defaults to none)
+
+  Attributes:
+      __Strict (bool)
+      __BlockSize (int)
+      __CachedRanges (tuple)
+      __NextBlockSize (int): Words to draw at the next refill
+      __Words (array.array): The unused 32-bit words of the current block, last to be used first, so each one is a pop()
+      __Anchor (tuple): (Seed, version) or twister state that getstate() replays from in Strict mode
+      __WordsDrawn (int): Words drawn since __Anchor
+      __Generator (numpy.random.Generator): Source of words in Fast mode
+      __Ranges (dict): Unused randint() values for each of CachedRanges in Fast mode, last to be used first
+  """
+  __FIRST_BLOCK_SIZE = 16
+
+  def __init__(self, Seed = None, Strict = True, BlockSize = 1024, CachedRanges = ()):
+    self.__Strict = Strict or numpy is None
+    self.__BlockSize = BlockSize
+    self.__CachedRanges = CachedRanges
+    super(BufferedRandom, self).__init__(Seed)
+
+  def seed(self, a = None, version = 2):
+    super(BufferedRandom, self).seed(a, version)
+    self.__NextBlockSize = min(self.__FIRST_BLOCK_SIZE, self.__BlockSize)
+    self.__Words = array.array("I")
+    self.__Ranges = {}
+    if self.__Strict:
+      self.__SetAnchor((a, version) if not a is None else super(BufferedRandom, self).getstate())
+    else:
+      self.__Ranges = {Range: [] for Range in self.__CachedRanges}
+      self.__Generator = numpy.random.default_rng(super(BufferedRandom, self).getrandbits(64))
+
+  def getstate(self):
+    if not self.__Strict:
+      raise TypeError("A Fast BufferedRandom can't be saved, use Strict mode to checkpoint")
+    Replay = random.Random()
+    if len(self.__Anchor) == 2:
+      Replay.seed(*self.__Anchor)
+    else:
+      Replay.setstate(self.__Anchor)
+    WordsToSkip = self.__WordsDrawn - len(self.__Words)
+    while WordsToSkip > 0:
+      Replay.getrandbits(32 * min(WordsToSkip, self.__BlockSize))
+      WordsToSkip -= self.__BlockSize
+    State = (self.VERSION, Replay.getstate()[1], self.gauss_next)
+    self.__SetAnchor(State, len(self.__Words))
+    return State
+
+  def setstate(self, state):
+    if not self.__Strict:
+      raise TypeError("A Fast BufferedRandom can't be restored, use Strict mode to checkpoint")
+    super(BufferedRandom, self).setstate(state)
+    self.__Words = array.array("I")
+    self.__SetAnchor(state)
+
+  def __SetAnchor(self, Anchor, WordsDrawn = 0):
+    """
+    Makes Anchor the point getstate() replays from, WordsDrawn words before the twister's current state
+    """
+    self.__Anchor = Anchor
+    self.__WordsDrawn = WordsDrawn
+
+  def __Refill(self):
+    """
+    Draws the next block of words into __Words
+    """
+    BlockSize = self.__NextBlockSize
+    self.__NextBlockSize = min(2 * BlockSize, self.__BlockSize)
+    if self.__Strict:
+      self.__WordsDrawn += BlockSize
+      Words = array.array("I", super(BufferedRandom, self).getrandbits(32 * BlockSize).to_bytes(4 * BlockSize, "little"))
+      if sys.byteorder != "little":
+        Words.byteswap()
+      Words.reverse()
+      self.__Words = Words
+    else:
+      self.__Words = array.array("I", self.__Generator.integers(0, 1 << 32, BlockSize, dtype = numpy.uint32).tobytes())
+
+  def randint(self, a, b):
+    if self.__Ranges:
+      Values = self.__Ranges.get((a, b))
+      if not Values is None:
+        if not Values:
+          Values.extend(self.__Generator.integers(a, b, self.__BlockSize, endpoint = True).tolist())
+        return Values.pop()
+    Width = b - a + 1
+    Shift = 32 - Width.bit_length()
+    if Width <= 0 or Shift < 0:
+      return super(BufferedRandom, self).randint(a, b)
+    Words = self.__Words
+    while True:
+      if not Words:
+        self.__Refill()
+        Words = self.__Words
+      Value = Words.pop() >> Shift
+      if Value < Width:
+        return a + Value
+
+  def random(self):
+    return (self.getrandbits(27) * 67108864.0 + self.getrandbits(26)) * (1.0 / 9007199254740992.0)
+
+  def getrandbits(self, k):
+    if k < 0:
+      raise ValueError("number of bits must be non-negative")
+    Value = 0
+    Bits = 0
+    while Bits < k:
+      if not self.__Words:
+        self.__Refill()
+      Word = self.__Words.pop()
+      if k - Bits < 32:
+        Word >>= 32 - (k - Bits)
+      Value |= Word << Bits
+      Bits += 32
+    return Value
+
+class SteadyStates(enum.Enum):
+  """
+  What Simulation.FastForward found a run had settled into
+
+  Attributes:
+    Extinct (enum): No warrens and no foxes are left
+    Saturated (enum): The foxes have died out, no warren can spread any more and the layout of the landscape has stayed the same through the detection window, leaving only the rabbit counts wobbling just under capacity
+    Cycle (enum): The fingerprint of the whole landscape has repeated with a fixed period several times in a row
+  """
+  Extinct = 1
+  Saturated = 2
+  Cycle = 3
+
 class Simulation:
   """
   Simulation sets up the whole Rabbits & Foxes simulation, and is customisable.
@@ -33,6 +579,15 @@ class Simulation:
       InitialFoxCount (int): How many Foxes to initiate with
       Variability (int): Something to do with chance/randomness in Warrens
       FixedInitialLocations (bool): Don't use random locations for Warrens?
+      Interactive (bool, optional): Draw the landscape and run the input() menu straight away (defaults to True). Pass False to drive the simulation headlessly with Step(), Run() and RunUntilExtinct()
+      SparseLandscape (bool, optional): Only store Locations for occupied cells (defaults to False), so memory scales with the number of animals rather than LandscapeSize squared
+      WarrenType (class, optional): Class used for every warren, e.g. ArrayWarren (defaults to Warren)
+      WarrenCapacity (int, optional): Most rabbits a warren can hold, passed to every warren as MaxRabbits (defaults to None, the warren type's own limit of 99)
+      RandomBuffering (RandomBufferModes, optional): Make this simulation's generators BufferedRandom (defaults to Off). Only used with a Seed and no Profiler
+      Renderer (LandscapeRenderer, optional): Draws the landscape (defaults to a Full renderer of the whole landscape)
+      Profiler (PhaseProfiler, optional): Records time, random draws and animals created for each phase of every time period (defaults to None, no profiling)
+      History (history.HistoryStore, optional): Store that every time period is recorded to, which adds a "Jump to period" option to the menu (defaults to None, no recording)
+      Seed (int, optional): Seed for this simulation's own random.Random. Every warren and fox is handed its own child generator seeded from it, so a run replays exactly from its seed whatever else is running in the process. Defaults to None, which keeps drawing everything from the shared random module as before
 
   Attributes:
       __ViewRabbits (str)
@@ -43,337 +598,1985 @@ class Simulation:
       __LandscapeSize (int)
       __Variability (int): Something to do with chance/randomness in Warrens
       __FixedInitialLocations (bool)
-      __Landscape (list)
+      __SparseLandscape (bool)
+      __WarrenType (class): Warren or a drop-in alternative such as ArrayWarren, with WarrenCapacity bound in
+      __Renderer (LandscapeRenderer)
+      __Profiler (PhaseProfiler)
+      __History (history.HistoryStore)
+      __RandomBuffering (RandomBufferModes)
+      __Random (random.Random): Generator for placing animals and seeding child generators, or the random module when no Seed was given
+      __AnimalIDs (AnimalIDs): Where this simulation's animals get their IDs, so they are unique within it whatever other simulations do
+      __Landscape (list or dict): Grid of Locations, or a dict of the occupied Locations keyed by (x, y) when __SparseLandscape is set
+      __WarrenLocations (list): Sorted (x, y) cells of every living Warren, i.e. landscape scan order
+      __FoxLocations (dict): Index of every living Fox keyed by its (x, y) cell
+      __FoxIDs (dict): (x, y) cell of every living Fox keyed by its ID
+      __WarrenRanking (list): Warren cells from most to fewest rabbits, or None until QueryWarrens needs it this period
+      __RabbitRanges (list): (FirstID, EndID, x, y) of each run of rabbit IDs and the cell of the warren they were born into, sorted by FirstID, or None until FindAnimal needs it
+      __RabbitRangesBuilt (int): Length of __RabbitRanges when it was last built
+      __FoxOrder (list): Sorted (x, y) cells of every living Fox, i.e. landscape scan order
+      __FreeWarrenCells (FreeCells): Cells with no warren
+      __FreeFoxCells (FreeCells): Cells with no fox
+      __PredationOffsets (list): (dx, dy, PercentToEat) for every cell within a fox's hunting range, in landscape scan order
+      __PeriodCounts (dict): Births, deaths and rabbits eaten during the last time period, keyed by the names in METRIC_FIELDS
   """
-  def __init__(self, LandscapeSize, InitialWarrenCount, InitialFoxCount, Variability, FixedInitialLocations):
+  METRIC_FIELDS = ("TimePeriod", "Rabbits", "Warrens", "Foxes", "RabbitsBorn", "RabbitsKilledByOtherFactors", "RabbitsDiedOfOldAge", "RabbitsEaten", "WarrensCreated", "WarrensDiedOut", "FoxesBorn", "FoxesStarved", "FoxesKilledByOtherFactors", "FoxesDiedOfOldAge")
+  __CHECKPOINT_MAGIC = b"RFCK"
+  __CHECKPOINT_VERSION = 3
+  __CHECKPOINT_HEADER = "<4s?HI"
+
+  def __init__(self, LandscapeSize, InitialWarrenCount, InitialFoxCount, Variability, FixedInitialLocations, Interactive = True, SparseLandscape = False, WarrenType = None, Renderer = None, Seed = None, Profiler = None, History = None, WarrenCapacity = None, RandomBuffering = RandomBufferModes.Off):
     self.__ViewRabbits = ""
     self.__TimePeriod = 0
     self.__WarrenCount = 0
     self.__FoxCount = 0
     self.__ShowDetail = False
+    self.__PeriodCounts = dict.fromkeys(self.METRIC_FIELDS[4:], 0)
     self.__LandscapeSize = LandscapeSize
     self.__Variability = Variability
     self.__FixedInitialLocations = FixedInitialLocations
-    self.__Landscape = []
-    for Count1 in range (self.__LandscapeSize):
-      LandscapeRow = []
-      for Count2 in range (self.__LandscapeSize):
-        LandscapeLocation = None
-        LandscapeRow.append(LandscapeLocation)
-      self.__Landscape.append(LandscapeRow)
+    self.__SparseLandscape = SparseLandscape
+    if WarrenType is None:
+      WarrenType = Warren
+    if not WarrenCapacity is None:
+      WarrenType = functools.partial(WarrenType, MaxRabbits = WarrenCapacity)
+    self.__WarrenType = WarrenType
+    if Renderer is None:
+      Renderer = LandscapeRenderer(LandscapeSize)
+    self.__Renderer = Renderer
+    self.__Profiler = Profiler
+    self.__History = History
+    self.__RandomBuffering = RandomBuffering
+    if Seed is None:
+      self.__Random = random
+    else:
+      self.__Random = self.__MakeRandom(Seed)
+    self.__AnimalIDs = AnimalIDs()
+    self.__WarrenLocations = []
+    self.__FoxLocations = {}
+    self.__FoxIDs = {}
+    self.__FoxOrder = []
+    self.__RabbitRanges = None
+    self.__RabbitRangesBuilt = 0
+    self.__InvalidateIndexes()
+    self.__FreeWarrenCells = FreeCells(LandscapeSize, self.__Random)
+    self.__FreeFoxCells = FreeCells(LandscapeSize, self.__Random)
+    self.__PredationOffsets = self.CalculatePredationOffsets()
+    if self.__SparseLandscape:
+      self.__Landscape = {}
+    else:
+      self.__Landscape = []
+      for Count1 in range (self.__LandscapeSize):
+        LandscapeRow = []
+        for Count2 in range (self.__LandscapeSize):
+          LandscapeLocation = None
+          LandscapeRow.append(LandscapeLocation)
+        self.__Landscape.append(LandscapeRow)
     self.__CreateLandscapeAndAnimals(InitialWarrenCount, InitialFoxCount, self.__FixedInitialLocations)
+    if not History is None:
+      History.Record(self)
+    if Interactive:
+      self.__RunMenu()
+
+  def __RunMenu(self):
+    """
+    Interactive front end: draws the landscape and loops on the menu until everything is extinct or the user exits
+    """
     self.__DrawLandscape()
     MenuOption = 0
-    while (self.__WarrenCount > 0 or self.__FoxCount > 0) and MenuOption != 5:
+    while not self.IsExtinct() and MenuOption != 5:
       print()
       print("1. Advance to next time period showing detail")
       print("2. Advance to next time period hiding detail")
       print("3. Inspect fox")
       print("4. Inspect warren")
       print("5. Exit")
+      if not self.__History is None:
+        print("6. Jump to period")
       print()
       MenuOption = int(input("Select option: "))
       if MenuOption == 1:
         self.__TimePeriod += 1
         self.__ShowDetail = True
         self.__AdvanceTimePeriod()
+        self.__Renderer.Invalidate()
+        self.__DrawLandscape()
+        print()
       if MenuOption == 2:
         self.__TimePeriod += 1
         self.__ShowDetail = False
         self.__AdvanceTimePeriod()
+        self.__DrawLandscape()
+        print()
       if MenuOption == 3:
         x = self.__InputCoordinate("x")
         y = self.__InputCoordinate("y")
-        if not self.__Landscape[x][y].Fox is None:
-          self.__Landscape[x][y].Fox.Inspect()
+        if not self.__GetFox(x, y) is None:
+          self.__GetFox(x, y).Inspect()
+        self.__Renderer.Invalidate()
       if MenuOption == 4:
         x = self.__InputCoordinate("x")
         y = self.__InputCoordinate("y")
-        if not self.__Landscape[x][y].Warren is None:
-          self.__Landscape[x][y].Warren.Inspect()
+        if not self.__GetWarren(x, y) is None:
+          self.__GetWarren(x, y).Inspect()
           self.__ViewRabbits = input("View individual rabbits (y/n)? ")
           if self.__ViewRabbits == "y":
-            self.__Landscape[x][y].Warren.ListRabbits()
+            self.__GetWarren(x, y).ListRabbits()
+        self.__Renderer.Invalidate()
+      if MenuOption == 6 and not self.__History is None:
+        Period = int(input("  Input period:"))
+        if self.__History.HasPeriod(Period):
+          self.__History.Draw(Period, self.__Renderer)
+        else:
+          print("Period", Period, "has not been recorded")
+        self.__Renderer.Invalidate()
     input()
-    
-  def __InputCoordinate(self, CoordinateName):
+
+  def Step(self):
     """
-    Takes an input co-ordinate and processes it as an int
+    Advances the simulation by one time period without drawing the landscape or waiting for input
+    """
+    self.__TimePeriod += 1
+    self.__ShowDetail = False
+    self.__AdvanceTimePeriod()
+
+  def Run(self, NumberOfPeriods):
+    """
+    Advances the simulation headlessly by up to NumberOfPeriods time periods, stopping early if everything dies out
+
+    Args:
+      NumberOfPeriods (int): Maximum number of time periods to advance
+
+    Returns:
+      int: Number of time periods actually advanced
+    """
+    PeriodsRun = 0
+    while PeriodsRun < NumberOfPeriods and not self.IsExtinct():
+      self.Step()
+      PeriodsRun += 1
+    return PeriodsRun
+
+  def RunUntilExtinct(self, MaxPeriods = None):
+    """
+    Advances the simulation headlessly until there are no warrens and no foxes left
+
+    Args:
+      MaxPeriods (int, optional): Safety limit on the number of time periods to advance (defaults to no limit)
+
+    Returns:
+      int: The time period the simulation stopped at
+    """
+    PeriodsRun = 0
+    while not self.IsExtinct() and (MaxPeriods is None or PeriodsRun < MaxPeriods):
+      self.Step()
+      PeriodsRun += 1
+    return self.__TimePeriod
+
+  def FastForward(self, MaxPeriods = None, Jump = False, MaxCycleLength = 16, CycleRepeats = 3):
+    """
+    Advances the simulation headlessly until it can be classified as extinct, saturated or cycling, rather than only stopping once everything is extinct
 
     Note:
-      Validation needed: 0 < CoordinateName < (self.__LandscapeSize - 1)
+      GetFingerprint() is taken after every period. A cycle of length k is only reported once the last k fingerprints have come round CycleRepeats times in a row, so a chance repeat doesn't stop the run.
+      Warrens that have spread can still die out, so a run is only called saturated once the cells of every warren and fox have also stayed the same for the whole detection window, MaxCycleLength * CycleRepeats periods.
+      The fingerprints leave out the animals' ages, genders and food and the generators' states, all of which drive the next period, so a run that is cycling or saturated by its fingerprints can still change. Periods are never skipped: with Jump set and a MaxPeriods given, the run is still classified as before but then carries on stepping, and ends exactly where Run(MaxPeriods) would have
 
     Args:
-      CoordinateName (str): Requires string 'x' or 'y'
-    
-    Attributes:
-      Coordinate (int): User-inputted coordinate value
-    
+      MaxPeriods (int, optional): Maximum number of time periods to advance (defaults to no limit)
+      Jump (bool, optional): Carry on to MaxPeriods once classified instead of stopping there (defaults to False)
+      MaxCycleLength (int, optional): Longest cycle looked for (defaults to 16)
+      CycleRepeats (int, optional): Times a cycle has to come round before it counts (defaults to 3)
+
     Returns:
-      int: Specified coordinate value
+      tuple: (SteadyStates member, or None if MaxPeriods ran out first, time period at which the run was classified, or None)
+    """
+    FirstPeriod = self.__TimePeriod
+    History = collections.deque(maxlen = MaxCycleLength * CycleRepeats)
+    Layouts = collections.deque(maxlen = MaxCycleLength * CycleRepeats)
+    State = None
+    while MaxPeriods is None or self.__TimePeriod - FirstPeriod < MaxPeriods:
+      if self.IsExtinct():
+        State = SteadyStates.Extinct
+      elif self.__IsSaturated() and len(Layouts) == Layouts.maxlen and Layouts.count(Layouts[-1]) == len(Layouts):
+        State = SteadyStates.Saturated
+      elif self.__FindCycle(History, MaxCycleLength, CycleRepeats) > 0:
+        State = SteadyStates.Cycle
+      if not State is None:
+        break
+      self.Step()
+      History.append(self.GetFingerprint())
+      Layouts.append(self.__GetLayoutFingerprint())
+    if State is None:
+      return None, None
+    ClassifiedAt = self.__TimePeriod
+    if Jump and not MaxPeriods is None:
+      self.Run(MaxPeriods - (self.__TimePeriod - FirstPeriod))
+    return State, ClassifiedAt
+
+  def GetFingerprint(self):
+    """
+    Hash of the aggregate state of the landscape, for spotting a run that has stopped changing or keeps repeating itself
+
+    Returns:
+      int: Hash of every warren's cell, rabbit count and whether it has spread, and every fox's cell
     """
-    Coordinate = int(input("  Input " + CoordinateName + " coordinate:"))
-    return Coordinate
-  
-  def __AdvanceTimePeriod(self):
+    Warrens = tuple((x, y, self.__GetWarren(x, y).GetRabbitCount(), self.__GetWarren(x, y).HasAlreadySpread()) for x, y in self.__WarrenLocations)
+    return hash((Warrens, tuple(sorted(self.__FoxLocations))))
+
+  def __GetLayoutFingerprint(self):
     """
-    Advances game by killing, destroying, aging, etc. Adapts to settings (self.__ShowDetail, Warren.Inspect(), etc)
+    Returns:
+      int: Hash of just the cells of every warren and fox, which only changes when one appears or dies
     """
-    NewFoxCount = 0
-    if self.__ShowDetail:
-      print()
-    for x in range (0, self.__LandscapeSize):
-      for y in range (0, self.__LandscapeSize):
-        if not self.__Landscape[x][y].Warren is None:
-          if self.__ShowDetail:
-            print("Warren at (", x, ",", y, "):", sep = "")
-            print("  Period Start: ", end = "")
-            self.__Landscape[x][y].Warren.Inspect()
+    return hash((tuple(self.__WarrenLocations), tuple(sorted(self.__FoxLocations))))
 
-          if self.__FoxCount > 0:
-            self.__FoxesEatRabbitsInWarren(x, y)
+  def __IsSaturated(self):
+    """
+    Returns:
+      bool: True if there are warrens but no foxes, and no warren can start a new one, either because they have all spread already or because there is no room left
+    """
+    if self.__FoxCount > 0 or self.__WarrenCount == 0:
+      return False
+    if self.__FreeWarrenCells.IsFull():
+      return True
+    return all(self.__GetWarren(x, y).HasAlreadySpread() for x, y in self.__WarrenLocations)
 
-          if self.__Landscape[x][y].Warren.NeedToCreateNewWarren():
-            self.__CreateNewWarren()
-          self.__Landscape[x][y].Warren.AdvanceGeneration(self.__ShowDetail)
+  def __FindCycle(self, History, MaxCycleLength, CycleRepeats):
+    """
+    Returns:
+      int: Length of the shortest cycle the last fingerprints in History have repeated CycleRepeats times, or 0 if there is none
+    """
+    for CycleLength in range (1, MaxCycleLength + 1):
+      Needed = CycleLength * CycleRepeats
+      if Needed > len(History):
+        break
+      if History[-1] != History[-1 - CycleLength]:
+        continue
+      if all(History[-i] == History[-i - CycleLength] for i in range (1, Needed - CycleLength + 1)):
+        return CycleLength
+    return 0
 
-          if self.__ShowDetail:
-            print("  Period End: ", end = "")
-            self.__Landscape[x][y].Warren.Inspect()
-            input()
-            
-          if self.__Landscape[x][y].Warren.WarrenHasDiedOut():
-            self.__Landscape[x][y].Warren = None
-            self.__WarrenCount -= 1
-    for x in range (0, self.__LandscapeSize):
-      for y in range (0, self.__LandscapeSize):
-        if not self.__Landscape[x][y].Fox is None:
-          if self.__ShowDetail:
-            print("Fox at (", x, ",", y, "): ", sep = "")
-          self.__Landscape[x][y].Fox.AdvanceGeneration(self.__ShowDetail)
-
-          if self.__Landscape[x][y].Fox.CheckIfDead():
-            self.__Landscape[x][y].Fox = None
-            self.__FoxCount -= 1
-          else:
-            if self.__Landscape[x][y].Fox.ReproduceThisPeriod():
-              if self.__ShowDetail:
-                print("  Fox has reproduced. ")
-              NewFoxCount += 1
-            if self.__ShowDetail:
-              self.__Landscape[x][y].Fox.Inspect()
-            self.__Landscape[x][y].Fox.ResetFoodConsumed()
+  def GetCheckpoint(self):
+    """
+    Serialises the whole simulation into a compact binary checkpoint, so it can be restored with FromCheckpoint
 
-    if NewFoxCount > 0:
-      if self.__ShowDetail:
-        print("New foxes born: ")
-      for f in range (0, NewFoxCount):
-        self.__CreateNewFox()
-    if self.__ShowDetail:
-      input()
-    self.__DrawLandscape()
-    print()
+    Note:
+      Everything is written as columns: one array per field, covering every warren, every rabbit (warren by warren, in list order) or every fox, rather than pickling the object graph.
+      The state of every random generator is saved with it, as is the simulation's AnimalIDs counter. Without a Seed, that means the random module's own state.
+      The settings new warrens and generators are made with are saved too: the warren capacity, the CompactionStrategy and the RandomBuffering mode. Only Warren warrens, with nothing but a CompactionStrategy and MaxRabbits bound into the WarrenType, can be saved, and a Fast RandomBuffering simulation can't be
 
-  def __CreateLandscapeAndAnimals(self, InitialWarrenCount, InitialFoxCount, FixedInitialLocations):
+    Returns:
+      bytes: The checkpoint
+    """
+    if self.__RandomBuffering == RandomBufferModes.Fast and not self.__Random is random:
+      raise TypeError("A simulation with Fast RandomBuffering can't be checkpointed, use Strict")
+    CompactionStrategy, WarrenCapacity = self.__GetCheckpointWarrenSettings()
+    Warrens = [self.__GetWarren(x, y) for x, y in self.__WarrenLocations]
+    for CurrentWarren in Warrens:
+      if not isinstance(CurrentWarren, Warren):
+        raise TypeError("Only Warren warrens can be checkpointed, not " + type(CurrentWarren).__name__)
+    Foxes = [self.__FoxLocations[Cell] for Cell in sorted(self.__FoxLocations)]
+    Seeded = not self.__Random is random
+    WarrenStates = [CurrentWarren._GetCheckpointState() for CurrentWarren in Warrens]
+    RabbitStates = [CurrentRabbit._GetCheckpointState() for State in WarrenStates for CurrentRabbit in State[4]]
+    FoxStates = [CurrentFox._GetCheckpointState() for CurrentFox in Foxes]
+    WarrenFreeList = self.__FreeWarrenCells.GetFreeList()
+    FoxFreeList = self.__FreeFoxCells.GetFreeList()
+    Settings = [self.__LandscapeSize, self.__Variability, self.__FixedInitialLocations, self.__SparseLandscape, self.__TimePeriod, self.__AnimalIDs.GetNextID(), Seeded, len(Warrens), len(RabbitStates), len(Foxes), WarrenFreeList is None, FoxFreeList is None, WarrenCapacity or 0, CompactionStrategy.value, self.__RandomBuffering.value]
+    Columns = [("q", Settings)]
+    Columns += self.__RandomStateColumns([self.__Random])
+    Columns.append(("i", WarrenFreeList or []))
+    Columns.append(("i", FoxFreeList or []))
+    Columns.append(("i", [x for x, y in self.__WarrenLocations]))
+    Columns.append(("i", [y for x, y in self.__WarrenLocations]))
+    Columns.append(("i", [CurrentWarren.GetRabbitCount() for CurrentWarren in Warrens]))
+    Columns.append(("i", [State[0] for State in WarrenStates]))
+    Columns.append(("b", [State[1] for State in WarrenStates]))
+    Columns.append(("b", [State[2].value for State in WarrenStates]))
+    Columns.append(("i", [State[5] for State in WarrenStates]))
+    Columns += self.__RandomStateColumns([State[3] for State in WarrenStates] if Seeded else [])
+    for Typecode, Field in zip("qiidbdb", range (0, 7)):
+      Columns.append((Typecode, [State[Field] for State in RabbitStates]))
+    Columns.append(("i", [x for x, y in sorted(self.__FoxLocations)]))
+    Columns.append(("i", [y for x, y in sorted(self.__FoxLocations)]))
+    for Typecode, Field in zip("qiidbii", range (0, 7)):
+      Columns.append((Typecode, [State[Field] for State in FoxStates]))
+    Columns += self.__RandomStateColumns([State[7] for State in FoxStates] if Seeded else [])
+    Parts = [struct.pack(self.__CHECKPOINT_HEADER, self.__CHECKPOINT_MAGIC, sys.byteorder == "little", self.__CHECKPOINT_VERSION, len(Columns))]
+    for Typecode, Values in Columns:
+      Column = array.array(Typecode, Values)
+      Parts.append(struct.pack("<cQ", Typecode.encode(), len(Column)))
+      Parts.append(Column.tobytes())
+    return b"".join(Parts)
+
+  def __GetCheckpointWarrenSettings(self):
+    """
+    Unpicks self.__WarrenType into the settings a checkpoint can rebuild it from
+
+    Returns:
+      tuple: (CompactionStrategy, MaxRabbits or None) new warrens are made with
+
+    Raises:
+      TypeError: If the WarrenType isn't Warren with at most a CompactionStrategy and MaxRabbits bound in
     """
-    Initiates the warrens and foxes and their respective locations
+    WarrenType = self.__WarrenType
+    Keywords = {}
+    while isinstance(WarrenType, functools.partial):
+      if WarrenType.args:
+        raise TypeError("Only a WarrenType with keyword arguments bound in can be checkpointed")
+      Keywords = dict(WarrenType.keywords, **Keywords)
+      WarrenType = WarrenType.func
+    if not WarrenType is Warren or not set(Keywords) <= {"CompactionStrategy", "MaxRabbits"}:
+      raise TypeError("Only Warren simulations can be checkpointed, with at most a CompactionStrategy and MaxRabbits bound in")
+    return Keywords.get("CompactionStrategy", CompactionStrategies.InPlace), Keywords.get("MaxRabbits")
+
+  def SaveCheckpoint(self, FileName):
+    """
+    Writes GetCheckpoint() to a file
 
     Args:
-      InitialWarrenCount (int): Number of warrens the user starts with
-      InitialFoxCount (int): Number of foxes to begin with
-      FixedInitialLocations (bool): Whether to initiate with non-random variables 
-    
-    Attributes:
-      __Landscape (list): Initialised Grid to place things on
+      FileName (str): File to write
     """
-    for x in range (0, self.__LandscapeSize):
-      for y in range (0, self.__LandscapeSize):
-        self.__Landscape[x][y] = Location()
-    if FixedInitialLocations:
-      self.__Landscape[1][1].Warren = Warren(self.__Variability, 38)
-      self.__Landscape[2][8].Warren = Warren(self.__Variability, 80) 
-      self.__Landscape[9][7].Warren = Warren(self.__Variability, 20)
-      self.__Landscape[10][3].Warren = Warren(self.__Variability, 52)
-      self.__Landscape[13][4].Warren = Warren(self.__Variability, 67)
-      self.__WarrenCount = 5
-      self.__Landscape[2][10].Fox = Fox(self.__Variability)
-      self.__Landscape[6][1].Fox = Fox(self.__Variability)
-      self.__Landscape[8][6].Fox = Fox(self.__Variability)
-      self.__Landscape[11][13].Fox = Fox(self.__Variability)
-      self.__Landscape[12][4].Fox = Fox(self.__Variability)
-      self.__FoxCount = 5
-    else:
-      for w in range (0, InitialWarrenCount):
-        self.__CreateNewWarren()
-      for f in range (0, InitialFoxCount):
-        self.__CreateNewFox()
+    with open(FileName, "wb") as CheckpointFile:
+      CheckpointFile.write(self.GetCheckpoint())
+
+  @classmethod
+  def LoadCheckpoint(cls, FileName, Seed = None, Renderer = None):
+    """
+    Reads a checkpoint file written by SaveCheckpoint, see FromCheckpoint
+
+    Args:
+      FileName (str): File to read
+      Seed (int, optional): Reseed every generator instead of restoring them (defaults to None)
+      Renderer (LandscapeRenderer, optional): Renderer for the restored simulation (defaults to a Full renderer of the whole landscape)
+
+    Returns:
+      Simulation: The restored simulation
+    """
+    with open(FileName, "rb") as CheckpointFile:
+      return cls.FromCheckpoint(CheckpointFile.read(), Seed, Renderer)
+
+  @classmethod
+  def IsSeededCheckpoint(cls, Data):
+    """
+    Tells you whether a checkpoint was made by a simulation with a Seed, without restoring it
+
+    Note:
+      Restoring a checkpoint made without a Seed, and without passing one, resets the random module, which every unseeded simulation in the process draws from
+
+    Args:
+      Data (bytes): A checkpoint
+
+    Returns:
+      bool: True if the checkpoint carries its own generators' states
+    """
+    Version, Columns = cls.__ReadCheckpointColumns(Data, 1)
+    return bool(Columns[0][6])
+
+  @classmethod
+  def __ReadCheckpointColumns(cls, Data, MaxColumns = None):
+    """
+    Checks a checkpoint's header and splits it into its columns
+
+    Args:
+      Data (bytes): A checkpoint
+      MaxColumns (int, optional): Stop after this many columns (defaults to reading them all)
+
+    Returns:
+      tuple: (Version, list of the array.array columns in the order they were written)
+
+    Raises:
+      ValueError: If Data isn't a checkpoint this version can read
+    """
+    Magic, LittleEndian, Version, ColumnCount = struct.unpack_from(cls.__CHECKPOINT_HEADER, Data)
+    if Magic != cls.__CHECKPOINT_MAGIC or not 1 <= Version <= cls.__CHECKPOINT_VERSION:
+      raise ValueError("Not a version 1 to " + str(cls.__CHECKPOINT_VERSION) + " simulation checkpoint")
+    if not MaxColumns is None:
+      ColumnCount = min(ColumnCount, MaxColumns)
+    Offset = struct.calcsize(cls.__CHECKPOINT_HEADER)
+    Columns = []
+    for Count in range (0, ColumnCount):
+      Typecode, Length = struct.unpack_from("<cQ", Data, Offset)
+      Offset += struct.calcsize("<cQ")
+      Column = array.array(Typecode.decode())
+      Column.frombytes(Data[Offset:Offset + Length * Column.itemsize])
+      Offset += Length * Column.itemsize
+      if LittleEndian != (sys.byteorder == "little"):
+        Column.byteswap()
+      Columns.append(Column)
+    return Version, Columns
+
+  @classmethod
+  def FromCheckpoint(cls, Data, Seed = None, Renderer = None):
+    """
+    Restores a simulation from GetCheckpoint(), headless and ready to Step()
+
+    Note:
+      With no Seed, every generator carries on exactly where it was saved, so the restored run replays the original draw for draw. For a checkpoint made without a Seed this means resetting the random module's state.
+      Passing a Seed instead gives the simulation and each of its warrens and foxes fresh generators from that seed, which is how to fork many different what-if branches from one warmed-up state.
+      The WarrenType is rebuilt as Warren with the saved CompactionStrategy and capacity, and the generators with the saved RandomBuffering mode. Interactive, Profiler and History aren't saved: the restored simulation is headless, unprofiled and unrecorded.
+      Version 1 checkpoints, from before warren capacity was saved, restore with the default capacity of 99. Version 1 and 2 checkpoints, from before the CompactionStrategy and RandomBuffering were saved, restore with InPlace and Off.
+      The restored simulation gets its own AnimalIDs counter from the saved one, moved on past any saved animal's ID, as checkpoints from before each simulation had its own counter saved the process-wide one
+
+    Args:
+      Data (bytes): A checkpoint
+      Seed (int, optional): Reseed every generator instead of restoring them (defaults to None)
+      Renderer (LandscapeRenderer, optional): Renderer for the restored simulation (defaults to a Full renderer of the whole landscape)
+
+    Returns:
+      Simulation: The restored simulation
+    """
+    Version, Columns = cls.__ReadCheckpointColumns(Data)
+    Columns.reverse()
+    Settings = list(Columns.pop())
+    if Version == 1:
+      Settings.append(0)
+    if Version <= 2:
+      Settings += [CompactionStrategies.InPlace.value, RandomBufferModes.Off.value]
+    LandscapeSize, Variability, FixedInitialLocations, SparseLandscape, TimePeriod, NextID, Seeded, WarrenCount, RabbitCount, FoxCount, WarrenListOff, FoxListOff, WarrenCapacity, CompactionStrategy, RandomBuffering = Settings
+    WarrenType = functools.partial(Warren, CompactionStrategy = CompactionStrategies(CompactionStrategy))
+    Restore = functools.partial(cls, LandscapeSize, 0, 0, Variability, False, Interactive = False, SparseLandscape = bool(SparseLandscape), WarrenType = WarrenType, Renderer = Renderer, WarrenCapacity = WarrenCapacity or None, RandomBuffering = RandomBufferModes(RandomBuffering))
+    SimulationState = cls.__RandomStatesFromColumns(Columns, 1)[0]
+    if Seed is None and Seeded:
+      Sim = Restore(Seed = 0)
+      Sim.__Random.setstate(SimulationState)
+    elif Seed is None:
+      Sim = Restore()
+      random.setstate(SimulationState)
+    else:
+      Sim = Restore(Seed = Seed)
+    Sim.__FixedInitialLocations = bool(FixedInitialLocations)
+    Sim.__TimePeriod = TimePeriod
+    WarrenFreeList = Columns.pop()
+    FoxFreeList = Columns.pop()
+    WarrenX, WarrenY, RabbitCounts, PeriodsRun, AlreadySpread, CompactionStrategy = [Columns.pop() for Count in range (0, 6)]
+    if Version == 1:
+      Capacities = [99] * WarrenCount
+    else:
+      Capacities = Columns.pop()
+    WarrenStates = cls.__RandomStatesFromColumns(Columns, WarrenCount if Seeded else 0)
+    RabbitColumns = [Columns.pop() for Count in range (0, 7)]
+    FoxX, FoxY = Columns.pop(), Columns.pop()
+    FoxColumns = [Columns.pop() for Count in range (0, 7)]
+    FoxStates = cls.__RandomStatesFromColumns(Columns, FoxCount if Seeded else 0)
+    Sim.__AnimalIDs = AnimalIDs(max(itertools.chain([NextID], [ID + 1 for ID in RabbitColumns[0]], [ID + 1 for ID in FoxColumns[0]])))
+    Rabbits = list(zip(*RabbitColumns))
+    FirstRabbit = 0
+    for w in range (0, WarrenCount):
+      if Seed is None and Seeded:
+        WarrenRandom = Sim.__MakeRandom(0)
+        WarrenRandom.setstate(WarrenStates[w])
+      else:
+        WarrenRandom = Sim.__NewChildRandom()
+      WarrenRabbits = [Rabbit._FromCheckpointState(*State, WarrenRandom) for State in Rabbits[FirstRabbit:FirstRabbit + RabbitCounts[w]]]
+      FirstRabbit += RabbitCounts[w]
+      Sim.__AddWarren(WarrenX[w], WarrenY[w], Warren._FromCheckpointState(Variability, PeriodsRun[w], bool(AlreadySpread[w]), CompactionStrategies(CompactionStrategy[w]), WarrenRandom, WarrenRabbits, Capacities[w], Sim.__AnimalIDs))
+    for f, State in enumerate(zip(*FoxColumns)):
+      if Seed is None and Seeded:
+        FoxRandom = Sim.__MakeRandom(0)
+        FoxRandom.setstate(FoxStates[f])
+      else:
+        FoxRandom = Sim.__NewChildRandom()
+      Sim.__AddFox(FoxX[f], FoxY[f], Fox._FromCheckpointState(*State, FoxRandom))
+    Sim.__WarrenCount = WarrenCount
+    Sim.__FoxCount = FoxCount
+    Sim.__FreeWarrenCells.SetFreeList(None if WarrenListOff else list(WarrenFreeList))
+    Sim.__FreeFoxCells.SetFreeList(None if FoxListOff else list(FoxFreeList))
+    return Sim
+
+  def __RandomStateColumns(self, Randoms):
+    """
+    Args:
+      Randoms (list): random.Random generators, or the random module
+
+    Returns:
+      list: Two columns, every generator's Mersenne Twister state words one after another, then each one's cached gauss value (NaN if none)
+    """
+    Words = []
+    Gausses = []
+    for Rng in Randoms:
+      Version, State, Gauss = Rng.getstate()
+      Words.extend(State)
+      Gausses.append(math.nan if Gauss is None else Gauss)
+    return [("I", Words), ("d", Gausses)]
+
+  @classmethod
+  def __RandomStatesFromColumns(cls, Columns, Count):
+    """
+    Pops the two columns written by __RandomStateColumns
+
+    Returns:
+      list: Count saved generator states, as taken by random.Random.setstate
+    """
+    Words = Columns.pop()
+    Gausses = Columns.pop()
+    States = []
+    StateLength = len(Words) // max(1, len(Gausses))
+    for r in range (0, Count):
+      Gauss = Gausses[r]
+      States.append((3, tuple(Words[r * StateLength:(r + 1) * StateLength]), None if math.isnan(Gauss) else Gauss))
+    return States
+
+  def Draw(self, Renderer = None):
+    """
+    Draws the landscape with this simulation's renderer, e.g. between Step() calls
+
+    Args:
+      Renderer (LandscapeRenderer, optional): Draw through this renderer instead, e.g. one writing into a StringIO
+    """
+    if Renderer is None:
+      self.__DrawLandscape()
+    else:
+      Renderer.Draw(self.__TimePeriod, self.__GetCellText)
+
+  def IsExtinct(self):
+    """
+    True once there are no warrens and no foxes left, which is when the menu loop stops
+
+    Returns:
+      bool: True if both warrens and foxes have died out, otherwise False
+    """
+    return self.__WarrenCount == 0 and self.__FoxCount == 0
+
+  def GetTimePeriod(self):
+    """Getter for self.__TimePeriod"""
+    return self.__TimePeriod
+
+  def GetLandscapeSize(self):
+    """Getter for self.__LandscapeSize"""
+    return self.__LandscapeSize
+
+  def GetWarrenCount(self):
+    """Getter for self.__WarrenCount"""
+    return self.__WarrenCount
+
+  def GetFoxCount(self):
+    """Getter for self.__FoxCount"""
+    return self.__FoxCount
+
+  def GetRabbitCount(self):
+    """
+    Returns:
+      int: Number of rabbits across every warren
+    """
+    return sum(self.__GetWarren(x, y).GetRabbitCount() for x, y in self.__WarrenLocations)
+
+  def GetWarrenRabbitCounts(self):
+    """
+    Returns:
+      list: (x, y, RabbitCount) of every warren, in landscape scan order
+    """
+    return [(x, y, self.__GetWarren(x, y).GetRabbitCount()) for x, y in self.__WarrenLocations]
+
+  def GetPredationOffsets(self):
+    """
+    Returns:
+      list: Copy of self.__PredationOffsets, (dx, dy, PercentToEat) for every cell a fox can hunt a warren from
+    """
+    return list(self.__PredationOffsets)
+
+  def GetPeriodMetrics(self):
+    """
+    Aggregate figures for the last time period, for feeding into the sinks in metrics.py
+
+    Returns:
+      dict: A value for each name in METRIC_FIELDS. Populations are counted at the end of the period, everything else is what happened during it
+    """
+    Metrics = {"TimePeriod": self.__TimePeriod, "Rabbits": self.GetRabbitCount(), "Warrens": self.__WarrenCount, "Foxes": self.__FoxCount}
+    Metrics.update(self.__PeriodCounts)
+    return Metrics
+
+  def StreamMetrics(self, MaxPeriods = None):
+    """
+    Advances the simulation headlessly one period at a time, lazily yielding that period's metrics, until everything dies out
+
+    Args:
+      MaxPeriods (int, optional): Stop after this many periods (defaults to no limit)
+
+    Yields:
+      dict: GetPeriodMetrics() after each period
+    """
+    PeriodsRun = 0
+    while not self.IsExtinct() and (MaxPeriods is None or PeriodsRun < MaxPeriods):
+      self.Step()
+      PeriodsRun += 1
+      yield self.GetPeriodMetrics()
+
+  def FindAnimal(self, ID):
+    """
+    Looks up a living fox or rabbit by its ID, through the ID indexes instead of scanning every warren
+
+    Note:
+      Rabbits never leave the warren they were born into, so the rabbit index only needs the cell each run of IDs was born in, and is kept up to date as rabbits are born rather than rebuilt every period. The rabbit's position is then found in that one warren, and if the warren there now is a newer one, the ID just isn't in it
+
+    Args:
+      ID (int): Animal ID, as shown by Inspect()
+
+    Returns:
+      dict: Type ("Fox" or "Rabbit"), x and y of its cell, then the animal's GetRecord() fields, or None if no living animal has that ID
+    """
+    Cell = self.__FoxIDs.get(ID)
+    if not Cell is None and self.__FoxLocations[Cell].GetID() == ID:
+      Record = {"Type": "Fox", "x": Cell[0], "y": Cell[1]}
+      Record.update(self.__FoxLocations[Cell].GetRecord())
+      return Record
+    RabbitRanges = self.__GetRabbitRanges()
+    Range = bisect.bisect_right(RabbitRanges, (ID, math.inf)) - 1
+    if Range < 0 or ID >= RabbitRanges[Range][1]:
+      return None
+    FirstID, EndID, x, y = RabbitRanges[Range]
+    CurrentWarren = self.__GetWarren(x, y)
+    if CurrentWarren is None:
+      return None
+    IDs = CurrentWarren.GetRabbitIDs()
+    if not ID in IDs:
+      return None
+    Position = IDs.index(ID)
+    Record = {"Type": "Rabbit", "x": x, "y": y}
+    Record.update(next(CurrentWarren.GetRabbitRecords(Position, Position + 1)))
+    return Record
+
+  def QueryWarrens(self, Offset = 0, Limit = None):
+    """
+    Pages through the warrens from the most rabbits to the fewest, so QueryWarrens(0, k) is the top k
+
+    Note:
+      Like all the Query methods this is a generator, so records are only made as they are asked for. Fetch a page between periods, as the records follow the simulation if it is stepped part way through
+      The ranking is sorted on the first call in a period and reused until the next. Nearly every warren's count changes every period, so keeping it sorted as they change would cost more than one sort of the warrens, which is far smaller than the rabbits
+
+    Args:
+      Offset (int, optional): Number of warrens to skip (defaults to 0)
+      Limit (int, optional): Most warrens to return (defaults to all of them)
+
+    Yields:
+      dict: x, y, Rabbits and AlreadySpread of each warren, with ties in landscape scan order
+    """
+    if self.__WarrenRanking is None:
+      self.__WarrenRanking = sorted(self.__WarrenLocations, key = lambda Cell: -self.__GetWarren(Cell[0], Cell[1]).GetRabbitCount())
+    for x, y in self.__Page(self.__WarrenRanking, Offset, Limit):
+      CurrentWarren = self.__GetWarren(x, y)
+      yield {"x": x, "y": y, "Rabbits": CurrentWarren.GetRabbitCount(), "AlreadySpread": CurrentWarren.HasAlreadySpread()}
+
+  def QueryFoxes(self, Offset = 0, Limit = None):
+    """
+    Pages through the foxes in landscape scan order
+
+    Args:
+      Offset (int, optional): Number of foxes to skip (defaults to 0)
+      Limit (int, optional): Most foxes to return (defaults to all of them)
+
+    Yields:
+      dict: x and y of each fox, then its Fox.GetRecord() fields
+    """
+    for x, y in self.__Page(self.__FoxOrder, Offset, Limit):
+      Record = {"x": x, "y": y}
+      Record.update(self.__FoxLocations[(x, y)].GetRecord())
+      yield Record
+
+  def QueryRabbits(self, x, y, Offset = 0, Limit = None):
+    """
+    Pages through the rabbits in the warren at (x, y), like option 4's rabbit list but without printing every one
+
+    Args:
+      x (int): Warren x coordinate
+      y (int): Warren y coordinate
+      Offset (int, optional): Number of rabbits to skip (defaults to 0)
+      Limit (int, optional): Most rabbits to return (defaults to all of them)
+
+    Yields:
+      dict: The warren's GetRabbitRecords() (one per cohort for CohortWarren), or nothing if there is no warren there
+
+    Raises:
+      ValueError: If Offset or Limit is negative, like the other Query methods
+    """
+    if Offset < 0 or (not Limit is None and Limit < 0):
+      raise ValueError("Offset and Limit can't be negative")
+    if not (0 <= x < self.__LandscapeSize and 0 <= y < self.__LandscapeSize):
+      return
+    CurrentWarren = self.__GetWarren(x, y)
+    if CurrentWarren is None:
+      return
+    yield from CurrentWarren.GetRabbitRecords(Offset, None if Limit is None else Offset + Limit)
+
+  def __Page(self, Items, Offset, Limit):
+    """
+    Returns:
+      iterator: Items from Offset, at most Limit of them
+    """
+    return itertools.islice(Items, Offset, None if Limit is None else Offset + Limit)
+
+  def __InvalidateIndexes(self):
+    """
+    Drops the warren ranking, after anything that may have changed the warrens' rabbit counts
+    """
+    self.__WarrenRanking = None
+
+  def __GetRabbitRanges(self):
+    """
+    Returns:
+      list: self.__RabbitRanges, built from the living warrens' rabbit IDs if there isn't one
+    """
+    if self.__RabbitRanges is None:
+      self.__RabbitRanges = []
+      for x, y in self.__WarrenLocations:
+        self.__RabbitRanges.extend((FirstID, EndID, x, y) for FirstID, EndID in self.__GetIDRuns(self.__GetWarren(x, y).GetRabbitIDs()))
+      self.__RabbitRanges.sort()
+      self.__RabbitRangesBuilt = len(self.__RabbitRanges)
+    return self.__RabbitRanges
+
+  def __GetIDRuns(self, IDs):
+    """
+    Returns:
+      list: (FirstID, EndID) of each run of consecutive IDs among IDs
+    """
+    Runs = []
+    for ID in sorted(IDs):
+      if len(Runs) > 0 and Runs[-1][1] == ID:
+        Runs[-1][1] = ID + 1
+      else:
+        Runs.append([ID, ID + 1])
+    return [tuple(Run) for Run in Runs]
+
+  def __IndexRabbits(self, CurrentWarren, Start, x, y):
+    """
+    Adds the rabbits from position Start on in the warren at (x, y), which have just been born or placed there, to the rabbit index, if there is one
+
+    Note:
+      The IDs are read back from the warren rather than guessed from the simulation's counter, and as new IDs normally come after every ID in the index each run is an append. The index only ever grows, so once it is twice the size it was built at, with the rabbits that have died since still in it, it is dropped for FindAnimal to rebuild from the living rabbits
+    """
+    if self.__RabbitRanges is None:
+      return
+    for FirstID, EndID in self.__GetIDRuns(CurrentWarren.GetRabbitIDs(Start)):
+      if len(self.__RabbitRanges) > 0 and FirstID < self.__RabbitRanges[-1][1]:
+        bisect.insort(self.__RabbitRanges, (FirstID, EndID, x, y))
+      else:
+        self.__RabbitRanges.append((FirstID, EndID, x, y))
+    if len(self.__RabbitRanges) > 2 * self.__RabbitRangesBuilt + 64:
+      self.__RabbitRanges = None
+
+  def __InputCoordinate(self, CoordinateName):
+    """
+    Takes an input co-ordinate and processes it as an int
+
+    Note:
+      Validation needed: 0 < CoordinateName < (self.__LandscapeSize - 1)
+
+    Args:
+      CoordinateName (str): Requires string 'x' or 'y'
+    
+    Attributes:
+      Coordinate (int): User-inputted coordinate value
+    
+    Returns:
+      int: Specified coordinate value
+    """
+    Coordinate = int(input("  Input " + CoordinateName + " coordinate:"))
+    return Coordinate
+  
+  def __AdvanceTimePeriod(self):
+    """
+    Advances game by killing, destroying, aging, etc. Adapts to settings (self.__ShowDetail, Warren.Inspect(), etc)
+
+    Note:
+      Only pauses for input() when self.__ShowDetail is set, and never draws the landscape - that is left to the caller.
+      Warrens are visited in x-then-y order by stepping through self.__WarrenLocations, so a warren created further along during the loop is still advanced this period, exactly like a full landscape scan
+
+    Attributes:
+      WarrenLocation (tuple): (x, y) of the warren being advanced, used to find the next one
+    """
+    NewFoxCount = 0
+    self.__InvalidateIndexes()
+    PeriodCounts = dict.fromkeys(self.METRIC_FIELDS[4:], 0)
+    self.__PeriodCounts = PeriodCounts
+    Profiler = self.__Profiler
+    if not Profiler is None:
+      Profiler.StartPeriod(self.__TimePeriod, self.__AnimalIDs)
+    if self.__ShowDetail:
+      print()
+    WarrenLocation = (-1, -1)
+    while True:
+      NextWarren = bisect.bisect_right(self.__WarrenLocations, WarrenLocation)
+      if NextWarren == len(self.__WarrenLocations):
+        break
+      WarrenLocation = self.__WarrenLocations[NextWarren]
+      x, y = WarrenLocation
+      CurrentWarren = self.__GetWarren(x, y)
+      if self.__ShowDetail:
+        print("Warren at (", x, ",", y, "):", sep = "")
+        print("  Period Start: ", end = "")
+        CurrentWarren.Inspect()
+
+      if not Profiler is None:
+        PhaseStart = Profiler.StartPhase()
+      if self.__FoxCount > 0:
+        self.__FoxesEatRabbitsInWarren(x, y)
+      if not Profiler is None:
+        PhaseStart = Profiler.EndPhase("Predation", PhaseStart)
+
+      if CurrentWarren.NeedToCreateNewWarren():
+        if self.__CreateNewWarren():
+          PeriodCounts["WarrensCreated"] += 1
+      if not Profiler is None:
+        PhaseStart = Profiler.EndPhase("WarrenSpread", PhaseStart)
+      CurrentWarren.AdvanceGeneration(self.__ShowDetail)
+      KilledByOtherFactors, DiedOfOldAge, Born = CurrentWarren.GetLastGenerationCounts()
+      if Born > 0:
+        self.__IndexRabbits(CurrentWarren, CurrentWarren.GetRabbitCount() - Born, x, y)
+      if not Profiler is None:
+        PhaseStart = Profiler.EndPhase("WarrenGeneration", PhaseStart)
+      PeriodCounts["RabbitsKilledByOtherFactors"] += KilledByOtherFactors
+      PeriodCounts["RabbitsDiedOfOldAge"] += DiedOfOldAge
+      PeriodCounts["RabbitsBorn"] += Born
+
+      if self.__ShowDetail:
+        print("  Period End: ", end = "")
+        CurrentWarren.Inspect()
+        input()
+
+      if not Profiler is None:
+        PhaseStart = Profiler.StartPhase()
+      if CurrentWarren.WarrenHasDiedOut():
+        self.__RemoveWarren(x, y)
+        self.__WarrenCount -= 1
+        PeriodCounts["WarrensDiedOut"] += 1
+      if not Profiler is None:
+        Profiler.EndPhase("WarrenRemoval", PhaseStart)
+    if not Profiler is None:
+      PhaseStart = Profiler.StartPhase()
+    for x, y in list(self.__FoxOrder):
+      CurrentFox = self.__FoxLocations[(x, y)]
+      if self.__ShowDetail:
+        print("Fox at (", x, ",", y, "): ", sep = "")
+      CurrentFox.AdvanceGeneration(self.__ShowDetail)
+
+      if CurrentFox.CheckIfDead():
+        self.__RemoveFox(x, y)
+        self.__FoxCount -= 1
+        PeriodCounts["Foxes" + CurrentFox.GetCauseOfDeath().name] += 1
+      else:
+        if CurrentFox.ReproduceThisPeriod():
+          if self.__ShowDetail:
+            print("  Fox has reproduced. ")
+          NewFoxCount += 1
+        if self.__ShowDetail:
+          CurrentFox.Inspect()
+        CurrentFox.ResetFoodConsumed()
+    if not Profiler is None:
+      PhaseStart = Profiler.EndPhase("FoxGeneration", PhaseStart)
+
+    if NewFoxCount > 0:
+      if self.__ShowDetail:
+        print("New foxes born: ")
+      for f in range (0, NewFoxCount):
+        if self.__CreateNewFox():
+          PeriodCounts["FoxesBorn"] += 1
+    if not Profiler is None:
+      Profiler.EndPhase("FoxBirths", PhaseStart)
+    if not self.__History is None:
+      self.__History.Record(self)
+    if self.__ShowDetail:
+      input()
+
+  def __CreateLandscapeAndAnimals(self, InitialWarrenCount, InitialFoxCount, FixedInitialLocations):
+    """
+    Initiates the warrens and foxes and their respective locations
+
+    Args:
+      InitialWarrenCount (int): Number of warrens the user starts with
+      InitialFoxCount (int): Number of foxes to begin with
+      FixedInitialLocations (bool): Whether to initiate with non-random variables 
+    
+    Attributes:
+      __Landscape (list): Initialised Grid to place things on
+    """
+    if not self.__SparseLandscape:
+      for x in range (0, self.__LandscapeSize):
+        for y in range (0, self.__LandscapeSize):
+          self.__Landscape[x][y] = Location()
+    if FixedInitialLocations:
+      self.__AddWarren(1, 1, self.__WarrenType(self.__Variability, 38, Rng = self.__NewChildRandom(), IDs = self.__AnimalIDs))
+      self.__AddWarren(2, 8, self.__WarrenType(self.__Variability, 80, Rng = self.__NewChildRandom(), IDs = self.__AnimalIDs))
+      self.__AddWarren(9, 7, self.__WarrenType(self.__Variability, 20, Rng = self.__NewChildRandom(), IDs = self.__AnimalIDs))
+      self.__AddWarren(10, 3, self.__WarrenType(self.__Variability, 52, Rng = self.__NewChildRandom(), IDs = self.__AnimalIDs))
+      self.__AddWarren(13, 4, self.__WarrenType(self.__Variability, 67, Rng = self.__NewChildRandom(), IDs = self.__AnimalIDs))
+      self.__WarrenCount = 5
+      self.__AddFox(2, 10, Fox(self.__Variability, self.__NewChildRandom(), self.__AnimalIDs))
+      self.__AddFox(6, 1, Fox(self.__Variability, self.__NewChildRandom(), self.__AnimalIDs))
+      self.__AddFox(8, 6, Fox(self.__Variability, self.__NewChildRandom(), self.__AnimalIDs))
+      self.__AddFox(11, 13, Fox(self.__Variability, self.__NewChildRandom(), self.__AnimalIDs))
+      self.__AddFox(12, 4, Fox(self.__Variability, self.__NewChildRandom(), self.__AnimalIDs))
+      self.__FoxCount = 5
+    else:
+      for w in range (0, InitialWarrenCount):
+        self.__CreateNewWarren()
+      for f in range (0, InitialFoxCount):
+        self.__CreateNewFox()
+
+  def __CreateNewWarren(self):
+    """
+    Initiates another warren at random coordinates
+    
+    Attributes:
+      x (int)
+      y (int)
+
+    Returns:
+      bool: True if the warren was placed, False if every cell already has a warren
+    """
+    Cell = self.__FreeWarrenCells.ChooseFreeCell()
+    if Cell is None:
+      if self.__ShowDetail:
+        print("No room for a new warren, the landscape is full")
+      return False
+    x, y = Cell
+    if self.__ShowDetail:
+      print("New Warren at (", x, ",", y, ")", sep = "")
+    self.__AddWarren(x, y, self.__WarrenType(self.__Variability, Rng = self.__NewChildRandom(), IDs = self.__AnimalIDs))
+    self.__WarrenCount += 1
+    return True
+  
+  def __CreateNewFox(self):
+    """
+    Initiates another fox at random coordinates
+
+    Returns:
+      bool: True if the fox was placed, False if every cell already has a fox
+    """
+    Cell = self.__FreeFoxCells.ChooseFreeCell()
+    if Cell is None:
+      if self.__ShowDetail:
+        print("  No room for a new fox, the landscape is full")
+      return False
+    x, y = Cell
+    if self.__ShowDetail:
+      print("  New Fox at (", x, ",", y, ")", sep = "")
+    self.__AddFox(x, y, Fox(self.__Variability, self.__NewChildRandom(), self.__AnimalIDs))
+    self.__FoxCount += 1
+    return True
+
+  def __NewChildRandom(self):
+    """
+    Returns:
+      random.Random: A generator for one new warren or fox, seeded from self.__Random, or the random module itself when no Seed was given. With Fast RandomBuffering it's self.__Random itself, as that stream can't be replayed anyway, and one shared buffer is cheaper than one per animal
+    """
+    if self.__Random is random:
+      return random
+    if self.__RandomBuffering == RandomBufferModes.Fast and self.__Profiler is None:
+      return self.__Random
+    return self.__MakeRandom(self.__Random.getrandbits(64))
+
+  def __MakeRandom(self, Seed):
+    """
+    Returns:
+      random.Random: A generator seeded with Seed, counting its draws if profiling, otherwise buffered as self.__RandomBuffering says
+    """
+    if not self.__Profiler is None:
+      return CountingRandom(Seed, self.__Profiler)
+    if self.__RandomBuffering == RandomBufferModes.Off:
+      return random.Random(Seed)
+    if self.__RandomBuffering == RandomBufferModes.Strict:
+      return BufferedRandom(Seed)
+    return BufferedRandom(Seed, False, CachedRanges = ((0, 100), (0, self.__Variability * 2)))
+
+  def __GetLocation(self, x, y):
+    """
+    Finds the Location object for a cell
+
+    Args:
+      x (int): Cell x coordinate
+      y (int): Cell y coordinate
+
+    Returns:
+      Location: The cell's Location, or None for an empty cell of a sparse landscape
+    """
+    if self.__SparseLandscape:
+      return self.__Landscape.get((x, y))
+    return self.__Landscape[x][y]
+
+  def __GetOrCreateLocation(self, x, y):
+    """
+    Like __GetLocation, but creates the Location first if a sparse landscape doesn't store one yet
+
+    Returns:
+      Location: The cell's Location
+    """
+    if self.__SparseLandscape:
+      CellLocation = self.__Landscape.get((x, y))
+      if CellLocation is None:
+        CellLocation = Location()
+        self.__Landscape[(x, y)] = CellLocation
+      return CellLocation
+    return self.__Landscape[x][y]
+
+  def __ForgetLocationIfEmpty(self, x, y):
+    """
+    Drops the Location for a cell from a sparse landscape once it holds neither a warren nor a fox
+    """
+    if self.__SparseLandscape:
+      CellLocation = self.__Landscape[(x, y)]
+      if CellLocation.Warren is None and CellLocation.Fox is None:
+        del self.__Landscape[(x, y)]
+
+  def __GetWarren(self, x, y):
+    """
+    Returns:
+      Warren: The warren at (x, y), or None
+    """
+    CellLocation = self.__GetLocation(x, y)
+    if CellLocation is None:
+      return None
+    return CellLocation.Warren
+
+  def __GetFox(self, x, y):
+    """
+    Returns:
+      Fox: The fox at (x, y), or None
+    """
+    return self.__FoxLocations.get((x, y))
+
+  def __AddWarren(self, x, y, NewWarren):
+    """
+    Places a warren on the landscape and records its cell in self.__WarrenLocations
+
+    Args:
+      x (int): Warren x coordinate
+      y (int): Warren y coordinate
+      NewWarren (Warren): Warren to place
+    """
+    self.__GetOrCreateLocation(x, y).Warren = NewWarren
+    bisect.insort(self.__WarrenLocations, (x, y))
+    self.__FreeWarrenCells.Take(x, y)
+    self.__InvalidateIndexes()
+    self.__IndexRabbits(NewWarren, 0, x, y)
+
+  def __RemoveWarren(self, x, y):
+    """
+    Removes a (dead) warren from the landscape and from self.__WarrenLocations
+
+    Args:
+      x (int): Warren x coordinate
+      y (int): Warren y coordinate
+    """
+    self.__GetLocation(x, y).Warren = None
+    del self.__WarrenLocations[bisect.bisect_left(self.__WarrenLocations, (x, y))]
+    self.__FreeWarrenCells.Release(x, y)
+    self.__ForgetLocationIfEmpty(x, y)
+    self.__InvalidateIndexes()
+
+  def __AddFox(self, x, y, NewFox):
+    """
+    Places a fox on the landscape and records it in the fox indexes
+
+    Args:
+      x (int): Fox x coordinate
+      y (int): Fox y coordinate
+      NewFox (Fox): Fox to place
+    """
+    self.__GetOrCreateLocation(x, y).Fox = NewFox
+    self.__FoxLocations[(x, y)] = NewFox
+    self.__FoxIDs[NewFox.GetID()] = (x, y)
+    bisect.insort(self.__FoxOrder, (x, y))
+    self.__FreeFoxCells.Take(x, y)
+
+  def __RemoveFox(self, x, y):
+    """
+    Removes a (dead) fox from the landscape and from the fox indexes
+
+    Args:
+      x (int): Fox x coordinate
+      y (int): Fox y coordinate
+    """
+    ID = self.__FoxLocations[(x, y)].GetID()
+    if self.__FoxIDs.get(ID) == (x, y):
+      del self.__FoxIDs[ID]
+    del self.__FoxLocations[(x, y)]
+    self.__GetLocation(x, y).Fox = None
+    del self.__FoxOrder[bisect.bisect_left(self.__FoxOrder, (x, y))]
+    self.__FreeFoxCells.Release(x, y)
+    self.__ForgetLocationIfEmpty(x, y)
+
+  def __FoxesEatRabbitsInWarren(self, WarrenX, WarrenY):
+    """
+    Kills rabbits near foxes
+
+    Note:
+      Only the cells in self.__PredationOffsets are looked up in the fox index, rather than scanning the whole landscape
+
+    Args:
+      WarrenX (int): Given Warren x coordinate
+      WarrenY (int): Given Warren y coordinate
+    
+    Attributes:
+      RabbitCountAtStartOfPeriod (int): um
+      PercentToEat (int): What percent of the warren the fox will, um, consume
+      RabbitsToEat (int): Number of rabbits ready to face death
+      FoodConsumed (int): RabbitsToEat if RabbitsToEat < RabbitCount
+    """
+    PreyWarren = self.__GetWarren(WarrenX, WarrenY)
+    RabbitCountAtStartOfPeriod = PreyWarren.GetRabbitCount()
+    for OffsetX, OffsetY, PercentToEat in self.__PredationOffsets:
+      FoxX = WarrenX + OffsetX
+      FoxY = WarrenY + OffsetY
+      HungryFox = self.__FoxLocations.get((FoxX, FoxY))
+      if not HungryFox is None:
+        RabbitsToEat = int(round(float(PercentToEat * RabbitCountAtStartOfPeriod / 100)))
+        FoodConsumed = PreyWarren.EatRabbits(RabbitsToEat)
+        HungryFox.GiveFood(FoodConsumed)
+        self.__PeriodCounts["RabbitsEaten"] += FoodConsumed
+        if self.__ShowDetail:
+          print("  ", FoodConsumed, " rabbits eaten by fox at (", FoxX, ",", FoxY, ").", sep = "")
+
+  @staticmethod
+  def CalculatePredationOffsets():
+    """
+    Builds the table of cells a fox can hunt a warren from, so predation only has to look up nearby cells instead of scanning the whole landscape
+
+    Note:
+      Sorted by dx then dy, so foxes are visited in the same x-then-y order as a full landscape scan. Foxes further than 7 away eat nothing, so they are left out.
+      It doesn't depend on any simulation, so anything else doing predation, e.g. a tile of a TiledSimulation, can build the same table without making one
+
+    Attributes:
+      Dist (float): Distance between the fox cell and the warren
+      PercentToEat (int): 20 within 3.5 cells, 10 within 7 cells
+
+    Returns:
+      list: (dx, dy, PercentToEat) tuples
+    """
+    Offsets = []
+    for OffsetX in range (-7, 8):
+      for OffsetY in range (-7, 8):
+        Dist = Simulation.__DistanceBetween(OffsetX, OffsetY, 0, 0)
+        if Dist <= 3.5:
+          Offsets.append((OffsetX, OffsetY, 20))
+        elif Dist <= 7:
+          Offsets.append((OffsetX, OffsetY, 10))
+    return Offsets
+
+  @staticmethod
+  def __DistanceBetween(x1, y1, x2, y2):
+    """
+    Calculates the distance between two objects at the given coordinates
+
+    Args:
+      x1 (int): First object's x coordinate
+      y1 (int): First object's y coordinate
+      x1 (int): Second object's x coordinate
+      y2 (int): Second object's y coordinate
+    
+    Returns:
+      int: returns the square root of (x1 - x2)^2 added to (y1 - y2)^2
+    """
+    return math.sqrt((pow(x1 - x2, 2) + pow(y1 - y2, 2)))
+
+  def __DrawLandscape(self):
+    """
+    Pretty-prints a representation of the current state of the Landscape, battleships-style, through self.__Renderer
+    """
+    if self.__Profiler is None:
+      self.__Renderer.Draw(self.__TimePeriod, self.__GetCellText)
+    else:
+      Start = self.__Profiler.StartPhase()
+      self.__Renderer.Draw(self.__TimePeriod, self.__GetCellText)
+      self.__Profiler.EndPhase("Drawing", Start)
+
+  def __GetCellText(self, x, y):
+    """
+    Returns:
+      str: The warren's rabbit count right-aligned in 2 characters (blank if no warren), then F if a fox is there
+    """
+    CurrentWarren = self.__GetWarren(x, y)
+    if not CurrentWarren is None:
+      CellText = str(CurrentWarren.GetRabbitCount()).rjust(2)
+    else:
+      CellText = "  "
+    if not self.__GetFox(x, y) is None:
+      return CellText + "F"
+    return CellText + " "
+
+class CompactionStrategies(enum.Enum):
+  """
+  Ways Warren can close the gaps left in its rabbit list after a death phase
+
+  Attributes:
+    Shift (enum): The original Corpse Compactor - shifts survivors left with nested while loops
+    InPlace (enum): Rebuilds the survivor prefix in one pass, keeping the same order as Shift
+    SwapWithLast (enum): Fills each gap with the last living rabbit, so only as many rabbits move as died, but the order changes
+  """
+  Shift = 1
+  InPlace = 2
+  SwapWithLast = 3
+
+class Warren:
+  """
+  Warren class creates a building for rabbits to live in, aka a "warren"
+
+  Note:
+    To pick a CompactionStrategy for a whole Simulation, pass e.g. functools.partial(Warren, CompactionStrategy = CompactionStrategies.SwapWithLast) as its WarrenType
+
+  Args:
+      Variability (int): Something to do with chance/randomness in Warrens
+      RabbitCount (int, optional): Number of Rabbits initially in Warren (defaults to 0)
+      CompactionStrategy (CompactionStrategies, optional): How dead rabbits are removed from __Rabbits (defaults to InPlace, which gives the same results as the original Shift)
+      Rng (random.Random, optional): Generator used by the warren and handed to its rabbits (defaults to the random module)
+      MaxRabbits (int, optional): Hard limit on warren population size (defaults to 99). RabbitCount is capped at it
+      IDs (AnimalIDs, optional): Where its rabbits' IDs come from, usually the simulation's (defaults to Animal._SharedIDs)
+
+  Attributes:
+      __MAX_RABBITS_IN_WARREN (int): Hard limit on warren population size
+      __RabbitCount (int): Number of Rabbits initially in Warren, always len(__Rabbits)
+      __PeriodsRun (int): iterator counter for periods
+      __LastGenerationCounts (list): Rabbits killed by other factors, died of old age and born in the last AdvanceGeneration
+      __AlreadySpread (bool): Whether the warren contains the maximum amount of rabbits already
+      __Variability (int): Something to do with chance/randomness in Warrens
+      __Rabbits (list): The living rabbits (Rabbit class instances) in the warren. It only holds as many as are alive, growing as babies are appended and cut back after deaths, so a small warren doesn't carry room for __MAX_RABBITS_IN_WARREN
+      __CompactionStrategy (CompactionStrategies)
+      __Random (random.Random)
+      __AnimalIDs (AnimalIDs)
+  """
+  def __init__(self, Variability, RabbitCount = 0, CompactionStrategy = CompactionStrategies.InPlace, Rng = None, MaxRabbits = 99, IDs = None):
+    if Rng is None:
+      Rng = random
+    if IDs is None:
+      IDs = Animal._SharedIDs
+    self.__Random = Rng
+    self.__AnimalIDs = IDs
+    self.__MAX_RABBITS_IN_WARREN = MaxRabbits
+    self.__CompactionStrategy = CompactionStrategy
+    self.__RabbitCount = min(RabbitCount, MaxRabbits)
+    self.__PeriodsRun = 0
+    self.__LastGenerationCounts = [0, 0, 0]
+    self.__AlreadySpread = False
+    self.__Variability = Variability
+    if self.__RabbitCount == 0:
+      self.__RabbitCount = int(self.__CalculateRandomValue(int(self.__MAX_RABBITS_IN_WARREN / 4), self.__Variability))
+    self.__Rabbits = [Rabbit(self.__Variability, Rng = self.__Random, IDs = self.__AnimalIDs) for r in range (0, self.__RabbitCount)]
+
+  def __CalculateRandomValue(self, BaseValue, Variability):
+    """
+    Calculates a pseudo-random value for Variability
+
+    Args:
+      BaseValue (int): ???
+      Variability (int): Something to do with chance/randomness in Warrens
+    
+    Returns:
+      int: random value based on BaseValue and Variability
+    """
+    return BaseValue - (BaseValue * Variability / 100) + (BaseValue * self.__Random.randint(0, Variability * 2) / 100)
+
+  def _GetCheckpointState(self):
+    """
+    Returns:
+      tuple: (PeriodsRun, AlreadySpread, CompactionStrategy, Random, living Rabbits, MaxRabbits) for Simulation.GetCheckpoint
+    """
+    return (self.__PeriodsRun, self.__AlreadySpread, self.__CompactionStrategy, self.__Random, list(self.__Rabbits), self.__MAX_RABBITS_IN_WARREN)
+
+  @classmethod
+  def _FromCheckpointState(cls, Variability, PeriodsRun, AlreadySpread, CompactionStrategy, Rng, Rabbits, MaxRabbits = 99, IDs = None):
+    """
+    Rebuilds a warren for Simulation.FromCheckpoint without drawing any random numbers
+
+    Returns:
+      Warren: The restored warren
+    """
+    RestoredWarren = cls.__new__(cls)
+    RestoredWarren.__Random = Rng
+    RestoredWarren.__AnimalIDs = Animal._SharedIDs if IDs is None else IDs
+    RestoredWarren.__MAX_RABBITS_IN_WARREN = MaxRabbits
+    RestoredWarren.__CompactionStrategy = CompactionStrategy
+    RestoredWarren.__RabbitCount = len(Rabbits)
+    RestoredWarren.__PeriodsRun = PeriodsRun
+    RestoredWarren.__LastGenerationCounts = [0, 0, 0]
+    RestoredWarren.__AlreadySpread = AlreadySpread
+    RestoredWarren.__Variability = Variability
+    RestoredWarren.__Rabbits = Rabbits
+    return RestoredWarren
+
+  def GetRabbitCount(self): 
+    """
+    Getter for private variable self.__RabbitCount
+    
+    Returns:
+      int: value of self.__RabbitCount
+    """
+    return self.__RabbitCount
+  
+  def HasAlreadySpread(self):
+    """
+    Getter for private variable self.__AlreadySpread
+
+    Returns:
+      bool: True once this warren has reached capacity and tried to start a new warren
+    """
+    return self.__AlreadySpread
+
+  def NeedToCreateNewWarren(self): 
+    """
+    Tells you if you need to make a new warren (if you haven't hit max rabbits)
+    
+    Returns:
+      bool: If a new Warren is requied
+    """
+    if self.__RabbitCount == self.__MAX_RABBITS_IN_WARREN and not self.__AlreadySpread:
+      self.__AlreadySpread = True
+      return True
+    else:
+      return False
+    
+  def GetLastGenerationCounts(self):
+    """
+    Returns:
+      tuple: (KilledByOtherFactors, DiedOfOldAge, Born) rabbit counts from the last AdvanceGeneration
+    """
+    return tuple(self.__LastGenerationCounts)
+
+  def WarrenHasDiedOut(self):
+    """
+    Getter for private variable self.__RabbitCount, with a twist - returns True if any rabbits exist. A weird alternative to `if(GetRabbitCount() > 0)`
+    
+    Returns:
+      bool: True if any rabbits are still alive
+    """
+    if self.__RabbitCount == 0:
+      return True
+    else:
+      return False
+
+  def AdvanceGeneration(self, ShowDetail):
+    """
+    Advances rabbits by, um, killing them
+
+    Note:
+      Could be simplified into one if/else with a nested if for ln 408
+    """
+    self.__PeriodsRun += 1
+    self.__LastGenerationCounts = [0, 0, 0]
+    if self.__RabbitCount > 0:
+      self.__KillByOtherFactors(ShowDetail)
+    if self.__RabbitCount > 0:
+      self.__AgeRabbits(ShowDetail)
+    if self.__RabbitCount > 0 and self.__RabbitCount <= self.__MAX_RABBITS_IN_WARREN:
+      if self.__ContainsMales():
+        self.__MateRabbits(ShowDetail)
+    if self.__RabbitCount == 0 and ShowDetail:
+      print("  All rabbits in warren are dead")
+    
+  def EatRabbits(self, RabbitsToEat):
+    """
+    Brutally destroys rabbits
+
+    Note:
+      Victims are drawn without replacement in one go with sample, so this costs O(RabbitsToEat) however much of the warren is eaten, instead of retrying whenever it picks a rabbit that is already dead
+
+    Args:
+      RabbitsToEat (int): Number of Rabbits to 'eat'
+
+    Attributes:
+      RabbitsToEat (int): Clone of self.RabbitsToEat to manipulate
+      RabbitNumber (int): Randomly chosen number used as the index in the self.__Rabbits list to pick for murder
+    
+    Returns:
+      int: kinda useless, just the same as self.RabbitsToEat
+    """
+    if RabbitsToEat > self.__RabbitCount:
+      RabbitsToEat = self.__RabbitCount
+    for RabbitNumber in self.__Random.sample(range(self.__RabbitCount), RabbitsToEat):
+      self.__Rabbits[RabbitNumber] = None
+    self.__CompressRabbitList(RabbitsToEat)
+    return RabbitsToEat
+
+  def __KillByOtherFactors(self, ShowDetail):
+    """
+    Massacres rabbits for other reasons
+
+    Args:
+      ShowDetail (bool): config option - whether to print what's going on
+
+    Attributes:
+      DeathCount (int): Iterator counter for rabbits murdered
+    """
+    DeathCount = 0
+    for r in range (0, self.__RabbitCount):
+      if self.__Rabbits[r].CheckIfKilledByOtherFactor():
+        self.__Rabbits[r] = None
+        DeathCount += 1
+    self.__CompressRabbitList(DeathCount)
+    self.__LastGenerationCounts[0] = DeathCount
+    if ShowDetail:
+      print(" ", DeathCount, "rabbits killed by other factors.")
+
+  def __AgeRabbits(self, ShowDetail):
+    DeathCount = 0
+    for r in range (0, self.__RabbitCount):
+      self.__Rabbits[r].CalculateNewAge()
+      if self.__Rabbits[r].CheckIfDead():
+        self.__Rabbits[r] = None
+        DeathCount += 1
+    self.__CompressRabbitList(DeathCount)
+    self.__LastGenerationCounts[1] = DeathCount
+    if ShowDetail:
+      print(" ", DeathCount, "rabbits die of old age.")
+
+  def __MateRabbits(self, ShowDetail):
+    """
+    Creates young rabbits
+
+    Note:
+      The males are listed once up front and each female's mate is drawn straight from that list, so picking a mate never has to retry.
+      Babies are appended to __Rabbits, which is amortised O(1) per birth
+
+    Args:
+      ShowDetail (bool): config option - whether to print what's going on
+
+    Attributes:
+      Males (list): Indexes of the male rabbits alive at the start of mating
+      Mate (int): Randomly chosen male Rabbit
+      Babies (int): Iterative counter for how many rabbits are born
+    """
+    Males = [m for m in range (0, self.__RabbitCount) if not self.__Rabbits[m].IsFemale()]
+    Mate = 0
+    Babies = 0 
+    for r in range (0, self.__RabbitCount):
+      if self.__Rabbits[r].IsFemale() and self.__RabbitCount + Babies < self.__MAX_RABBITS_IN_WARREN:
+        Mate = Males[self.__Random.randint(0, len(Males) - 1)]
+        CombinedReproductionRate = (self.__Rabbits[r].GetReproductionRate() + self.__Rabbits[Mate].GetReproductionRate()) / 2
+        if CombinedReproductionRate >= 1:
+          self.__Rabbits.append(Rabbit(self.__Variability, CombinedReproductionRate, self.__Random, self.__AnimalIDs))
+          Babies += 1
+    self.__RabbitCount = self.__RabbitCount + Babies
+    self.__LastGenerationCounts[2] = Babies
+    if ShowDetail:
+      print(" ", Babies, "baby rabbits born.")
+
+  def __CompressRabbitList(self, DeathCount):
+    """
+    A.K.A Corpse Compactor, removes dead rabbits when DeathCount > 0, using self.__CompactionStrategy
+
+    Note:
+      Every strategy leaves the living rabbits in __Rabbits[0:__RabbitCount], and the dead slots after them are then cut off. Cutting a list to under half its allocation makes Python shrink it, so memory follows the warren down after a mass die-off
+
+    Args:
+      DeathCount (int): Number of dead Rabbits
+    """
+    if DeathCount > 0:
+      if self.__CompactionStrategy == CompactionStrategies.InPlace:
+        self.__CompressRabbitListInPlace(DeathCount)
+      elif self.__CompactionStrategy == CompactionStrategies.SwapWithLast:
+        self.__CompressRabbitListSwapWithLast(DeathCount)
+      else:
+        self.__CompressRabbitListShift(DeathCount)
+      del self.__Rabbits[self.__RabbitCount:]
+
+  def __CompressRabbitListShift(self, DeathCount):
+    """
+    The original compactor: shifts every survivor left over the gaps
+
+    Attributes:
+      ShiftFrom (int): ???
+      ShiftTo (int): ???
+    """
+    ShiftTo = 0
+    ShiftFrom  = 0
+    while ShiftTo < self.__RabbitCount - DeathCount:
+      while self.__Rabbits[ShiftFrom] is None:
+        ShiftFrom += 1
+      if ShiftTo != ShiftFrom:
+        self.__Rabbits[ShiftTo] = self.__Rabbits[ShiftFrom]
+      ShiftTo += 1
+      ShiftFrom += 1
+    self.__RabbitCount = self.__RabbitCount - DeathCount
+
+  def __CompressRabbitListInPlace(self, DeathCount):
+    """
+    Rebuilds the survivor prefix in a single pass, keeping the rabbits in the same order as the Shift strategy
+    """
+    Survivors = [r for r in self.__Rabbits[0:self.__RabbitCount] if not r is None]
+    self.__Rabbits[0:self.__RabbitCount] = Survivors + [None] * DeathCount
+    self.__RabbitCount = self.__RabbitCount - DeathCount
+
+  def __CompressRabbitListSwapWithLast(self, DeathCount):
+    """
+    Moves the last living rabbit into each gap, working inwards from both ends
+
+    Attributes:
+      Gap (int): Index of the next dead slot from the front
+      Last (int): Index of the last living rabbit
+    """
+    Gap = 0
+    Last = self.__RabbitCount - 1
+    while True:
+      while Gap < Last and not self.__Rabbits[Gap] is None:
+        Gap += 1
+      while Last > Gap and self.__Rabbits[Last] is None:
+        Last -= 1
+      if Gap >= Last:
+        break
+      self.__Rabbits[Gap] = self.__Rabbits[Last]
+      self.__Rabbits[Last] = None
+    self.__RabbitCount = self.__RabbitCount - DeathCount
+
+  def __ContainsMales(self):
+    """
+    True if any male rabbits are still alive
+
+    Returns:
+      bool: True if any male rabbits exist, otherwise False
+    """
+    for r in range (0, self.__RabbitCount):
+      if not self.__Rabbits[r].IsFemale():
+        return True
+    return False
+
+  def Inspect(self):
+    """
+    Prints how many times the game has advanced, with the number of rabbits still alive.
+    """
+    print("Periods Run", self.__PeriodsRun, "Size", self.__RabbitCount)
+
+  def ListRabbits(self):
+    """
+    Lists details of each rabbit if there are any rabbits still alive
+    """
+    if self.__RabbitCount > 0:
+      for r in range (0, self.__RabbitCount):
+        self.__Rabbits[r].Inspect()
+
+  def GetRabbitIDs(self, Start = 0, Stop = None):
+    """
+    Args:
+      Start (int, optional): Index of the first rabbit (defaults to 0)
+      Stop (int, optional): Index after the last rabbit (defaults to the end)
+
+    Returns:
+      list: ID of each living rabbit from Start up to Stop
+    """
+    return [CurrentRabbit.GetID() for CurrentRabbit in self.__Rabbits[Start:Stop]]
+
+  def GetRabbitRecords(self, Start = 0, Stop = None):
+    """
+    Structured version of ListRabbits(), made one record at a time
+
+    Args:
+      Start (int, optional): Index of the first rabbit (defaults to 0)
+      Stop (int, optional): Index after the last rabbit (defaults to the end)
+
+    Yields:
+      dict: Rabbit.GetRecord() of each living rabbit from Start up to Stop
+    """
+    if Stop is None or Stop > self.__RabbitCount:
+      Stop = self.__RabbitCount
+    for r in range (Start, Stop):
+      yield self.__Rabbits[r].GetRecord()
+
+class ArrayWarren:
+  """
+  ArrayWarren is a drop-in alternative to Warren that keeps its rabbits as parallel NumPy arrays instead of Rabbit objects, so each lifecycle phase is one vectorised mask or draw
+
+  Note:
+    Follows the same rules as Warren, but draws its random numbers in blocks from its own NumPy generator, so seeded runs are statistically equivalent to Warren rather than identical.
+    The generator is seeded from Rng, so a seeded Simulation (or random.seed()) still makes runs repeatable
+
+  Args:
+      Variability (int): Something to do with chance/randomness in Warrens
+      RabbitCount (int, optional): Number of Rabbits initially in Warren (defaults to 0)
+      Rng (random.Random, optional): Seeds the warren's NumPy generator (defaults to the random module)
+      MaxRabbits (int, optional): Hard limit on warren population size (defaults to 99). RabbitCount is capped at it
+      IDs (AnimalIDs, optional): Where its rabbits' IDs come from, usually the simulation's (defaults to Animal._SharedIDs)
+
+  Attributes:
+      __MAX_RABBITS_IN_WARREN (int): Hard limit on warren population size
+      __RabbitCount (int): Number of Rabbits currently in Warren
+      __PeriodsRun (int): iterator counter for periods
+      __LastGenerationCounts (list): Rabbits killed by other factors, died of old age and born in the last AdvanceGeneration
+      __AlreadySpread (bool): Whether the warren contains the maximum amount of rabbits already
+      __Variability (int): Something to do with chance/randomness in Warrens
+      __Generator (numpy.random.Generator): Source of every random draw made by this warren
+      __AnimalIDs (AnimalIDs): Where new rabbits' IDs come from
+      __IDs (numpy.ndarray): Animal ID of each rabbit
+      __Ages (numpy.ndarray): Age of each rabbit
+      __NaturalLifespans (numpy.ndarray): How long each rabbit lives
+      __ProbabilitiesOfDeathOtherCauses (numpy.ndarray): Each rabbit's probability of death from other causes
+      __ReproductionRates (numpy.ndarray): Each rabbit's reproduction rate
+      __Genders (numpy.ndarray): Genders value of each rabbit
+  """
+  __DEFAULT_LIFE_SPAN = 4
+  __DEFAULT_PROBABILITY_DEATH_OTHER_CAUSES = 0.05
+
+  def __init__(self, Variability, RabbitCount = 0, Rng = None, MaxRabbits = 99, IDs = None):
+    if numpy is None:
+      raise ImportError("ArrayWarren needs NumPy installed")
+    if Rng is None:
+      Rng = random
+    if IDs is None:
+      IDs = Animal._SharedIDs
+    self.__AnimalIDs = IDs
+    self.__MAX_RABBITS_IN_WARREN = MaxRabbits
+    self.__RabbitCount = min(RabbitCount, MaxRabbits)
+    self.__PeriodsRun = 0
+    self.__LastGenerationCounts = [0, 0, 0]
+    self.__AlreadySpread = False
+    self.__Variability = Variability
+    self.__Generator = numpy.random.default_rng(Rng.getrandbits(64))
+    if self.__RabbitCount == 0:
+      self.__RabbitCount = int(self.__CalculateRandomValues(int(self.__MAX_RABBITS_IN_WARREN / 4), 1)[0])
+    self.__IDs = numpy.empty(0, dtype = numpy.int64)
+    self.__Ages = numpy.empty(0, dtype = numpy.int64)
+    self.__NaturalLifespans = numpy.empty(0, dtype = numpy.int64)
+    self.__ProbabilitiesOfDeathOtherCauses = numpy.empty(0)
+    self.__ReproductionRates = numpy.empty(0)
+    self.__Genders = numpy.empty(0, dtype = numpy.int8)
+    self.__AddRabbits(numpy.full(self.__RabbitCount, 1.2))
+
+  def __CalculateRandomValues(self, BaseValue, Count):
+    """
+    Vectorised version of Warren.__CalculateRandomValue
+
+    Args:
+      BaseValue (int): ???
+      Count (int): How many values to draw
+
+    Returns:
+      numpy.ndarray: Count random values based on BaseValue and self.__Variability
+    """
+    Draws = self.__Generator.integers(0, self.__Variability * 2, size = Count, endpoint = True)
+    return BaseValue - (BaseValue * self.__Variability / 100) + (BaseValue * Draws / 100)
+
+  def __AddRabbits(self, ParentsReproductionRates):
+    """
+    Appends one new rabbit per parents' reproduction rate, drawing lifespans, death probabilities, reproduction rates and genders the same way Rabbit.__init__ does
+
+    Args:
+      ParentsReproductionRates (numpy.ndarray): Reproduction rate passed on to each new rabbit
+    """
+    Count = len(ParentsReproductionRates)
+    if Count == 0:
+      return
+    FirstID = self.__AnimalIDs.Take(Count)
+    self.__IDs = numpy.concatenate((self.__IDs, numpy.arange(FirstID, FirstID + Count, dtype = numpy.int64)))
+    self.__Ages = numpy.concatenate((self.__Ages, numpy.zeros(Count, dtype = numpy.int64)))
+    NewNaturalLifespans = (self.__DEFAULT_LIFE_SPAN * self.__CalculateRandomValues(100, Count) / 100).astype(numpy.int64)
+    self.__NaturalLifespans = numpy.concatenate((self.__NaturalLifespans, NewNaturalLifespans))
+    NewProbabilitiesOfDeath = self.__DEFAULT_PROBABILITY_DEATH_OTHER_CAUSES * self.__CalculateRandomValues(100, Count) / 100
+    self.__ProbabilitiesOfDeathOtherCauses = numpy.concatenate((self.__ProbabilitiesOfDeathOtherCauses, NewProbabilitiesOfDeath))
+    NewReproductionRates = ParentsReproductionRates * self.__CalculateRandomValues(100, Count) / 100
+    self.__ReproductionRates = numpy.concatenate((self.__ReproductionRates, NewReproductionRates))
+    NewGenders = numpy.where(self.__Generator.integers(0, 100, size = Count, endpoint = True) < 50, Genders.Male.value, Genders.Female.value).astype(numpy.int8)
+    self.__Genders = numpy.concatenate((self.__Genders, NewGenders))
+
+  def __KeepRabbits(self, Survivors):
+    """
+    Drops every rabbit not selected by Survivors, keeping the rest in order
+
+    Args:
+      Survivors (numpy.ndarray): Boolean mask over the current rabbits
+
+    Returns:
+      int: Number of rabbits dropped
+    """
+    self.__IDs = self.__IDs[Survivors]
+    self.__Ages = self.__Ages[Survivors]
+    self.__NaturalLifespans = self.__NaturalLifespans[Survivors]
+    self.__ProbabilitiesOfDeathOtherCauses = self.__ProbabilitiesOfDeathOtherCauses[Survivors]
+    self.__ReproductionRates = self.__ReproductionRates[Survivors]
+    self.__Genders = self.__Genders[Survivors]
+    DeathCount = self.__RabbitCount - len(self.__IDs)
+    self.__RabbitCount = len(self.__IDs)
+    return DeathCount
+
+  def GetRabbitCount(self):
+    """
+    Getter for private variable self.__RabbitCount
+
+    Returns:
+      int: value of self.__RabbitCount
+    """
+    return self.__RabbitCount
+
+  def HasAlreadySpread(self):
+    """
+    Getter for private variable self.__AlreadySpread
+
+    Returns:
+      bool: True once this warren has reached capacity and tried to start a new warren
+    """
+    return self.__AlreadySpread
+
+  def NeedToCreateNewWarren(self):
+    """
+    Tells you if you need to make a new warren (if you haven't hit max rabbits)
+
+    Returns:
+      bool: If a new Warren is requied
+    """
+    if self.__RabbitCount == self.__MAX_RABBITS_IN_WARREN and not self.__AlreadySpread:
+      self.__AlreadySpread = True
+      return True
+    else:
+      return False
+
+  def GetLastGenerationCounts(self):
+    """
+    Returns:
+      tuple: (KilledByOtherFactors, DiedOfOldAge, Born) rabbit counts from the last AdvanceGeneration
+    """
+    return tuple(self.__LastGenerationCounts)
+
+  def WarrenHasDiedOut(self):
+    """
+    Returns:
+      bool: True if there are no rabbits left
+    """
+    return self.__RabbitCount == 0
+
+  def AdvanceGeneration(self, ShowDetail):
+    """
+    Advances rabbits through the same phases as Warren.AdvanceGeneration
+    """
+    self.__PeriodsRun += 1
+    self.__LastGenerationCounts = [0, 0, 0]
+    if self.__RabbitCount > 0:
+      self.__KillByOtherFactors(ShowDetail)
+    if self.__RabbitCount > 0:
+      self.__AgeRabbits(ShowDetail)
+    if self.__RabbitCount > 0 and self.__RabbitCount <= self.__MAX_RABBITS_IN_WARREN:
+      if self.__ContainsMales():
+        self.__MateRabbits(ShowDetail)
+    if self.__RabbitCount == 0 and ShowDetail:
+      print("  All rabbits in warren are dead")
+
+  def EatRabbits(self, RabbitsToEat):
+    """
+    Removes RabbitsToEat rabbits chosen uniformly at random without replacement
+
+    Args:
+      RabbitsToEat (int): Number of Rabbits to 'eat'
+
+    Returns:
+      int: Number of rabbits actually eaten
+    """
+    if RabbitsToEat > self.__RabbitCount:
+      RabbitsToEat = self.__RabbitCount
+    if RabbitsToEat > 0:
+      Survivors = numpy.ones(self.__RabbitCount, dtype = bool)
+      Survivors[self.__Generator.choice(self.__RabbitCount, RabbitsToEat, replace = False)] = False
+      self.__KeepRabbits(Survivors)
+    return RabbitsToEat
+
+  def __KillByOtherFactors(self, ShowDetail):
+    """
+    One draw per rabbit, compared against every rabbit's probability of death at once
+    """
+    Draws = self.__Generator.integers(0, 100, size = self.__RabbitCount, endpoint = True)
+    DeathCount = self.__KeepRabbits(Draws >= self.__ProbabilitiesOfDeathOtherCauses * 100)
+    self.__LastGenerationCounts[0] = DeathCount
+    if ShowDetail:
+      print(" ", DeathCount, "rabbits killed by other factors.")
+
+  def __AgeRabbits(self, ShowDetail):
+    self.__Ages += 1
+    DeathCount = self.__KeepRabbits(self.__Ages < self.__NaturalLifespans)
+    self.__LastGenerationCounts[1] = DeathCount
+    if ShowDetail:
+      print(" ", DeathCount, "rabbits die of old age.")
+
+  def __MateRabbits(self, ShowDetail):
+    """
+    Pairs every female with a randomly chosen male and adds a baby for each pair whose combined reproduction rate is at least 1, until the warren is full
+
+    Attributes:
+      Mates (numpy.ndarray): Index of the male chosen for each female
+      Babies (int): How many rabbits are born
+    """
+    Females = numpy.flatnonzero(self.__Genders == Genders.Female.value)
+    Males = numpy.flatnonzero(self.__Genders == Genders.Male.value)
+    Mates = Males[self.__Generator.integers(0, len(Males), size = len(Females))]
+    CombinedReproductionRates = (self.__ReproductionRates[Females] + self.__ReproductionRates[Mates]) / 2
+    CombinedReproductionRates = CombinedReproductionRates[CombinedReproductionRates >= 1][:self.__MAX_RABBITS_IN_WARREN - self.__RabbitCount]
+    Babies = len(CombinedReproductionRates)
+    self.__AddRabbits(CombinedReproductionRates)
+    self.__RabbitCount = self.__RabbitCount + Babies
+    self.__LastGenerationCounts[2] = Babies
+    if ShowDetail:
+      print(" ", Babies, "baby rabbits born.")
 
-  def __CreateNewWarren(self):
+  def __ContainsMales(self):
     """
-    Initiates another warren at random coordinates
-    
-    Attributes:
-      x (int)
-      y (int)
+    Returns:
+      bool: True if any male rabbits exist, otherwise False
     """
-    x = random.randint(0, self.__LandscapeSize - 1)
-    y = random.randint(0, self.__LandscapeSize - 1)
-    while not self.__Landscape[x][y].Warren is None:
-      x = random.randint(0, self.__LandscapeSize - 1)
-      y = random.randint(0, self.__LandscapeSize - 1)
-    if self.__ShowDetail:
-      print("New Warren at (", x, ",", y, ")", sep = "")
-    self.__Landscape[x][y].Warren = Warren(self.__Variability)
-    self.__WarrenCount += 1
-  
-  def __CreateNewFox(self):
-    x = random.randint(0, self.__LandscapeSize - 1)
-    y = random.randint(0, self.__LandscapeSize - 1)
-    while not self.__Landscape[x][y].Fox is None:
-      x = random.randint(0, self.__LandscapeSize - 1)
-      y = random.randint(0, self.__LandscapeSize - 1)
-    if self.__ShowDetail:
-      print("  New Fox at (", x, ",", y, ")", sep = "")
-    self.__Landscape[x][y].Fox = Fox(self.__Variability)
-    self.__FoxCount += 1
+    return bool((self.__Genders == Genders.Male.value).any())
 
-  def __FoxesEatRabbitsInWarren(self, WarrenX, WarrenY):
+  def Inspect(self):
     """
-    Kills rabbits near foxes
-
-    Args:
-      WarrenX (int): Given Warren x coordinate
-      WarrenY (int): Given Warren y coordinate
-    
-    Attributes:
-      RabbitCountAtStartOfPeriod (int): um
-      Dist (int): Distance between the fox and the warren
-      PercentToEat (int): What percent of the warren the fox will, um, consume
-      RabbitsToEat (int): Number of rabbits ready to face death
-      FoodConsumed (int): RabbitsToEat if RabbitsToEat < RabbitCount
+    Prints how many times the game has advanced, with the number of rabbits still alive.
     """
-    RabbitCountAtStartOfPeriod = self.__Landscape[WarrenX][WarrenY].Warren.GetRabbitCount()
-    for FoxX in range(0, self.__LandscapeSize):
-      for FoxY in range (0, self.__LandscapeSize):
-        if not self.__Landscape[FoxX][FoxY].Fox is None:
-          Dist = self.__DistanceBetween(FoxX, FoxY, WarrenX, WarrenY)
-          if Dist <= 3.5:
-            PercentToEat = 20
-          elif Dist <= 7:
-            PercentToEat = 10
-          else:
-            PercentToEat = 0
-          RabbitsToEat = int(round(float(PercentToEat * RabbitCountAtStartOfPeriod / 100)))
-          FoodConsumed = self.__Landscape[WarrenX][WarrenY].Warren.EatRabbits(RabbitsToEat)
-          self.__Landscape[FoxX][FoxY].Fox.GiveFood(FoodConsumed)
-          if self.__ShowDetail:
-            print("  ", FoodConsumed, " rabbits eaten by fox at (", FoxX, ",", FoxY, ").", sep = "")
+    print("Periods Run", self.__PeriodsRun, "Size", self.__RabbitCount)
 
-  def __DistanceBetween(self, x1, y1, x2, y2):
+  def ListRabbits(self):
     """
-    Calculates the distance between two objects at the given coordinates
+    Lists details of each rabbit in the same format as Rabbit.Inspect()
+    """
+    for r in range (0, self.__RabbitCount):
+      print("  ID", self.__IDs[r], "", end = "")
+      print("Age", self.__Ages[r], "", end = "")
+      print("LS", self.__NaturalLifespans[r], "", end = "")
+      print("Pr dth", round(float(self.__ProbabilitiesOfDeathOtherCauses[r]), 2), "", end = "")
+      print("Rep rate", round(float(self.__ReproductionRates[r]), 1), "", end = "")
+      if self.__Genders[r] == Genders.Female.value:
+        print("Gender Female")
+      else:
+        print("Gender Male")
 
+  def GetRabbitIDs(self, Start = 0, Stop = None):
+    """
     Args:
-      x1 (int): First object's x coordinate
-      y1 (int): First object's y coordinate
-      x1 (int): Second object's x coordinate
-      y2 (int): Second object's y coordinate
-    
+      Start (int, optional): Index of the first rabbit (defaults to 0)
+      Stop (int, optional): Index after the last rabbit (defaults to the end)
+
     Returns:
-      int: returns the square root of (x1 - x2)^2 added to (y1 - y2)^2
+      list: ID of each living rabbit from Start up to Stop
     """
-    return math.sqrt((pow(x1 - x2, 2) + pow(y1 - y2, 2)))
+    return self.__IDs[:self.__RabbitCount][Start:Stop].tolist()
 
-  def __DrawLandscape(self):
+  def GetRabbitRecords(self, Start = 0, Stop = None):
     """
-    Pretty-prints a representation of the current state of the Landscape, battleships-style
+    Structured version of ListRabbits(), with the same fields as Rabbit.GetRecord()
+
+    Args:
+      Start (int, optional): Index of the first rabbit (defaults to 0)
+      Stop (int, optional): Index after the last rabbit (defaults to the end)
+
+    Yields:
+      dict: One record per living rabbit from Start up to Stop
     """
-    print()
-    print("TIME PERIOD:", self.__TimePeriod)
-    print()
-    print("   ", end = "")
-    for x in range (0, self.__LandscapeSize):
-      if x < 10:
-        print(" ", end = "")
-      print(x, "|", end = "")
-    print()
-    for x in range (0, self.__LandscapeSize * 4 + 3):
-      print("-", end = "")
-    print()
-    for y in range (0, self.__LandscapeSize):
-      if y < 10:
-        print(" ", end = "")
-      print("", y, "|", sep = "", end = "")
-      for x in range (0, self.__LandscapeSize):
-        if not self.__Landscape[x][y].Warren is None:
-          if self.__Landscape[x][y].Warren.GetRabbitCount() < 10:
-            print(" ", end = "")
-          print(self.__Landscape[x][y].Warren.GetRabbitCount(), end = "")
-        else:
-          print("  ", end = "")
-        if not self.__Landscape[x][y].Fox is None:
-          print("F", end = "")
-        else:
-          print(" ", end = "")
-        print("|", end = "")
-      print()
+    if Stop is None or Stop > self.__RabbitCount:
+      Stop = self.__RabbitCount
+    for r in range (Start, Stop):
+      yield {"ID": int(self.__IDs[r]), "Age": int(self.__Ages[r]), "NaturalLifespan": int(self.__NaturalLifespans[r]), "ProbabilityOfDeathOtherCauses": float(self.__ProbabilitiesOfDeathOtherCauses[r]), "ReproductionRate": float(self.__ReproductionRates[r]), "Gender": Genders(int(self.__Genders[r])).name}
 
-class Warren:
+class CohortWarren:
   """
-  Warren class creates a building for rabbits to live in, aka a "warren"
+  CohortWarren is a drop-in alternative to Warren for very large warrens. Instead of one object per rabbit it keeps a count of rabbits for every (age, gender, reproduction rate bucket) cohort, so its memory and the cost of a period depend on the number of buckets rather than the number of rabbits
+
+  Note:
+    Each phase follows the same rules as Warren, but works on whole cohorts:
+      deaths from other causes are a binomial draw per cohort,
+      ageing shifts the age histogram along one year, with old age deaths drawn from the chance of a rabbit's natural lifespan running out at that age,
+      each female bucket's females are shared out between the male buckets with one multinomial draw, and babies are added in aggregate.
+    Differences in each rabbit's probability of death from other causes are folded into their average, reproduction rates are rounded to the middle of their bucket, and rabbits have no individual IDs.
+    To use cohorts for a whole Simulation, pass e.g. functools.partial(CohortWarren, MaxRabbits = 50000) as its WarrenType
 
   Args:
       Variability (int): Something to do with chance/randomness in Warrens
       RabbitCount (int, optional): Number of Rabbits initially in Warren (defaults to 0)
+      MaxRabbits (int, optional): Hard limit on warren population size (defaults to 99, like Warren). RabbitCount is capped at it
+      Rng (random.Random, optional): Seeds the warren's NumPy generator (defaults to the random module)
+      IDs (AnimalIDs, optional): Accepted so CohortWarren can stand in for Warren, but unused as its rabbits have no IDs
 
   Attributes:
       __MAX_RABBITS_IN_WARREN (int): Hard limit on warren population size
-      __RabbitCount (int): Number of Rabbits initially in Warren
+      __RabbitCount (int): Number of Rabbits currently in Warren
       __PeriodsRun (int): iterator counter for periods
+      __LastGenerationCounts (list): Rabbits killed by other factors, died of old age and born in the last AdvanceGeneration
       __AlreadySpread (bool): Whether the warren contains the maximum amount of rabbits already
       __Variability (int): Something to do with chance/randomness in Warrens
-      __Rabbits (list): List of objects (Rabbit class instances) associated with warren 
+      __Generator (numpy.random.Generator): Source of every random draw made by this warren
+      __Cohorts (numpy.ndarray): Number of rabbits for each [age, gender, reproduction rate bucket]
+      __VariabilityMultipliers (numpy.ndarray): Every value _CalculateRandomValue(100, Variability) / 100 can take, all equally likely
+      __AgeingHazards (numpy.ndarray): Chance a rabbit of each age dies of old age when it next ages
+      __ProbabilityOfDeathOtherCauses (float): Average chance a rabbit is killed by other factors in a period
   """
-  def __init__(self, Variability, RabbitCount = 0):
-    self.__MAX_RABBITS_IN_WARREN = 99
-    self.__RabbitCount = RabbitCount
+  __DEFAULT_LIFE_SPAN = 4
+  __DEFAULT_PROBABILITY_DEATH_OTHER_CAUSES = 0.05
+  __MALE = 0
+  __FEMALE = 1
+  __PROBABILITY_MALE = 50 / 101
+  __RATE_BUCKET_WIDTH = 0.02
+  __RATE_BUCKET_COUNT = 250
+
+  def __init__(self, Variability, RabbitCount = 0, MaxRabbits = 99, Rng = None, IDs = None):
+    if numpy is None:
+      raise ImportError("CohortWarren needs NumPy installed")
+    if Rng is None:
+      Rng = random
+    self.__MAX_RABBITS_IN_WARREN = MaxRabbits
+    self.__RabbitCount = min(RabbitCount, MaxRabbits)
     self.__PeriodsRun = 0
+    self.__LastGenerationCounts = [0, 0, 0]
     self.__AlreadySpread = False
     self.__Variability = Variability
-    self.__Rabbits = []
-    for Count in range(0, self.__MAX_RABBITS_IN_WARREN):
-      self.__Rabbits.append(None)
+    self.__Generator = numpy.random.default_rng(Rng.getrandbits(64))
+    self.__VariabilityMultipliers = (100 - (100 * Variability / 100) + (100 * numpy.arange(0, Variability * 2 + 1) / 100)) / 100
+    self.__CalculateDeathProbabilities()
+    self.__Cohorts = numpy.zeros((len(self.__AgeingHazards), 2, self.__RATE_BUCKET_COUNT), dtype = numpy.int64)
     if self.__RabbitCount == 0:
-      self.__RabbitCount = int(self.__CalculateRandomValue(int(self.__MAX_RABBITS_IN_WARREN / 4), self.__Variability))
-    for r in range (0, self.__RabbitCount):
-      self.__Rabbits[r] = Rabbit(self.__Variability)
+      self.__RabbitCount = int(int(self.__MAX_RABBITS_IN_WARREN / 4) * self.__Generator.choice(self.__VariabilityMultipliers))
+    self.__AddBabies(numpy.full(self.__RabbitCount, 1.2) * self.__Generator.choice(self.__VariabilityMultipliers, self.__RabbitCount))
 
-  def __CalculateRandomValue(self, BaseValue, Variability):
+  def __CalculateDeathProbabilities(self):
     """
-    Calculates a pseudo-random value for Variability
+    Works out __AgeingHazards and __ProbabilityOfDeathOtherCauses from every natural lifespan and probability of death Rabbit.__init__ can draw
+
+    Attributes:
+      NaturalLifespans (numpy.ndarray): Each possible lifespan, all equally likely
+      StillAlive (numpy.ndarray): Chance a rabbit is still alive on reaching each age
+    """
+    NaturalLifespans = (self.__DEFAULT_LIFE_SPAN * self.__VariabilityMultipliers * 100 / 100).astype(numpy.int64)
+    Ages = numpy.arange(0, max(1, NaturalLifespans.max()))
+    StillAlive = (NaturalLifespans[None, :] > Ages[:, None]).mean(axis = 1)
+    StillAlive[0] = 1
+    AliveAfterAgeing = (NaturalLifespans[None, :] > Ages[:, None] + 1).mean(axis = 1)
+    self.__AgeingHazards = numpy.where(StillAlive > 0, 1 - AliveAfterAgeing / numpy.maximum(StillAlive, 1e-300), 1)
+    ProbabilitiesOfDeath = self.__DEFAULT_PROBABILITY_DEATH_OTHER_CAUSES * self.__VariabilityMultipliers * 100 / 100
+    self.__ProbabilityOfDeathOtherCauses = (numpy.arange(0, 101)[None, :] < ProbabilitiesOfDeath[:, None] * 100).sum(axis = 1).mean() / 101
+
+  def __AddBabies(self, ReproductionRates):
+    """
+    Adds newborn rabbits to the age 0 cohorts
 
     Args:
-      BaseValue (int): ???
-      Variability (int): Something to do with chance/randomness in Warrens
-    
+      ReproductionRates (numpy.ndarray): Reproduction rate of each baby
+    """
+    Buckets = numpy.clip((ReproductionRates / self.__RATE_BUCKET_WIDTH).astype(numpy.int64), 0, self.__RATE_BUCKET_COUNT - 1)
+    self.__AddBabiesByBucket(numpy.bincount(Buckets, minlength = self.__RATE_BUCKET_COUNT))
+
+  def __AddBabiesByBucket(self, Babies):
+    """
+    Args:
+      Babies (numpy.ndarray): Number of newborn rabbits in each reproduction rate bucket, split between genders here
+    """
+    Males = self.__Generator.binomial(Babies, self.__PROBABILITY_MALE)
+    self.__Cohorts[0, self.__MALE] += Males
+    self.__Cohorts[0, self.__FEMALE] += Babies - Males
+
+  def __GetRateBucketMiddles(self):
+    """
     Returns:
-      int: random value based on BaseValue and Variability
+      numpy.ndarray: Reproduction rate in the middle of each bucket
     """
-    return BaseValue - (BaseValue * Variability / 100) + (BaseValue * random.randint(0, Variability * 2) / 100)
+    return (numpy.arange(self.__RATE_BUCKET_COUNT) + 0.5) * self.__RATE_BUCKET_WIDTH
 
-  def GetRabbitCount(self): 
+  def GetRabbitCount(self):
     """
     Getter for private variable self.__RabbitCount
-    
+
     Returns:
       int: value of self.__RabbitCount
     """
     return self.__RabbitCount
-  
-  def NeedToCreateNewWarren(self): 
+
+  def HasAlreadySpread(self):
+    """
+    Getter for private variable self.__AlreadySpread
+
+    Returns:
+      bool: True once this warren has reached capacity and tried to start a new warren
+    """
+    return self.__AlreadySpread
+
+  def NeedToCreateNewWarren(self):
     """
     Tells you if you need to make a new warren (if you haven't hit max rabbits)
-    
+
     Returns:
       bool: If a new Warren is requied
     """
@@ -382,27 +2585,27 @@ class Warren:
       return True
     else:
       return False
-    
+
+  def GetLastGenerationCounts(self):
+    """
+    Returns:
+      tuple: (KilledByOtherFactors, DiedOfOldAge, Born) rabbit counts from the last AdvanceGeneration
+    """
+    return tuple(self.__LastGenerationCounts)
+
   def WarrenHasDiedOut(self):
     """
-    Getter for private variable self.__RabbitCount, with a twist - returns True if any rabbits exist. A weird alternative to `if(GetRabbitCount() > 0)`
-    
     Returns:
-      bool: True if any rabbits are still alive
+      bool: True if there are no rabbits left
     """
-    if self.__RabbitCount == 0:
-      return True
-    else:
-      return False
+    return self.__RabbitCount == 0
 
   def AdvanceGeneration(self, ShowDetail):
     """
-    Advances rabbits by, um, killing them
-
-    Note:
-      Could be simplified into one if/else with a nested if for ln 408
+    Advances rabbits through the same phases as Warren.AdvanceGeneration
     """
     self.__PeriodsRun += 1
+    self.__LastGenerationCounts = [0, 0, 0]
     if self.__RabbitCount > 0:
       self.__KillByOtherFactors(ShowDetail)
     if self.__RabbitCount > 0:
@@ -412,124 +2615,87 @@ class Warren:
         self.__MateRabbits(ShowDetail)
     if self.__RabbitCount == 0 and ShowDetail:
       print("  All rabbits in warren are dead")
-    
+
   def EatRabbits(self, RabbitsToEat):
     """
-    Brutally destroys rabbits
+    Removes RabbitsToEat rabbits chosen uniformly at random across all cohorts
 
     Args:
       RabbitsToEat (int): Number of Rabbits to 'eat'
 
-    Attributes:
-      DeathCount (int): Iterator counter for rabbits murdered for the while loop
-      RabbitsToEat (int): Clone of self.RabbitsToEat to manipulate
-      RabbitNumber (int): Randomly chosen number used as the index in the self.__Rabbits list to pick for murder
-    
     Returns:
-      int: kinda useless, just the same as self.RabbitsToEat
+      int: Number of rabbits actually eaten
     """
-    DeathCount = 0
     if RabbitsToEat > self.__RabbitCount:
       RabbitsToEat = self.__RabbitCount
-    while DeathCount < RabbitsToEat:
-      RabbitNumber = random.randint(0, self.__RabbitCount - 1)
-      if not self.__Rabbits[RabbitNumber] is None:
-        self.__Rabbits[RabbitNumber] = None
-        DeathCount += 1
-    self.__CompressRabbitList(DeathCount)
+    if RabbitsToEat > 0:
+      Eaten = self.__Generator.multivariate_hypergeometric(self.__Cohorts.ravel(), RabbitsToEat)
+      self.__Cohorts -= Eaten.reshape(self.__Cohorts.shape)
+      self.__RabbitCount -= RabbitsToEat
     return RabbitsToEat
 
   def __KillByOtherFactors(self, ShowDetail):
     """
-    Massacres rabbits for other reasons
-
-    Args:
-      ShowDetail (bool): config option - whether to print what's going on
-
-    Attributes:
-      DeathCount (int): Iterator counter for rabbits murdered
+    One binomial draw per cohort
     """
-    DeathCount = 0
-    for r in range (0, self.__RabbitCount):
-      if self.__Rabbits[r].CheckIfKilledByOtherFactor():
-        self.__Rabbits[r] = None
-        DeathCount += 1
-    self.__CompressRabbitList(DeathCount)
+    Deaths = self.__Generator.binomial(self.__Cohorts, self.__ProbabilityOfDeathOtherCauses)
+    self.__Cohorts -= Deaths
+    DeathCount = int(Deaths.sum())
+    self.__RabbitCount -= DeathCount
+    self.__LastGenerationCounts[0] = DeathCount
     if ShowDetail:
       print(" ", DeathCount, "rabbits killed by other factors.")
 
   def __AgeRabbits(self, ShowDetail):
-    DeathCount = 0
-    for r in range (0, self.__RabbitCount):
-      self.__Rabbits[r].CalculateNewAge()
-      if self.__Rabbits[r].CheckIfDead():
-        self.__Rabbits[r] = None
-        DeathCount += 1
-    self.__CompressRabbitList(DeathCount)
+    """
+    Moves every cohort up one age after drawing how many die of old age on the way
+    """
+    Deaths = self.__Generator.binomial(self.__Cohorts, self.__AgeingHazards[:, None, None])
+    Survivors = self.__Cohorts - Deaths
+    DeathCount = int(Deaths.sum() + Survivors[-1].sum())
+    self.__Cohorts[1:] = Survivors[:-1]
+    self.__Cohorts[0] = 0
+    self.__RabbitCount -= DeathCount
+    self.__LastGenerationCounts[1] = DeathCount
     if ShowDetail:
       print(" ", DeathCount, "rabbits die of old age.")
 
   def __MateRabbits(self, ShowDetail):
     """
-    Creates young rabbits
-
-    Args:
-      ShowDetail (bool): config option - whether to print what's going on
+    Pairs every female with a random male and adds a baby for each pair whose combined reproduction rate is at least 1, until the warren is full
 
     Attributes:
-      Mate (int): Randomly chosen male Rabbit
-      Babies (int): Iterative counter for how many rabbits are born
-    """
-    Mate = 0
-    Babies = 0 
-    for r in range (0, self.__RabbitCount):
-      if self.__Rabbits[r].IsFemale() and self.__RabbitCount + Babies < self.__MAX_RABBITS_IN_WARREN:
-        Mate = random.randint(0, self.__RabbitCount - 1)
-        while Mate == r or self.__Rabbits[Mate].IsFemale():
-          Mate = random.randint(0, self.__RabbitCount - 1)
-        CombinedReproductionRate = (self.__Rabbits[r].GetReproductionRate() + self.__Rabbits[Mate].GetReproductionRate()) / 2
-        if CombinedReproductionRate >= 1:
-          self.__Rabbits[self.__RabbitCount + Babies] = Rabbit(self.__Variability, CombinedReproductionRate)
-          Babies += 1
+      Pairs (numpy.ndarray): Number of females in each [female bucket, male bucket] pairing
+      CombinedReproductionRates (numpy.ndarray): Combined reproduction rate of each pairing
+      Babies (int): How many rabbits are born
+    """
+    Females = self.__Cohorts[:, self.__FEMALE].sum(axis = 0)
+    Males = self.__Cohorts[:, self.__MALE].sum(axis = 0)
+    Pairs = self.__Generator.multinomial(Females, Males / Males.sum())
+    RateBucketMiddles = self.__GetRateBucketMiddles()
+    CombinedReproductionRates = (RateBucketMiddles[:, None] + RateBucketMiddles[None, :]) / 2
+    Pairs[CombinedReproductionRates < 1] = 0
+    Room = self.__MAX_RABBITS_IN_WARREN - self.__RabbitCount
+    if Pairs.sum() > Room:
+      Pairs = self.__Generator.multivariate_hypergeometric(Pairs.ravel(), Room).reshape(Pairs.shape)
+    Fertile = numpy.flatnonzero(Pairs)
+    Babies = int(Pairs.sum())
+    if Babies > 0:
+      Multipliers = self.__Generator.multinomial(Pairs.ravel()[Fertile], numpy.full(len(self.__VariabilityMultipliers), 1 / len(self.__VariabilityMultipliers)))
+      ReproductionRates = CombinedReproductionRates.ravel()[Fertile][:, None] * self.__VariabilityMultipliers[None, :]
+      Buckets = numpy.clip((ReproductionRates / self.__RATE_BUCKET_WIDTH).astype(numpy.int64), 0, self.__RATE_BUCKET_COUNT - 1)
+      self.__AddBabiesByBucket(numpy.bincount(Buckets.ravel(), weights = Multipliers.ravel(), minlength = self.__RATE_BUCKET_COUNT).astype(numpy.int64))
     self.__RabbitCount = self.__RabbitCount + Babies
+    self.__LastGenerationCounts[2] = Babies
     if ShowDetail:
       print(" ", Babies, "baby rabbits born.")
 
-  def __CompressRabbitList(self, DeathCount):
-    """
-    A.K.A Corpse Compactor, removes dead rabbits when DeathCount > 0
-
-    Args:
-      DeathCount (int): Number of dead Rabbits
-
-    Attributes:
-      ShiftFrom (int): ???
-      ShiftTo (int): ???
-    """
-    if DeathCount > 0:
-      ShiftTo = 0
-      ShiftFrom  = 0
-      while ShiftTo < self.__RabbitCount - DeathCount:
-        while self.__Rabbits[ShiftFrom] is None:
-          ShiftFrom += 1
-        if ShiftTo != ShiftFrom:
-          self.__Rabbits[ShiftTo] = self.__Rabbits[ShiftFrom]
-        ShiftTo += 1
-        ShiftFrom += 1
-      self.__RabbitCount = self.__RabbitCount - DeathCount
-
   def __ContainsMales(self):
     """
-    True if any male rabbits are still alive
-
     Returns:
       bool: True if any male rabbits exist, otherwise False
     """
-    Males = False
-    for r in range (0, self.__RabbitCount):
-      if not self.__Rabbits[r].IsFemale():
-        Males = True
-    return Males
+    return bool(self.__Cohorts[:, self.__MALE].any())
 
   def Inspect(self):
     """
@@ -539,16 +2705,77 @@ class Warren:
 
   def ListRabbits(self):
     """
-    Lists details of each rabbit if there are any rabbits still alive
+    Lists every non-empty cohort, as rabbits have no individual details in this model
     """
-    if self.__RabbitCount > 0:
-      for r in range (0, self.__RabbitCount):
-        self.__Rabbits[r].Inspect()
+    RateBucketMiddles = self.__GetRateBucketMiddles()
+    for Age, Gender, Bucket in zip(*numpy.nonzero(self.__Cohorts)):
+      print("  Age", Age, "", end = "")
+      print("Rep rate", round(float(RateBucketMiddles[Bucket]), 2), "", end = "")
+      if Gender == self.__FEMALE:
+        print("Gender Female ", end = "")
+      else:
+        print("Gender Male ", end = "")
+      print("Count", self.__Cohorts[Age, Gender, Bucket])
+
+  def GetRabbitIDs(self, Start = 0, Stop = None):
+    """
+    Returns:
+      list: Always empty, as rabbits have no IDs in this model
+    """
+    return []
+
+  def GetRabbitRecords(self, Start = 0, Stop = None):
+    """
+    Structured version of ListRabbits(), one record per non-empty cohort rather than per rabbit
+
+    Args:
+      Start (int, optional): Index of the first cohort (defaults to 0)
+      Stop (int, optional): Index after the last cohort (defaults to the end)
+
+    Yields:
+      dict: Age, ReproductionRate (middle of the bucket), Gender and Count of each cohort from Start up to Stop
+    """
+    RateBucketMiddles = self.__GetRateBucketMiddles()
+    Cohorts = zip(*numpy.nonzero(self.__Cohorts))
+    for Age, Gender, Bucket in itertools.islice(Cohorts, Start, Stop):
+      yield {"Age": int(Age), "ReproductionRate": float(RateBucketMiddles[Bucket]), "Gender": "Female" if Gender == self.__FEMALE else "Male", "Count": int(self.__Cohorts[Age, Gender, Bucket])}
+
+class AnimalIDs:
+  """
+  AnimalIDs hands out animal IDs. Each Simulation has its own, so IDs are unique within a simulation however many others are running or being restored alongside it
+
+  Args:
+      NextID (int, optional): The ID the next animal gets (defaults to 1)
+
+  Attributes:
+      __NextID (int): The ID the next animal gets
+  """
+  def __init__(self, NextID = 1):
+    self.__NextID = NextID
+
+  def Take(self, Count = 1):
+    """
+    Reserves Count consecutive IDs
+
+    Returns:
+      int: The first of them
+    """
+    FirstID = self.__NextID
+    self.__NextID += Count
+    return FirstID
+
+  def GetNextID(self):
+    return self.__NextID
 
 class Animal:
-  _ID = 1
+  """
+  Note:
+    Animal, Fox and Rabbit use __slots__ rather than a __dict__ per instance, as big runs create millions of them. Each subclass lists only the attributes it adds, and constants live on the class
+  """
+  __slots__ = ("_NaturalLifespan", "_ProbabilityOfDeathOtherCauses", "_IsAlive", "_ID", "_Age", "_Random")
+  _SharedIDs = AnimalIDs()
 
-  def __init__(self, AvgLifespan, AvgProbabilityOfDeathOtherCauses, Variability):
+  def __init__(self, AvgLifespan, AvgProbabilityOfDeathOtherCauses, Variability, Rng = None, IDs = None):
     """
     Animal is a generic class with properties shared by all animals.
 
@@ -556,20 +2783,45 @@ class Animal:
         AvgLifespan (int): The average lifespan rate, set by us humans
         AvgProbabilityOfDeathOtherCauses (float): The average probability of death from other causes (non-fox)
         Variability (int): Something to do with chance/randomness in Warrens
+        Rng (random.Random, optional): Generator for everything random about this animal (defaults to the random module)
+        IDs (AnimalIDs, optional): Where the animal's ID comes from, usually its simulation's (defaults to Animal._SharedIDs, for animals made outside a Simulation)
 
     Attributes:
+        _Random (random.Random): A rabbit shares its warren's generator, a fox has its own
         _NaturalLifespan (int): How long Animal lives
         _ProbabilityOfDeathOtherCauses (int): Actual probability of death from other causes (non-fox)
         _IsAlive (bool): set to false when deded
-        _ID (int): set to 1 by default, see ln 547, then with every new Animal it increases by 1, see ln 570
+        _ID (int): taken from IDs, which starts at 1 and increases by 1 with every new Animal
         _Age (int): starts at 0
     """
+    if Rng is None:
+      Rng = random
+    if IDs is None:
+      IDs = Animal._SharedIDs
+    self._Random = Rng
     self._NaturalLifespan = int(AvgLifespan * self._CalculateRandomValue(100, Variability) / 100)
     self._ProbabilityOfDeathOtherCauses = AvgProbabilityOfDeathOtherCauses * self._CalculateRandomValue(100, Variability) / 100
     self._IsAlive = True
-    self._ID = Animal._ID
+    self._ID = IDs.Take()
     self._Age = 0
-    Animal._ID += 1
+
+  def _GetAnimalState(self):
+    """
+    Returns:
+      tuple: (ID, Age, NaturalLifespan, ProbabilityOfDeathOtherCauses, IsAlive), the part of a checkpoint shared by every animal
+    """
+    return (self._ID, self._Age, self._NaturalLifespan, self._ProbabilityOfDeathOtherCauses, self._IsAlive)
+
+  def _SetAnimalState(self, ID, Age, NaturalLifespan, ProbabilityOfDeathOtherCauses, IsAlive, Rng):
+    """
+    Fills in an animal made with __new__ from a checkpoint, without taking a new ID
+    """
+    self._ID = ID
+    self._Age = Age
+    self._NaturalLifespan = NaturalLifespan
+    self._ProbabilityOfDeathOtherCauses = ProbabilityOfDeathOtherCauses
+    self._IsAlive = bool(IsAlive)
+    self._Random = Rng
 
   def CalculateNewAge(self):
     """
@@ -597,6 +2849,19 @@ class Animal:
     print("LS", self._NaturalLifespan, "", end = "")
     print("Pr dth", round(self._ProbabilityOfDeathOtherCauses, 2), "", end = "")
 
+  def GetID(self):
+    """Getter for self._ID"""
+    return self._ID
+
+  def GetRecord(self):
+    """
+    Structured version of Inspect()
+
+    Returns:
+      dict: ID, Age, NaturalLifespan and ProbabilityOfDeathOtherCauses
+    """
+    return {"ID": self._ID, "Age": self._Age, "NaturalLifespan": self._NaturalLifespan, "ProbabilityOfDeathOtherCauses": self._ProbabilityOfDeathOtherCauses}
+
   def CheckIfKilledByOtherFactor(self):
     """
     Kills animals based on chance, using self._ProbabilityOfDeathOtherCauses
@@ -604,7 +2869,7 @@ class Animal:
     Returns:
       bool: True if killed, otherwise False
     """
-    if random.randint(0, 100) < self._ProbabilityOfDeathOtherCauses * 100:
+    if self._Random.randint(0, 100) < self._ProbabilityOfDeathOtherCauses * 100:
       self._IsAlive = False
       return True
     else:
@@ -621,27 +2886,66 @@ class Animal:
     Returns:
       int: random value based on BaseValue and Variability
     """
-    return BaseValue - (BaseValue * Variability / 100) + (BaseValue * random.randint(0, Variability * 2) / 100)
+    return BaseValue - (BaseValue * Variability / 100) + (BaseValue * self._Random.randint(0, Variability * 2) / 100)
+
+class CausesOfDeath(enum.Enum):
+  """
+  Why a fox died, for the FoxesStarved, FoxesKilledByOtherFactors and FoxesDiedOfOldAge metrics
+
+  Attributes:
+    Starved (enum): Ate nothing this period
+    KilledByOtherFactors (enum): Unlucky, see Animal.CheckIfKilledByOtherFactor
+    DiedOfOldAge (enum): Reached its natural lifespan, sooner if it went hungry
+  """
+  Starved = 1
+  KilledByOtherFactors = 2
+  DiedOfOldAge = 3
 
 class Fox(Animal):
-  def __init__(self, Variability):
+  __slots__ = ("__FoodUnitsNeeded", "__FoodUnitsConsumedThisPeriod", "__CauseOfDeath")
+  __DEFAULT_LIFE_SPAN = 7
+  __DEFAULT_PROBABILITY_DEATH_OTHER_CAUSES = 0.1
+
+  def __init__(self, Variability, Rng = None, IDs = None):
     """
     Fox is an Animal with some funky extras
 
     Args:
         Variability (int): Something to do with chance/randomness in Warrens
+        Rng (random.Random, optional): The fox's generator, usually its own (defaults to the random module)
+        IDs (AnimalIDs, optional): Where the fox's ID comes from (defaults to Animal._SharedIDs)
 
     Attributes:
         __DEFAULT_LIFE_SPAN (int): Constant that sets lifespan
         __DEFAULT_PROBABILITY_DEATH_OTHER_CAUSES (float): Constant for Animal's probability of death by other causes (non-fox)
         __FoodUnitsNeeded (int): Random number defining how many food units are required to stay alive
         __FoodUnitsConsumedThisPeriod (int): Counter for food units consumed
+        __CauseOfDeath (CausesOfDeath): Set by AdvanceGeneration when the fox dies, otherwise None
     """
-    self.__DEFAULT_LIFE_SPAN = 7
-    self.__DEFAULT_PROBABILITY_DEATH_OTHER_CAUSES = 0.1
-    super(Fox, self).__init__(self.__DEFAULT_LIFE_SPAN, self.__DEFAULT_PROBABILITY_DEATH_OTHER_CAUSES, Variability)
+    super(Fox, self).__init__(self.__DEFAULT_LIFE_SPAN, self.__DEFAULT_PROBABILITY_DEATH_OTHER_CAUSES, Variability, Rng, IDs)
     self.__FoodUnitsNeeded = int(10 * self._CalculateRandomValue(100, Variability) / 100)
     self.__FoodUnitsConsumedThisPeriod  = 0
+    self.__CauseOfDeath = None
+
+  def _GetCheckpointState(self):
+    """
+    Returns:
+      tuple: Animal state, then FoodUnitsNeeded, FoodUnitsConsumedThisPeriod and the fox's generator
+    """
+    return self._GetAnimalState() + (self.__FoodUnitsNeeded, self.__FoodUnitsConsumedThisPeriod, self._Random)
+
+  @classmethod
+  def _FromCheckpointState(cls, ID, Age, NaturalLifespan, ProbabilityOfDeathOtherCauses, IsAlive, FoodUnitsNeeded, FoodUnitsConsumedThisPeriod, Rng):
+    """
+    Returns:
+      Fox: A fox rebuilt from a checkpoint
+    """
+    RestoredFox = cls.__new__(cls)
+    RestoredFox._SetAnimalState(ID, Age, NaturalLifespan, ProbabilityOfDeathOtherCauses, IsAlive, Rng)
+    RestoredFox.__FoodUnitsNeeded = FoodUnitsNeeded
+    RestoredFox.__FoodUnitsConsumedThisPeriod = FoodUnitsConsumedThisPeriod
+    RestoredFox.__CauseOfDeath = None
+    return RestoredFox
 
   def AdvanceGeneration(self, ShowDetail):
     """
@@ -649,11 +2953,13 @@ class Fox(Animal):
     """
     if self.__FoodUnitsConsumedThisPeriod == 0:
       self._IsAlive = False
+      self.__CauseOfDeath = CausesOfDeath.Starved
       if ShowDetail:
         print("  Fox dies as has eaten no food this period.")
     else:
       if self.CheckIfKilledByOtherFactor():
         self._IsAlive = False
+        self.__CauseOfDeath = CausesOfDeath.KilledByOtherFactors
         if ShowDetail:
           print("  Fox killed by other factor.")
       else:
@@ -663,9 +2969,19 @@ class Fox(Animal):
             print("  Fox ages further due to lack of food.")
         self.CalculateNewAge()
         if not self._IsAlive:
+          self.__CauseOfDeath = CausesOfDeath.DiedOfOldAge
           if ShowDetail:
             print("  Fox has died of old age.")
 
+  def GetCauseOfDeath(self):
+    """
+    Getter for self.__CauseOfDeath
+
+    Returns:
+      CausesOfDeath: Why the fox died in its last AdvanceGeneration, or None if it is alive
+    """
+    return self.__CauseOfDeath
+
   def ResetFoodConsumed(self):
     """
     (Re)Setter for self.__FoodUnitsConsumedThisPeriod
@@ -686,7 +3002,7 @@ class Fox(Animal):
       bool: True if period should feature reproduction, otherwise False
     """
     REPRODUCTION_PROBABILITY  = 0.25
-    if random.randint(0, 100) < REPRODUCTION_PROBABILITY * 100:
+    if self._Random.randint(0, 100) < REPRODUCTION_PROBABILITY * 100:
       return True
     else:
       return False
@@ -707,6 +3023,13 @@ class Fox(Animal):
     print("Food eaten", self.__FoodUnitsConsumedThisPeriod, "", end = "")
     print()
 
+  def GetRecord(self):
+    """Overrides Animal.GetRecord(), adding FoodUnitsNeeded and FoodUnitsConsumedThisPeriod"""
+    Record = super(Fox, self).GetRecord()
+    Record["FoodUnitsNeeded"] = self.__FoodUnitsNeeded
+    Record["FoodUnitsConsumedThisPeriod"] = self.__FoodUnitsConsumedThisPeriod
+    return Record
+
 class Genders(enum.Enum):
   """
   Only two genders?????????
@@ -721,36 +3044,68 @@ class Genders(enum.Enum):
   Female = 2
     
 class Rabbit(Animal):
-  def __init__(self, Variability, ParentsReproductionRate = 1.2):
+  __slots__ = ("__ReproductionRate", "__Gender")
+  __DEFAULT_LIFE_SPAN = 4
+  __DEFAULT_PROBABILITY_DEATH_OTHER_CAUSES = 0.05
+  __MALE = Genders.Male.value
+  __FEMALE = Genders.Female.value
+
+  def __init__(self, Variability, ParentsReproductionRate = 1.2, Rng = None, IDs = None):
     """
     Rabbit is an Animal with some funky extras (but spoiler, they're weak AF)
 
     Args:
         Variability (int): Something to do with chance/randomness in Warrens
         ParentsReproductionRate (float, optional): Reproduction rate of Rabbit's parents
+        Rng (random.Random, optional): The warren's generator (defaults to the random module)
+        IDs (AnimalIDs, optional): Where the rabbit's ID comes from, usually its warren's (defaults to Animal._SharedIDs)
 
     Attributes:
         __DEFAULT_LIFE_SPAN (int): Constant that sets lifespan
         __DEFAULT_PROBABILITY_DEATH_OTHER_CAUSES (float): Constant for Animal's probability of death by other causes (non-fox)
-        __Gender (enum): Instance of Gender class
+        __Gender (int): value of a Genders member, kept as a plain int so comparing it is cheap
     """
-    self.__DEFAULT_LIFE_SPAN = 4
-    self.__DEFAULT_PROBABILITY_DEATH_OTHER_CAUSES  = 0.05
-    super(Rabbit, self).__init__(self.__DEFAULT_LIFE_SPAN, self.__DEFAULT_PROBABILITY_DEATH_OTHER_CAUSES, Variability)
+    super(Rabbit, self).__init__(self.__DEFAULT_LIFE_SPAN, self.__DEFAULT_PROBABILITY_DEATH_OTHER_CAUSES, Variability, Rng, IDs)
     self.__ReproductionRate = ParentsReproductionRate * self._CalculateRandomValue(100, Variability) / 100
-    if random.randint(0, 100) < 50:
-      self.__Gender = Genders.Male
+    if self._Random.randint(0, 100) < 50:
+      self.__Gender = self.__MALE
     else:
-      self.__Gender = Genders.Female
+      self.__Gender = self.__FEMALE
+
+  def _GetCheckpointState(self):
+    """
+    Returns:
+      tuple: Animal state, then ReproductionRate and Gender
+    """
+    return self._GetAnimalState() + (self.__ReproductionRate, self.__Gender)
+
+  @classmethod
+  def _FromCheckpointState(cls, ID, Age, NaturalLifespan, ProbabilityOfDeathOtherCauses, IsAlive, ReproductionRate, Gender, Rng):
+    """
+    Returns:
+      Rabbit: A rabbit rebuilt from a checkpoint
+    """
+    RestoredRabbit = cls.__new__(cls)
+    RestoredRabbit._SetAnimalState(ID, Age, NaturalLifespan, ProbabilityOfDeathOtherCauses, IsAlive, Rng)
+    RestoredRabbit.__ReproductionRate = ReproductionRate
+    RestoredRabbit.__Gender = Gender
+    return RestoredRabbit
 
   def Inspect(self):
     """Overrides Animal.Inspect(), also printing the food the reproduction rate and the gender of the rabbit"""
     super(Rabbit, self).Inspect()
     print("Rep rate", round(self.__ReproductionRate, 1), "", end = "")
-    if self.__Gender == Genders.Female:
+    if self.__Gender == self.__FEMALE:
       print("Gender Female")
     else:
       print("Gender Male")
+
+  def GetRecord(self):
+    """Overrides Animal.GetRecord(), adding ReproductionRate and Gender ("Female" or "Male")"""
+    Record = super(Rabbit, self).GetRecord()
+    Record["ReproductionRate"] = self.__ReproductionRate
+    Record["Gender"] = Genders(self.__Gender).name
+    return Record
     
   def IsFemale(self):
     """
@@ -759,10 +3114,7 @@ class Rabbit(Animal):
     Returns:
       bool: True if Rabbit is female, otherwise False
     """
-    if self.__Gender == Genders.Female:
-      return True
-    else:
-      return False
+    return self.__Gender == self.__FEMALE
     
   def GetReproductionRate(self):
     """Getter for self.__ReproductionRate""" 
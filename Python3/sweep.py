@@ -0,0 +1,148 @@
+""" Parameter sweeps for Rabbits & Foxes
+
+Runs every combination of LandscapeSize, InitialWarrenCount, InitialFoxCount and Variability in a grid, several times each, spread over a pool of processes. Each run is an independent headless Simulation (or VectorisedSimulation), seeded from its run number so a sweep is repeatable, and one result row is yielded as soon as each run finishes.
+
+Example:
+  python sweep.py --landscape-size 15 20 --warrens 5 10 --foxes 5 --variability 0 10 --replicates 20 > results.csv
+"""
+
+import argparse
+import csv
+import itertools
+import multiprocessing
+import sys
+
+from skeleton_with_documentation import Simulation
+
+PARAMETER_NAMES = ("LandscapeSize", "InitialWarrenCount", "InitialFoxCount", "Variability")
+RESULT_FIELDS = ("RunNumber", "Seed", "Replicate") + PARAMETER_NAMES + ("PeriodsRun", "WarrensExtinctAt", "FoxesExtinctAt", "ExtinctionOrder", "PeakWarrens", "PeakFoxes", "PeakRabbits")
+
+def MakeRuns(Grid, Replicates, MaxPeriods, BaseSeed = 0, Vectorised = False):
+  """
+  Lists every run in a sweep, in grid order with replicates innermost
+
+  Args:
+    Grid (dict): A list of values for each name in PARAMETER_NAMES
+    Replicates (int): Runs for each combination of parameters
+    MaxPeriods (int): Time periods after which a run is stopped even if nothing has died out
+    BaseSeed (int, optional): Run n is seeded with BaseSeed + n (defaults to 0)
+    Vectorised (bool, optional): Use VectorisedSimulation instead of Simulation (defaults to False)
+
+  Returns:
+    list: One dict of settings per run
+  """
+  Runs = []
+  for Values in itertools.product(*(Grid[Name] for Name in PARAMETER_NAMES)):
+    for Replicate in range (0, Replicates):
+      Run = dict(zip(PARAMETER_NAMES, Values))
+      Run["RunNumber"] = len(Runs)
+      Run["Seed"] = BaseSeed + len(Runs)
+      Run["Replicate"] = Replicate
+      Run["MaxPeriods"] = MaxPeriods
+      Run["Vectorised"] = Vectorised
+      Runs.append(Run)
+  return Runs
+
+def RunOne(Run):
+  """
+  Runs one simulation until both warrens and foxes have died out, or Run["MaxPeriods"] is reached
+
+  Note:
+    Called in the worker processes, so it only takes and returns plain data
+
+  Args:
+    Run (dict): Settings from MakeRuns
+
+  Returns:
+    dict: Values for each name in RESULT_FIELDS. WarrensExtinctAt and FoxesExtinctAt are "" if that population survived, and ExtinctionOrder is "Warrens", "Foxes", "Both" (same period) or "Neither"
+  """
+  if Run["Vectorised"]:
+    from vectorised_simulation import VectorisedSimulation
+    Sim = VectorisedSimulation(Run["LandscapeSize"], Run["InitialWarrenCount"], Run["InitialFoxCount"], Run["Variability"], False, Seed = Run["Seed"])
+  else:
+    Sim = Simulation(Run["LandscapeSize"], Run["InitialWarrenCount"], Run["InitialFoxCount"], Run["Variability"], False, Interactive = False, Seed = Run["Seed"])
+  Result = {Name: Run[Name] for Name in ("RunNumber", "Seed", "Replicate") + PARAMETER_NAMES}
+  PeakWarrens = Sim.GetWarrenCount()
+  PeakFoxes = Sim.GetFoxCount()
+  PeakRabbits = Sim.GetRabbitCount()
+  WarrensExtinctAt = ""
+  FoxesExtinctAt = ""
+  while Sim.GetTimePeriod() < Run["MaxPeriods"] and not Sim.IsExtinct():
+    Sim.Step()
+    PeakWarrens = max(PeakWarrens, Sim.GetWarrenCount())
+    PeakFoxes = max(PeakFoxes, Sim.GetFoxCount())
+    PeakRabbits = max(PeakRabbits, Sim.GetRabbitCount())
+    if WarrensExtinctAt == "" and Sim.GetWarrenCount() == 0:
+      WarrensExtinctAt = Sim.GetTimePeriod()
+    if FoxesExtinctAt == "" and Sim.GetFoxCount() == 0:
+      FoxesExtinctAt = Sim.GetTimePeriod()
+  if WarrensExtinctAt == "" and FoxesExtinctAt == "":
+    ExtinctionOrder = "Neither"
+  elif WarrensExtinctAt == FoxesExtinctAt:
+    ExtinctionOrder = "Both"
+  elif FoxesExtinctAt == "" or (WarrensExtinctAt != "" and WarrensExtinctAt < FoxesExtinctAt):
+    ExtinctionOrder = "Warrens"
+  else:
+    ExtinctionOrder = "Foxes"
+  Result["PeriodsRun"] = Sim.GetTimePeriod()
+  Result["WarrensExtinctAt"] = WarrensExtinctAt
+  Result["FoxesExtinctAt"] = FoxesExtinctAt
+  Result["ExtinctionOrder"] = ExtinctionOrder
+  Result["PeakWarrens"] = PeakWarrens
+  Result["PeakFoxes"] = PeakFoxes
+  Result["PeakRabbits"] = PeakRabbits
+  return Result
+
+def RunSweep(Runs, Processes = None, ChunkSize = None):
+  """
+  Spreads runs over a process pool and yields each result as it finishes
+
+  Note:
+    Results arrive in completion order, not RunNumber order. Runs are handed out ChunkSize at a time, which by default aims for about four chunks per process, so workers rarely wait on the pool but slow chunks can still be balanced out
+
+  Args:
+    Runs (list): Settings from MakeRuns
+    Processes (int, optional): Worker processes (defaults to the number of CPUs)
+    ChunkSize (int, optional): Runs sent to a worker at once
+
+  Yields:
+    dict: One RunOne result per run
+  """
+  if Processes is None:
+    Processes = multiprocessing.cpu_count()
+  if ChunkSize is None:
+    ChunkSize = max(1, len(Runs) // (Processes * 4))
+  if Processes == 1:
+    for Run in Runs:
+      yield RunOne(Run)
+    return
+  with multiprocessing.Pool(Processes) as Pool:
+    for Result in Pool.imap_unordered(RunOne, Runs, ChunkSize):
+      yield Result
+
+def Main():
+  """
+  Command line front end: runs a sweep and writes one CSV row per run to stdout as results arrive
+  """
+  Parser = argparse.ArgumentParser(description = "Run a Rabbits & Foxes parameter sweep")
+  Parser.add_argument("--landscape-size", type = int, nargs = "+", default = [15])
+  Parser.add_argument("--warrens", type = int, nargs = "+", default = [5])
+  Parser.add_argument("--foxes", type = int, nargs = "+", default = [5])
+  Parser.add_argument("--variability", type = int, nargs = "+", default = [0])
+  Parser.add_argument("--replicates", type = int, default = 10)
+  Parser.add_argument("--max-periods", type = int, default = 200)
+  Parser.add_argument("--seed", type = int, default = 0)
+  Parser.add_argument("--processes", type = int, default = None)
+  Parser.add_argument("--chunk-size", type = int, default = None)
+  Parser.add_argument("--vectorised", action = "store_true")
+  Arguments = Parser.parse_args()
+  Grid = {"LandscapeSize": Arguments.landscape_size, "InitialWarrenCount": Arguments.warrens, "InitialFoxCount": Arguments.foxes, "Variability": Arguments.variability}
+  Runs = MakeRuns(Grid, Arguments.replicates, Arguments.max_periods, Arguments.seed, Arguments.vectorised)
+  Writer = csv.DictWriter(sys.stdout, RESULT_FIELDS)
+  Writer.writeheader()
+  for Result in RunSweep(Runs, Arguments.processes, Arguments.chunk_size):
+    Writer.writerow(Result)
+    sys.stdout.flush()
+
+if __name__ == "__main__":
+  Main()
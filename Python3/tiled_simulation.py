@@ -0,0 +1,426 @@
+""" Tiled multi-process Rabbits & Foxes engine
+
+Splits a big landscape into a grid of rectangular tiles, each owned by its own worker process that holds the Warren and Fox objects in it. A coordinator in the main process keeps track of which cells are occupied and moves the few things that cross tile borders between workers each time period:
+  the positions of foxes within 7 cells (a fox's hunting range) of a tile, known as its halo, so warrens near a border are still hunted by foxes over it,
+  the food those foxes ate, sent back to the tile that owns them before foxes are advanced,
+  new warrens and foxes, whose random cells can be anywhere on the landscape.
+
+Example:
+  with TiledSimulation(400, 2000, 800, 10, False, Tiles = (2, 2), Seed = 1) as Sim:
+    Sim.Run(100)
+    print(Sim.GetRabbitCount())
+"""
+
+import bisect
+import multiprocessing
+import random
+
+from skeleton_with_documentation import Warren, Fox, FreeCells, Simulation
+
+class LandscapeTile:
+  """
+  LandscapeTile holds the warrens and foxes in one rectangle of the landscape, and advances them with the same rules as Simulation.__AdvanceTimePeriod
+
+  Note:
+    A time period is split in two so the coordinator can swap food between tiles in the middle: AdvanceWarrens (predation and warren generations), then AdvanceFoxes.
+    Cells are always in whole-landscape coordinates
+
+  Args:
+      Left, Top, Right, Bottom (int): The tile covers Left <= x < Right and Top <= y < Bottom
+      Variability (int): Something to do with chance/randomness in Warrens
+      WarrenType (class): Warren or a drop-in alternative
+      Seed (int): Seed for the tile's random.Random, which seeds a child generator for every warren and fox
+
+  Attributes:
+      __Warrens (dict): Every warren in the tile keyed by its (x, y) cell
+      __Foxes (dict): Every fox in the tile keyed by its (x, y) cell
+      __HaloFoxes (set): Cells of foxes in other tiles that can hunt warrens in this one
+      __PredationOffsets (list): (dx, dy, PercentToEat) for every cell within a fox's hunting range, the same table Simulation uses
+  """
+  def __init__(self, Left, Top, Right, Bottom, Variability, WarrenType, Seed):
+    self.__Left = Left
+    self.__Top = Top
+    self.__Right = Right
+    self.__Bottom = Bottom
+    self.__Variability = Variability
+    self.__WarrenType = WarrenType
+    self.__Random = random.Random(Seed)
+    self.__Warrens = {}
+    self.__Foxes = {}
+    self.__HaloFoxes = set()
+    self.__PredationOffsets = Simulation.CalculatePredationOffsets()
+
+  def __NewChildRandom(self):
+    return random.Random(self.__Random.getrandbits(64))
+
+  def AddWarrens(self, Warrens):
+    """
+    Args:
+      Warrens (list): (x, y, RabbitCount) of each new warren, RabbitCount 0 for a random size
+
+    Returns:
+      int: Number of rabbits across every warren in the tile afterwards. New warrens are placed last in a period, so this is the tile's count at the end of it, without another request
+    """
+    for x, y, RabbitCount in Warrens:
+      self.__Warrens[(x, y)] = self.__WarrenType(self.__Variability, RabbitCount, Rng = self.__NewChildRandom())
+    return self.GetRabbitCount()
+
+  def AddFoxes(self, Foxes):
+    """
+    Args:
+      Foxes (list): (x, y) of each new fox
+    """
+    for x, y in Foxes:
+      self.__Foxes[(x, y)] = Fox(self.__Variability, self.__NewChildRandom())
+
+  def AdvanceWarrens(self, FoxCount, HaloFoxes):
+    """
+    Foxes eat rabbits from every warren in the tile, warrens that are full ask for a new warren, then every warren advances a generation
+
+    Args:
+      FoxCount (int): Foxes on the whole landscape, as predation is skipped when there are none
+      HaloFoxes (list): (x, y) of foxes in other tiles within hunting range of this one
+
+    Returns:
+      dict: NewWarrens (number of warrens to place), ForeignFood (food eaten by each halo fox, keyed by its cell) and DeadWarrens (cells of warrens that died out)
+    """
+    self.__HaloFoxes = set(HaloFoxes)
+    ForeignFood = {}
+    NewWarrens = 0
+    DeadWarrens = []
+    for x, y in sorted(self.__Warrens):
+      CurrentWarren = self.__Warrens[(x, y)]
+      if FoxCount > 0:
+        self.__FoxesEatRabbitsInWarren(x, y, CurrentWarren, ForeignFood)
+      if CurrentWarren.NeedToCreateNewWarren():
+        NewWarrens += 1
+      CurrentWarren.AdvanceGeneration(False)
+      if CurrentWarren.WarrenHasDiedOut():
+        del self.__Warrens[(x, y)]
+        DeadWarrens.append((x, y))
+    return {"NewWarrens": NewWarrens, "ForeignFood": ForeignFood, "DeadWarrens": DeadWarrens}
+
+  def __FoxesEatRabbitsInWarren(self, WarrenX, WarrenY, PreyWarren, ForeignFood):
+    """
+    Same as Simulation.__FoxesEatRabbitsInWarren, except food eaten by halo foxes is added up in ForeignFood for the coordinator to pass on
+    """
+    RabbitCountAtStartOfPeriod = PreyWarren.GetRabbitCount()
+    for OffsetX, OffsetY, PercentToEat in self.__PredationOffsets:
+      FoxCell = (WarrenX + OffsetX, WarrenY + OffsetY)
+      HungryFox = self.__Foxes.get(FoxCell)
+      if not HungryFox is None or FoxCell in self.__HaloFoxes:
+        RabbitsToEat = int(round(float(PercentToEat * RabbitCountAtStartOfPeriod / 100)))
+        FoodConsumed = PreyWarren.EatRabbits(RabbitsToEat)
+        if HungryFox is None:
+          ForeignFood[FoxCell] = ForeignFood.get(FoxCell, 0) + FoodConsumed
+        else:
+          HungryFox.GiveFood(FoodConsumed)
+
+  def AdvanceFoxes(self, ForeignFood):
+    """
+    Gives foxes the food they ate in other tiles, then advances every fox
+
+    Args:
+      ForeignFood (dict): Food eaten by this tile's foxes in other tiles, keyed by fox cell
+
+    Returns:
+      dict: NewFoxes (number of foxes to place) and DeadFoxes (cells of foxes that died)
+    """
+    for FoxCell, FoodConsumed in ForeignFood.items():
+      self.__Foxes[FoxCell].GiveFood(FoodConsumed)
+    NewFoxes = 0
+    DeadFoxes = []
+    for x, y in sorted(self.__Foxes):
+      CurrentFox = self.__Foxes[(x, y)]
+      CurrentFox.AdvanceGeneration(False)
+      if CurrentFox.CheckIfDead():
+        del self.__Foxes[(x, y)]
+        DeadFoxes.append((x, y))
+      else:
+        if CurrentFox.ReproduceThisPeriod():
+          NewFoxes += 1
+        CurrentFox.ResetFoodConsumed()
+    return {"NewFoxes": NewFoxes, "DeadFoxes": DeadFoxes}
+
+  def GetRabbitCount(self):
+    """
+    Returns:
+      int: Number of rabbits across every warren in the tile
+    """
+    return sum(CurrentWarren.GetRabbitCount() for CurrentWarren in self.__Warrens.values())
+
+def _RunTileWorker(Connection, TileArgs):
+  """
+  Worker process loop: owns one LandscapeTile and runs the (method name, args) requests sent down Connection, sending each result back, until it gets None
+  """
+  Tile = LandscapeTile(*TileArgs)
+  while True:
+    Request = Connection.recv()
+    if Request is None:
+      break
+    MethodName, Args = Request
+    Connection.send(getattr(Tile, MethodName)(*Args))
+  Connection.close()
+
+class _InProcessTile:
+  """
+  Stands in for a worker process when TiledSimulation is made with InProcess = True, running the tile's methods directly, which is handy for debugging and on one-core machines
+  """
+  def __init__(self, TileArgs):
+    self.__Tile = LandscapeTile(*TileArgs)
+    self.__Result = None
+
+  def send(self, Request):
+    if not Request is None:
+      MethodName, Args = Request
+      self.__Result = getattr(self.__Tile, MethodName)(*Args)
+
+  def recv(self):
+    return self.__Result
+
+class TiledSimulation:
+  """
+  TiledSimulation runs the rules of Simulation on a landscape split into tiles, each advanced by its own worker process. It is headless only.
+
+  Note:
+    Each period is run as: every tile does predation and warren generations (with foxes from its halo), food eaten by foxes over a border is sent to their tiles, every tile advances its foxes, then the coordinator places new warrens and foxes on random empty cells and hands them to the tiles that own those cells.
+    Unlike Simulation, a new warren is placed at the end of the period, so it is never advanced in the period it appears, and each tile draws from its own generator. Results match Simulation statistically, not draw for draw, and depend on the tile layout as well as the seed
+
+  Args:
+      LandscapeSize (int): Width and Height for landscape grid on which Animals etc. are placed
+      InitialWarrenCount (int): How many Warrens to initiate with
+      InitialFoxCount (int): How many Foxes to initiate with
+      Variability (int): Something to do with chance/randomness in Warrens
+      FixedInitialLocations (bool): Use the standard 5 warrens and 5 foxes instead of random locations
+      Tiles (tuple, optional): Number of tiles across and down (defaults to (2, 2)), one worker process each
+      Seed (int, optional): Seed for placement and for every tile's generator (defaults to a value drawn from the random module)
+      WarrenType (class, optional): Class used for every warren (defaults to Warren), must be picklable
+      InProcess (bool, optional): Run every tile in this process instead of starting workers (defaults to False)
+
+  Attributes:
+      __XBoundaries, __YBoundaries (list): Where each column and row of tiles starts, then LandscapeSize
+      __Workers (list): Connection to each tile's worker, in column-major order
+      __Processes (list): Worker processes
+      __FreeWarrenCells, __FreeFoxCells (FreeCells): Occupancy of the whole landscape, for placing new animals
+      __FoxCells (set): Cell of every fox, for building halos
+  """
+  __HUNTING_RANGE = 7
+
+  def __init__(self, LandscapeSize, InitialWarrenCount, InitialFoxCount, Variability, FixedInitialLocations, Tiles = (2, 2), Seed = None, WarrenType = None, InProcess = False):
+    if Seed is None:
+      Seed = random.getrandbits(64)
+    if WarrenType is None:
+      WarrenType = Warren
+    self.__LandscapeSize = LandscapeSize
+    self.__TimePeriod = 0
+    self.__Random = random.Random(Seed)
+    self.__XBoundaries = [LandscapeSize * Column // Tiles[0] for Column in range (0, Tiles[0])] + [LandscapeSize]
+    self.__YBoundaries = [LandscapeSize * Row // Tiles[1] for Row in range (0, Tiles[1])] + [LandscapeSize]
+    self.__TilesDown = Tiles[1]
+    self.__FreeWarrenCells = FreeCells(LandscapeSize, self.__Random)
+    self.__FreeFoxCells = FreeCells(LandscapeSize, self.__Random)
+    self.__WarrenCount = 0
+    self.__FoxCells = set()
+    self.__RabbitCount = 0
+    self.__Workers = []
+    self.__Processes = []
+    for Column in range (0, Tiles[0]):
+      for Row in range (0, Tiles[1]):
+        TileArgs = (self.__XBoundaries[Column], self.__YBoundaries[Row], self.__XBoundaries[Column + 1], self.__YBoundaries[Row + 1], Variability, WarrenType, self.__Random.getrandbits(64))
+        if InProcess:
+          self.__Workers.append(_InProcessTile(TileArgs))
+        else:
+          Connection, WorkerConnection = multiprocessing.Pipe()
+          Worker = multiprocessing.Process(target = _RunTileWorker, args = (WorkerConnection, TileArgs), daemon = True)
+          Worker.start()
+          self.__Workers.append(Connection)
+          self.__Processes.append(Worker)
+    if FixedInitialLocations:
+      NewWarrens = [(1, 1, 38), (2, 8, 80), (9, 7, 20), (10, 3, 52), (13, 4, 67)]
+      NewFoxes = [(2, 10), (6, 1), (8, 6), (11, 13), (12, 4)]
+    else:
+      NewWarrens = [Cell + (0,) for Cell in self.__ChooseFreeCells(self.__FreeWarrenCells, InitialWarrenCount)]
+      NewFoxes = self.__ChooseFreeCells(self.__FreeFoxCells, InitialFoxCount)
+    self.__PlaceWarrens(NewWarrens, FixedInitialLocations)
+    self.__PlaceFoxes(NewFoxes, FixedInitialLocations)
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, ExceptionType, ExceptionValue, Traceback):
+    self.Close()
+
+  def Close(self):
+    """
+    Stops the worker processes
+    """
+    for Connection in self.__Workers:
+      Connection.send(None)
+    for Worker in self.__Processes:
+      Worker.join()
+    self.__Workers = []
+    self.__Processes = []
+
+  def __GetTile(self, x, y):
+    """
+    Returns:
+      int: Index in self.__Workers of the tile that owns cell (x, y)
+    """
+    return (bisect.bisect_right(self.__XBoundaries, x) - 1) * self.__TilesDown + bisect.bisect_right(self.__YBoundaries, y) - 1
+
+  def __ChooseFreeCells(self, Cells, Count):
+    """
+    Picks and takes up to Count random empty cells, fewer if the landscape fills up
+
+    Returns:
+      list: (x, y) of each chosen cell
+    """
+    Chosen = []
+    for c in range (0, Count):
+      Cell = Cells.ChooseFreeCell()
+      if Cell is None:
+        break
+      Cells.Take(*Cell)
+      Chosen.append(Cell)
+    return Chosen
+
+  def __CallTiles(self, MethodName, ArgsForEachTile):
+    """
+    Sends a request to every tile's worker, then waits for all the results, so the tiles work at the same time
+
+    Returns:
+      list: Each tile's result, in tile order
+    """
+    for Connection, Args in zip(self.__Workers, ArgsForEachTile):
+      Connection.send((MethodName, Args))
+    return [Connection.recv() for Connection in self.__Workers]
+
+  def __GroupByTile(self, Items):
+    """
+    Args:
+      Items (list): Tuples starting with an (x, y) cell
+
+    Returns:
+      list: The items owned by each tile
+    """
+    Groups = [[] for Connection in self.__Workers]
+    for Item in Items:
+      Groups[self.__GetTile(Item[0], Item[1])].append(Item)
+    return Groups
+
+  def __PlaceWarrens(self, NewWarrens, TakeCells = False):
+    """
+    Sends every tile its new warrens, even when it has none, and updates self.__RabbitCount from the counts the tiles send back
+
+    Args:
+      NewWarrens (list): (x, y, RabbitCount) of each warren, on cells already taken in self.__FreeWarrenCells unless TakeCells is set
+    """
+    if TakeCells:
+      for x, y, RabbitCount in NewWarrens:
+        self.__FreeWarrenCells.Take(x, y)
+    self.__RabbitCount = sum(self.__CallTiles("AddWarrens", [(Group,) for Group in self.__GroupByTile(NewWarrens)]))
+    self.__WarrenCount += len(NewWarrens)
+
+  def __PlaceFoxes(self, NewFoxes, TakeCells = False):
+    """
+    Args:
+      NewFoxes (list): (x, y) of each fox, on cells already taken in self.__FreeFoxCells unless TakeCells is set
+    """
+    if TakeCells:
+      for x, y in NewFoxes:
+        self.__FreeFoxCells.Take(x, y)
+    self.__CallTiles("AddFoxes", [(Group,) for Group in self.__GroupByTile(NewFoxes)])
+    self.__FoxCells.update(NewFoxes)
+
+  def __GetHalos(self):
+    """
+    Returns:
+      list: For each tile, the cells of foxes in other tiles within hunting range of it
+    """
+    Halos = [[] for Connection in self.__Workers]
+    Range = self.__HUNTING_RANGE
+    for x, y in self.__FoxCells:
+      Owner = self.__GetTile(x, y)
+      FirstColumn = max(0, bisect.bisect_right(self.__XBoundaries, x - Range) - 1)
+      LastColumn = min(len(self.__XBoundaries) - 2, bisect.bisect_right(self.__XBoundaries, x + Range) - 1)
+      FirstRow = max(0, bisect.bisect_right(self.__YBoundaries, y - Range) - 1)
+      LastRow = min(self.__TilesDown - 1, bisect.bisect_right(self.__YBoundaries, y + Range) - 1)
+      for Column in range (FirstColumn, LastColumn + 1):
+        for Row in range (FirstRow, LastRow + 1):
+          Tile = Column * self.__TilesDown + Row
+          if Tile != Owner:
+            Halos[Tile].append((x, y))
+    return Halos
+
+  def Step(self):
+    """
+    Advances the simulation by one time period
+    """
+    self.__TimePeriod += 1
+    Halos = self.__GetHalos()
+    WarrenResults = self.__CallTiles("AdvanceWarrens", [(len(self.__FoxCells), Halo) for Halo in Halos])
+    ForeignFood = [{} for Connection in self.__Workers]
+    NewWarrenCount = 0
+    for Result in WarrenResults:
+      NewWarrenCount += Result["NewWarrens"]
+      for x, y in Result["DeadWarrens"]:
+        self.__FreeWarrenCells.Release(x, y)
+        self.__WarrenCount -= 1
+      for FoxCell, FoodConsumed in Result["ForeignFood"].items():
+        OwnerFood = ForeignFood[self.__GetTile(*FoxCell)]
+        OwnerFood[FoxCell] = OwnerFood.get(FoxCell, 0) + FoodConsumed
+    FoxResults = self.__CallTiles("AdvanceFoxes", [(Food,) for Food in ForeignFood])
+    NewFoxCount = 0
+    for Result in FoxResults:
+      NewFoxCount += Result["NewFoxes"]
+      for x, y in Result["DeadFoxes"]:
+        self.__FreeFoxCells.Release(x, y)
+        self.__FoxCells.discard((x, y))
+    self.__PlaceWarrens([Cell + (0,) for Cell in self.__ChooseFreeCells(self.__FreeWarrenCells, NewWarrenCount)])
+    self.__PlaceFoxes(self.__ChooseFreeCells(self.__FreeFoxCells, NewFoxCount))
+
+  def Run(self, NumberOfPeriods):
+    """
+    Advances by up to NumberOfPeriods time periods, stopping early if everything dies out
+
+    Returns:
+      int: Number of time periods actually advanced
+    """
+    PeriodsRun = 0
+    while PeriodsRun < NumberOfPeriods and not self.IsExtinct():
+      self.Step()
+      PeriodsRun += 1
+    return PeriodsRun
+
+  def RunUntilExtinct(self, MaxPeriods = None):
+    """
+    Advances until there are no warrens and no foxes left
+
+    Returns:
+      int: The time period the simulation stopped at
+    """
+    PeriodsRun = 0
+    while not self.IsExtinct() and (MaxPeriods is None or PeriodsRun < MaxPeriods):
+      self.Step()
+      PeriodsRun += 1
+    return self.__TimePeriod
+
+  def IsExtinct(self):
+    """True once there are no warrens and no foxes left"""
+    return self.__WarrenCount == 0 and len(self.__FoxCells) == 0
+
+  def GetTimePeriod(self):
+    """Getter for self.__TimePeriod"""
+    return self.__TimePeriod
+
+  def GetWarrenCount(self):
+    """Number of living warrens"""
+    return self.__WarrenCount
+
+  def GetFoxCount(self):
+    """Number of living foxes"""
+    return len(self.__FoxCells)
+
+  def GetRabbitCount(self):
+    """Number of rabbits across every tile, as of the end of the last period"""
+    return self.__RabbitCount
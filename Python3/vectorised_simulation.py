@@ -0,0 +1,566 @@
+""" Vectorised Rabbits & Foxes engine
+
+An alternative backend to the Simulation class in skeleton_with_documentation.py that keeps the whole landscape in NumPy arrays, so each phase of a time period is done for every warren or every fox at once instead of one object at a time.
+
+Needs NumPy.
+"""
+
+import math
+import random
+
+try:
+  import numpy
+except ImportError:
+  numpy = None
+
+from skeleton_with_documentation import AnimalIDs
+
+class VectorisedSimulation:
+  """
+  VectorisedSimulation runs the same rules as Simulation.__AdvanceTimePeriod, Simulation.__FoxesEatRabbitsInWarren, Warren.AdvanceGeneration and Fox.AdvanceGeneration, but on arrays covering the whole landscape. It is headless only.
+
+  Note:
+    Rabbits from every warren are held in one set of columns, sorted by warren so each warren's rabbits are contiguous and in birth order, like Warren.__Rabbits.
+    Predation is worked out for all warrens in one pass by laying the fox hunting-range kernel (20% within 3.5 cells, 10% within 7) over the fox grid. Foxes still eat in landscape scan order, so a warren running out of rabbits shortchanges the same foxes as in Simulation.
+    A warren spawned during the warren phase is still advanced in the same period if it lands further along the x-then-y scan than its parent, as in Simulation.
+    Random numbers come from one NumPy generator, so results match Simulation statistically rather than draw for draw
+
+  Args:
+      LandscapeSize (int): Width and Height for landscape grid on which Animals etc. are placed
+      InitialWarrenCount (int): How many Warrens to initiate with
+      InitialFoxCount (int): How many Foxes to initiate with
+      Variability (int): Something to do with chance/randomness in Warrens
+      FixedInitialLocations (bool): Don't use random locations for Warrens?
+      Seed (int, optional): Seed for the NumPy generator (defaults to a value drawn from the random module, so random.seed() still makes runs repeatable)
+
+  Attributes:
+      __TimePeriod (int)
+      __LandscapeSize (int)
+      __Variability (int)
+      __Generator (numpy.random.Generator): Source of every random draw
+      __AnimalIDs (AnimalIDs): Where new rabbits' and foxes' IDs come from
+      __PredationOffsetsX (numpy.ndarray): x offset of each cell in a fox's hunting range, in scan order
+      __PredationOffsetsY (numpy.ndarray): y offset of each cell in a fox's hunting range, in scan order
+      __PredationPercents (numpy.ndarray): PercentToEat for each hunting range cell
+      __WarrenGrid (numpy.ndarray): Warren index of each cell, -1 where there is no warren
+      __RabbitCountGrid (numpy.ndarray): Rabbit count of each cell, 0 where there is no warren
+      __FoxGrid (numpy.ndarray): Fox index of each cell, -1 where there is no fox. Padded by the hunting range on every side so the kernel never needs bounds checks
+      __WarrenX, __WarrenY, __WarrenPeriodsRun, __WarrenAlreadySpread (numpy.ndarray): One entry per warren
+      __RabbitWarren, __RabbitID, __RabbitAge, __RabbitNaturalLifespan, __RabbitProbabilityOfDeathOtherCauses, __RabbitReproductionRate, __RabbitIsFemale (numpy.ndarray): One entry per rabbit
+      __FoxX, __FoxY, __FoxID, __FoxAge, __FoxNaturalLifespan, __FoxProbabilityOfDeathOtherCauses, __FoxFoodUnitsNeeded, __FoxFoodUnitsConsumedThisPeriod (numpy.ndarray): One entry per fox
+  """
+  __MAX_RABBITS_IN_WARREN = 99
+  __RABBIT_LIFE_SPAN = 4
+  __RABBIT_PROBABILITY_DEATH_OTHER_CAUSES = 0.05
+  __FOX_LIFE_SPAN = 7
+  __FOX_PROBABILITY_DEATH_OTHER_CAUSES = 0.1
+  __FOX_REPRODUCTION_PROBABILITY = 0.25
+  __HUNTING_RANGE = 7
+  __PREDATION_CHUNK_SIZE = 4096
+
+  def __init__(self, LandscapeSize, InitialWarrenCount, InitialFoxCount, Variability, FixedInitialLocations, Seed = None):
+    if numpy is None:
+      raise ImportError("VectorisedSimulation needs NumPy installed")
+    if Seed is None:
+      Seed = random.getrandbits(64)
+    self.__TimePeriod = 0
+    self.__LandscapeSize = LandscapeSize
+    self.__Variability = Variability
+    self.__Generator = numpy.random.default_rng(Seed)
+    self.__AnimalIDs = AnimalIDs()
+    self.__CalculatePredationOffsets()
+    Padding = self.__HUNTING_RANGE
+    self.__WarrenGrid = numpy.full((LandscapeSize, LandscapeSize), -1, dtype = numpy.int64)
+    self.__RabbitCountGrid = numpy.zeros((LandscapeSize, LandscapeSize), dtype = numpy.int64)
+    self.__FoxGrid = numpy.full((LandscapeSize + 2 * Padding, LandscapeSize + 2 * Padding), -1, dtype = numpy.int64)
+    self.__WarrenX = numpy.empty(0, dtype = numpy.int64)
+    self.__WarrenY = numpy.empty(0, dtype = numpy.int64)
+    self.__WarrenPeriodsRun = numpy.empty(0, dtype = numpy.int64)
+    self.__WarrenAlreadySpread = numpy.empty(0, dtype = bool)
+    self.__RabbitWarren = numpy.empty(0, dtype = numpy.int64)
+    self.__RabbitID = numpy.empty(0, dtype = numpy.int64)
+    self.__RabbitAge = numpy.empty(0, dtype = numpy.int64)
+    self.__RabbitNaturalLifespan = numpy.empty(0, dtype = numpy.int64)
+    self.__RabbitProbabilityOfDeathOtherCauses = numpy.empty(0)
+    self.__RabbitReproductionRate = numpy.empty(0)
+    self.__RabbitIsFemale = numpy.empty(0, dtype = bool)
+    self.__FoxX = numpy.empty(0, dtype = numpy.int64)
+    self.__FoxY = numpy.empty(0, dtype = numpy.int64)
+    self.__FoxID = numpy.empty(0, dtype = numpy.int64)
+    self.__FoxAge = numpy.empty(0, dtype = numpy.int64)
+    self.__FoxNaturalLifespan = numpy.empty(0, dtype = numpy.int64)
+    self.__FoxProbabilityOfDeathOtherCauses = numpy.empty(0)
+    self.__FoxFoodUnitsNeeded = numpy.empty(0, dtype = numpy.int64)
+    self.__FoxFoodUnitsConsumedThisPeriod = numpy.empty(0, dtype = numpy.int64)
+    if FixedInitialLocations:
+      self.__AddWarrens(numpy.array([1, 2, 9, 10, 13]), numpy.array([1, 8, 7, 3, 4]), numpy.array([38, 80, 20, 52, 67]))
+      self.__AddFoxes(numpy.array([2, 6, 8, 11, 12]), numpy.array([10, 1, 6, 13, 4]))
+    else:
+      WarrenX, WarrenY = self.__ChooseEmptyCells(self.__WarrenGrid, 0, InitialWarrenCount)
+      self.__AddWarrens(WarrenX, WarrenY, self.__NewWarrenRabbitCounts(len(WarrenX)))
+      FoxX, FoxY = self.__ChooseEmptyCells(self.__FoxGrid, Padding, InitialFoxCount)
+      self.__AddFoxes(FoxX, FoxY)
+    self.__UpdateRabbitCountGrid(self.__WarrenX, self.__WarrenY)
+
+  def __CalculatePredationOffsets(self):
+    """
+    Builds the fox hunting-range kernel, sorted by dx then dy so foxes are visited in landscape scan order
+    """
+    OffsetsX = []
+    OffsetsY = []
+    Percents = []
+    for OffsetX in range (-self.__HUNTING_RANGE, self.__HUNTING_RANGE + 1):
+      for OffsetY in range (-self.__HUNTING_RANGE, self.__HUNTING_RANGE + 1):
+        Dist = math.sqrt(pow(OffsetX, 2) + pow(OffsetY, 2))
+        if Dist <= 3.5:
+          PercentToEat = 20
+        elif Dist <= 7:
+          PercentToEat = 10
+        else:
+          continue
+        OffsetsX.append(OffsetX)
+        OffsetsY.append(OffsetY)
+        Percents.append(PercentToEat)
+    self.__PredationOffsetsX = numpy.array(OffsetsX)
+    self.__PredationOffsetsY = numpy.array(OffsetsY)
+    self.__PredationPercents = numpy.array(Percents)
+
+  def __CalculateRandomValues(self, BaseValue, Count):
+    """
+    Vectorised version of Animal._CalculateRandomValue
+
+    Returns:
+      numpy.ndarray: Count random values based on BaseValue and self.__Variability
+    """
+    Draws = self.__Generator.integers(0, self.__Variability * 2, size = Count, endpoint = True)
+    return BaseValue - (BaseValue * self.__Variability / 100) + (BaseValue * Draws / 100)
+
+  def __DrawPercentages(self, Count):
+    """
+    Returns:
+      numpy.ndarray: Count draws of random.randint(0, 100), as used by the probability checks
+    """
+    return self.__Generator.integers(0, 100, size = Count, endpoint = True)
+
+  def __NewWarrenRabbitCounts(self, Count):
+    """
+    Returns:
+      numpy.ndarray: Starting rabbit count for Count new warrens, as in Warren.__init__
+    """
+    return self.__CalculateRandomValues(int(self.__MAX_RABBITS_IN_WARREN / 4), Count).astype(numpy.int64)
+
+  def __TakeIDs(self, Count):
+    """
+    Reserves Count animal IDs from this simulation's counter
+
+    Returns:
+      numpy.ndarray: The reserved IDs
+    """
+    FirstID = self.__AnimalIDs.Take(Count)
+    return numpy.arange(FirstID, FirstID + Count, dtype = numpy.int64)
+
+  def __ChooseEmptyCells(self, Grid, Padding, Count):
+    """
+    Picks up to Count distinct random cells that are empty in Grid, like the retry loops in Simulation.__CreateNewWarren and __CreateNewFox
+
+    Note:
+      Draws candidates in batches while the landscape is mostly empty, then falls back to choosing directly from the remaining empty cells, so it never hangs on a crowded landscape. Returns fewer than Count cells if the landscape fills up
+
+    Args:
+      Grid (numpy.ndarray): __WarrenGrid or __FoxGrid
+      Padding (int): Border width around the landscape in Grid
+      Count (int): Number of cells wanted
+
+    Returns:
+      tuple: x and y coordinate arrays of the chosen cells
+    """
+    Size = self.__LandscapeSize
+    Interior = Grid[Padding:Padding + Size, Padding:Padding + Size]
+    Chosen = numpy.empty(0, dtype = numpy.int64)
+    Attempts = 0
+    while len(Chosen) < Count and Attempts < 4:
+      Needed = Count - len(Chosen)
+      Candidates = self.__Generator.integers(0, Size * Size, size = 2 * Needed + 8)
+      Candidates = Candidates[Interior[Candidates // Size, Candidates % Size] < 0]
+      Candidates = Candidates[~numpy.isin(Candidates, Chosen)]
+      FirstSeen = numpy.unique(Candidates, return_index = True)[1]
+      Candidates = Candidates[numpy.sort(FirstSeen)]
+      Chosen = numpy.concatenate((Chosen, Candidates[:Needed]))
+      Attempts += 1
+    if len(Chosen) < Count:
+      EmptyCells = numpy.flatnonzero(Interior.ravel() < 0)
+      EmptyCells = EmptyCells[~numpy.isin(EmptyCells, Chosen)]
+      Extra = self.__Generator.choice(EmptyCells, min(Count - len(Chosen), len(EmptyCells)), replace = False)
+      Chosen = numpy.concatenate((Chosen, Extra))
+    return Chosen // Size, Chosen % Size
+
+  def __AddWarrens(self, WarrenX, WarrenY, RabbitCounts):
+    """
+    Creates warrens at the given cells, each with its starting rabbits
+
+    Returns:
+      numpy.ndarray: Indexes of the new warrens
+    """
+    FirstWarren = len(self.__WarrenX)
+    NewWarrens = numpy.arange(FirstWarren, FirstWarren + len(WarrenX))
+    self.__WarrenX = numpy.concatenate((self.__WarrenX, WarrenX))
+    self.__WarrenY = numpy.concatenate((self.__WarrenY, WarrenY))
+    self.__WarrenPeriodsRun = numpy.concatenate((self.__WarrenPeriodsRun, numpy.zeros(len(WarrenX), dtype = numpy.int64)))
+    self.__WarrenAlreadySpread = numpy.concatenate((self.__WarrenAlreadySpread, numpy.zeros(len(WarrenX), dtype = bool)))
+    self.__WarrenGrid[WarrenX, WarrenY] = NewWarrens
+    Parents = numpy.repeat(NewWarrens, RabbitCounts)
+    self.__AddRabbits(Parents, numpy.full(len(Parents), 1.2))
+    return NewWarrens
+
+  def __AddRabbits(self, RabbitWarren, ParentsReproductionRates):
+    """
+    Adds one rabbit per entry, drawing its attributes the same way Rabbit.__init__ does, then re-sorts the rabbit columns by warren
+
+    Args:
+      RabbitWarren (numpy.ndarray): Warren index of each new rabbit
+      ParentsReproductionRates (numpy.ndarray): Reproduction rate passed on to each new rabbit
+    """
+    Count = len(RabbitWarren)
+    if Count == 0:
+      return
+    self.__RabbitWarren = numpy.concatenate((self.__RabbitWarren, RabbitWarren))
+    self.__RabbitID = numpy.concatenate((self.__RabbitID, self.__TakeIDs(Count)))
+    self.__RabbitAge = numpy.concatenate((self.__RabbitAge, numpy.zeros(Count, dtype = numpy.int64)))
+    NewNaturalLifespans = (self.__RABBIT_LIFE_SPAN * self.__CalculateRandomValues(100, Count) / 100).astype(numpy.int64)
+    self.__RabbitNaturalLifespan = numpy.concatenate((self.__RabbitNaturalLifespan, NewNaturalLifespans))
+    NewProbabilities = self.__RABBIT_PROBABILITY_DEATH_OTHER_CAUSES * self.__CalculateRandomValues(100, Count) / 100
+    self.__RabbitProbabilityOfDeathOtherCauses = numpy.concatenate((self.__RabbitProbabilityOfDeathOtherCauses, NewProbabilities))
+    NewReproductionRates = ParentsReproductionRates * self.__CalculateRandomValues(100, Count) / 100
+    self.__RabbitReproductionRate = numpy.concatenate((self.__RabbitReproductionRate, NewReproductionRates))
+    self.__RabbitIsFemale = numpy.concatenate((self.__RabbitIsFemale, self.__DrawPercentages(Count) >= 50))
+    self.__KeepRabbits(numpy.argsort(self.__RabbitWarren, kind = "stable"))
+
+  def __KeepRabbits(self, Selection):
+    """
+    Applies a boolean mask or index array to every rabbit column
+    """
+    self.__RabbitWarren = self.__RabbitWarren[Selection]
+    self.__RabbitID = self.__RabbitID[Selection]
+    self.__RabbitAge = self.__RabbitAge[Selection]
+    self.__RabbitNaturalLifespan = self.__RabbitNaturalLifespan[Selection]
+    self.__RabbitProbabilityOfDeathOtherCauses = self.__RabbitProbabilityOfDeathOtherCauses[Selection]
+    self.__RabbitReproductionRate = self.__RabbitReproductionRate[Selection]
+    self.__RabbitIsFemale = self.__RabbitIsFemale[Selection]
+
+  def __RemoveRabbits(self, Dead):
+    """
+    Args:
+      Dead (numpy.ndarray): Indexes of the rabbits to remove
+    """
+    if len(Dead) > 0:
+      Survivors = numpy.ones(len(self.__RabbitWarren), dtype = bool)
+      Survivors[Dead] = False
+      self.__KeepRabbits(Survivors)
+
+  def __AddFoxes(self, FoxX, FoxY):
+    """
+    Creates foxes at the given cells, drawing their attributes the same way Fox.__init__ does
+    """
+    Count = len(FoxX)
+    if Count == 0:
+      return
+    FirstFox = len(self.__FoxX)
+    self.__FoxX = numpy.concatenate((self.__FoxX, FoxX))
+    self.__FoxY = numpy.concatenate((self.__FoxY, FoxY))
+    self.__FoxID = numpy.concatenate((self.__FoxID, self.__TakeIDs(Count)))
+    self.__FoxAge = numpy.concatenate((self.__FoxAge, numpy.zeros(Count, dtype = numpy.int64)))
+    NewNaturalLifespans = (self.__FOX_LIFE_SPAN * self.__CalculateRandomValues(100, Count) / 100).astype(numpy.int64)
+    self.__FoxNaturalLifespan = numpy.concatenate((self.__FoxNaturalLifespan, NewNaturalLifespans))
+    NewProbabilities = self.__FOX_PROBABILITY_DEATH_OTHER_CAUSES * self.__CalculateRandomValues(100, Count) / 100
+    self.__FoxProbabilityOfDeathOtherCauses = numpy.concatenate((self.__FoxProbabilityOfDeathOtherCauses, NewProbabilities))
+    NewFoodUnitsNeeded = (10 * self.__CalculateRandomValues(100, Count) / 100).astype(numpy.int64)
+    self.__FoxFoodUnitsNeeded = numpy.concatenate((self.__FoxFoodUnitsNeeded, NewFoodUnitsNeeded))
+    self.__FoxFoodUnitsConsumedThisPeriod = numpy.concatenate((self.__FoxFoodUnitsConsumedThisPeriod, numpy.zeros(Count, dtype = numpy.int64)))
+    Padding = self.__HUNTING_RANGE
+    self.__FoxGrid[FoxX + Padding, FoxY + Padding] = numpy.arange(FirstFox, FirstFox + Count)
+
+  def __UpdateRabbitCountGrid(self, OldWarrenX, OldWarrenY):
+    """
+    Clears the cells warrens occupied at the start of the period and writes the current counts
+    """
+    self.__RabbitCountGrid[OldWarrenX, OldWarrenY] = 0
+    self.__RabbitCountGrid[self.__WarrenX, self.__WarrenY] = self.__GetRabbitCounts()
+
+  def __GetRabbitCounts(self):
+    """
+    Returns:
+      numpy.ndarray: Number of rabbits in each warren
+    """
+    return numpy.bincount(self.__RabbitWarren, minlength = len(self.__WarrenX))
+
+  def Step(self):
+    """
+    Advances the simulation by one time period
+
+    Attributes:
+      Wave (numpy.ndarray): Warrens to advance next. Starts as every warren, then holds the warrens spawned further along the scan than their parents
+      Advanced (list): Every wave advanced this period, as only those warrens can die out this period
+    """
+    self.__TimePeriod += 1
+    OldWarrenX = self.__WarrenX
+    OldWarrenY = self.__WarrenY
+    FoxesPresent = len(self.__FoxX) > 0
+    Wave = numpy.arange(len(self.__WarrenX))
+    Advanced = []
+    while len(Wave) > 0:
+      Advanced.append(Wave)
+      Wave = self.__AdvanceWarrens(Wave, FoxesPresent)
+    self.__RemoveDeadWarrens(numpy.concatenate(Advanced))
+    self.__AdvanceFoxes()
+    self.__UpdateRabbitCountGrid(OldWarrenX, OldWarrenY)
+
+  def Run(self, NumberOfPeriods):
+    """
+    Advances by up to NumberOfPeriods time periods, stopping early if everything dies out
+
+    Returns:
+      int: Number of time periods actually advanced
+    """
+    PeriodsRun = 0
+    while PeriodsRun < NumberOfPeriods and not self.IsExtinct():
+      self.Step()
+      PeriodsRun += 1
+    return PeriodsRun
+
+  def RunUntilExtinct(self, MaxPeriods = None):
+    """
+    Advances until there are no warrens and no foxes left
+
+    Args:
+      MaxPeriods (int, optional): Safety limit on the number of time periods to advance (defaults to no limit)
+
+    Returns:
+      int: The time period the simulation stopped at
+    """
+    PeriodsRun = 0
+    while not self.IsExtinct() and (MaxPeriods is None or PeriodsRun < MaxPeriods):
+      self.Step()
+      PeriodsRun += 1
+    return self.__TimePeriod
+
+  def __AdvanceWarrens(self, Wave, FoxesPresent):
+    """
+    Runs the warren part of a time period for a set of warrens: predation, spreading, then Warren.AdvanceGeneration
+
+    Args:
+      Wave (numpy.ndarray): Indexes of the warrens to advance
+      FoxesPresent (bool): Whether there were any foxes at the start of the period
+
+    Returns:
+      numpy.ndarray: Warrens spawned this wave that must still be advanced this period
+    """
+    if FoxesPresent:
+      self.__FoxesEatRabbits(Wave)
+    RabbitCounts = self.__GetRabbitCounts()
+    Spreading = Wave[(RabbitCounts[Wave] == self.__MAX_RABBITS_IN_WARREN) & ~self.__WarrenAlreadySpread[Wave]]
+    self.__WarrenAlreadySpread[Spreading] = True
+    InWave = numpy.zeros(len(self.__WarrenX), dtype = bool)
+    InWave[Wave] = True
+    self.__WarrenPeriodsRun[Wave] += 1
+    self.__KillAndAgeRabbits(InWave)
+    self.__MateRabbits(InWave)
+    return self.__SpreadWarrens(Spreading)
+
+  def __FoxesEatRabbits(self, Wave):
+    """
+    Vectorised Simulation.__FoxesEatRabbitsInWarren for every warren in Wave
+
+    Note:
+      Every (warren, fox) pair in hunting range is found by laying the kernel offsets over each warren cell and looking them all up in the padded fox grid at once, in chunks of warrens to bound memory.
+      Wave is sorted, so the pairs come out ordered by warren and then kernel position, and each fox's share is capped by what the foxes before it left, as EatRabbits does
+
+    Attributes:
+      Demand (numpy.ndarray): Rabbits each fox tries to eat from each warren
+      EatenBefore (numpy.ndarray): Rabbits taken from the same warren by the foxes before it
+      Prey (numpy.ndarray): Rabbits in warrens that lose some, shuffled within each warren so the first ones in each warren are eaten
+    """
+    Padding = self.__HUNTING_RANGE
+    PaddedSize = self.__LandscapeSize + 2 * Padding
+    KernelCells = self.__PredationOffsetsX * PaddedSize + self.__PredationOffsetsY
+    PairWarrens = []
+    PairFoxes = []
+    PairOffsets = []
+    for ChunkStart in range (0, len(Wave), self.__PREDATION_CHUNK_SIZE):
+      Chunk = Wave[ChunkStart:ChunkStart + self.__PREDATION_CHUNK_SIZE]
+      WarrenCells = (self.__WarrenX[Chunk] + Padding) * PaddedSize + self.__WarrenY[Chunk] + Padding
+      Foxes = self.__FoxGrid.ravel().take(WarrenCells[:, None] + KernelCells)
+      HitWarrens, HitOffsets = numpy.nonzero(Foxes >= 0)
+      PairWarrens.append(Chunk[HitWarrens])
+      PairFoxes.append(Foxes[HitWarrens, HitOffsets])
+      PairOffsets.append(HitOffsets)
+    if len(PairWarrens) == 0:
+      return
+    PairWarrens = numpy.concatenate(PairWarrens)
+    PairFoxes = numpy.concatenate(PairFoxes)
+    PairOffsets = numpy.concatenate(PairOffsets)
+    RabbitCounts = self.__GetRabbitCounts()
+    Demand = numpy.round(self.__PredationPercents[PairOffsets] * RabbitCounts[PairWarrens] / 100).astype(numpy.int64)
+    EatenBefore = numpy.cumsum(Demand) - Demand
+    EatenBefore = EatenBefore - EatenBefore[numpy.searchsorted(PairWarrens, PairWarrens)]
+    Eaten = numpy.clip(RabbitCounts[PairWarrens] - EatenBefore, 0, Demand)
+    self.__FoxFoodUnitsConsumedThisPeriod += numpy.bincount(PairFoxes, weights = Eaten, minlength = len(self.__FoxX)).astype(numpy.int64)
+    EatenFromWarren = numpy.bincount(PairWarrens, weights = Eaten, minlength = len(self.__WarrenX)).astype(numpy.int64)
+    Prey = numpy.flatnonzero(EatenFromWarren[self.__RabbitWarren] > 0)
+    if len(Prey) > 0:
+      Prey = Prey[numpy.argsort(self.__RabbitWarren[Prey] + self.__Generator.random(len(Prey)))]
+      PreyWarrens = self.__RabbitWarren[Prey]
+      RankInWarren = numpy.arange(len(Prey)) - numpy.searchsorted(PreyWarrens, PreyWarrens)
+      self.__RemoveRabbits(Prey[RankInWarren < EatenFromWarren[PreyWarrens]])
+
+  def __KillAndAgeRabbits(self, InWave):
+    """
+    Vectorised Warren.__KillByOtherFactors followed by Warren.__AgeRabbits, removing both sets of dead rabbits in one pass
+
+    Attributes:
+      KilledByOtherFactors (numpy.ndarray): One draw per rabbit, compared against every rabbit's probability of death at once
+      Survivors (numpy.ndarray): Rabbits left to age after the first phase
+    """
+    Candidates = numpy.flatnonzero(InWave[self.__RabbitWarren])
+    KilledByOtherFactors = self.__DrawPercentages(len(Candidates)) < self.__RabbitProbabilityOfDeathOtherCauses[Candidates] * 100
+    Survivors = Candidates[~KilledByOtherFactors]
+    self.__RabbitAge[Survivors] += 1
+    DiedOfOldAge = Survivors[self.__RabbitAge[Survivors] >= self.__RabbitNaturalLifespan[Survivors]]
+    self.__RemoveRabbits(numpy.concatenate((Candidates[KilledByOtherFactors], DiedOfOldAge)))
+
+  def __MateRabbits(self, InWave):
+    """
+    Vectorised Warren.__MateRabbits for every warren in the wave
+
+    Note:
+      Each female picks a random male from her own warren. Babies are only kept for the first successful pairings, in rabbit order, that still fit in the warren
+
+    Attributes:
+      MaleStarts (numpy.ndarray): Position of each warren's first male in Males
+      RankInWarren (numpy.ndarray): How many successful pairings come before this one in the same warren
+    """
+    RabbitCounts = self.__GetRabbitCounts()
+    InWaveRabbits = InWave[self.__RabbitWarren]
+    Males = numpy.flatnonzero(InWaveRabbits & ~self.__RabbitIsFemale)
+    MaleCounts = numpy.bincount(self.__RabbitWarren[Males], minlength = len(self.__WarrenX))
+    MaleStarts = numpy.cumsum(MaleCounts) - MaleCounts
+    CanMate = (MaleCounts > 0) & (RabbitCounts <= self.__MAX_RABBITS_IN_WARREN)
+    Females = numpy.flatnonzero(InWaveRabbits & self.__RabbitIsFemale & CanMate[self.__RabbitWarren])
+    if len(Females) == 0:
+      return
+    FemaleWarrens = self.__RabbitWarren[Females]
+    Mates = Males[MaleStarts[FemaleWarrens] + self.__Generator.integers(0, MaleCounts[FemaleWarrens])]
+    CombinedReproductionRates = (self.__RabbitReproductionRate[Females] + self.__RabbitReproductionRate[Mates]) / 2
+    Successful = CombinedReproductionRates >= 1
+    FemaleWarrens = FemaleWarrens[Successful]
+    CombinedReproductionRates = CombinedReproductionRates[Successful]
+    RankInWarren = numpy.arange(len(FemaleWarrens)) - numpy.searchsorted(FemaleWarrens, FemaleWarrens)
+    Born = RankInWarren < self.__MAX_RABBITS_IN_WARREN - RabbitCounts[FemaleWarrens]
+    self.__AddRabbits(FemaleWarrens[Born], CombinedReproductionRates[Born])
+
+  def __SpreadWarrens(self, Parents):
+    """
+    Creates a new warren at a random empty cell for each full warren in Parents
+
+    Returns:
+      numpy.ndarray: The new warrens that land further along the x-then-y scan than their parent
+    """
+    WarrenX, WarrenY = self.__ChooseEmptyCells(self.__WarrenGrid, 0, len(Parents))
+    NewWarrens = self.__AddWarrens(WarrenX, WarrenY, self.__NewWarrenRabbitCounts(len(WarrenX)))
+    Parents = Parents[:len(NewWarrens)]
+    Size = self.__LandscapeSize
+    Ahead = WarrenX * Size + WarrenY > self.__WarrenX[Parents] * Size + self.__WarrenY[Parents]
+    return NewWarrens[Ahead]
+
+  def __RemoveDeadWarrens(self, Advanced):
+    """
+    Removes the warrens advanced this period that have no rabbits left, and renumbers the rest
+
+    Args:
+      Advanced (numpy.ndarray): Warrens advanced this period
+    """
+    Dead = numpy.zeros(len(self.__WarrenX), dtype = bool)
+    Dead[Advanced] = True
+    Dead &= self.__GetRabbitCounts() == 0
+    if not Dead.any():
+      return
+    self.__WarrenGrid[self.__WarrenX[Dead], self.__WarrenY[Dead]] = -1
+    Survivors = ~Dead
+    NewIndexes = numpy.cumsum(Survivors) - 1
+    self.__RabbitWarren = NewIndexes[self.__RabbitWarren]
+    self.__WarrenX = self.__WarrenX[Survivors]
+    self.__WarrenY = self.__WarrenY[Survivors]
+    self.__WarrenPeriodsRun = self.__WarrenPeriodsRun[Survivors]
+    self.__WarrenAlreadySpread = self.__WarrenAlreadySpread[Survivors]
+    self.__WarrenGrid[self.__WarrenX, self.__WarrenY] = numpy.arange(len(self.__WarrenX))
+
+  def __AdvanceFoxes(self):
+    """
+    Vectorised Fox.AdvanceGeneration, ReproduceThisPeriod and ResetFoodConsumed for every fox, followed by the new fox births
+
+    Attributes:
+      Starved (numpy.ndarray): Foxes that ate nothing this period
+      Hungry (numpy.ndarray): Surviving foxes that ate less than they need, so age twice
+    """
+    FoxCount = len(self.__FoxX)
+    if FoxCount == 0:
+      return
+    Starved = self.__FoxFoodUnitsConsumedThisPeriod == 0
+    Killed = ~Starved & (self.__DrawPercentages(FoxCount) < self.__FoxProbabilityOfDeathOtherCauses * 100)
+    Living = ~Starved & ~Killed
+    Hungry = Living & (self.__FoxFoodUnitsConsumedThisPeriod < self.__FoxFoodUnitsNeeded)
+    self.__FoxAge += Living.astype(numpy.int64) + Hungry.astype(numpy.int64)
+    Survivors = Living & (self.__FoxAge < self.__FoxNaturalLifespan)
+    NewFoxCount = int(numpy.count_nonzero(Survivors & (self.__DrawPercentages(FoxCount) < self.__FOX_REPRODUCTION_PROBABILITY * 100)))
+    Padding = self.__HUNTING_RANGE
+    self.__FoxGrid[self.__FoxX + Padding, self.__FoxY + Padding] = -1
+    self.__FoxX = self.__FoxX[Survivors]
+    self.__FoxY = self.__FoxY[Survivors]
+    self.__FoxID = self.__FoxID[Survivors]
+    self.__FoxAge = self.__FoxAge[Survivors]
+    self.__FoxNaturalLifespan = self.__FoxNaturalLifespan[Survivors]
+    self.__FoxProbabilityOfDeathOtherCauses = self.__FoxProbabilityOfDeathOtherCauses[Survivors]
+    self.__FoxFoodUnitsNeeded = self.__FoxFoodUnitsNeeded[Survivors]
+    self.__FoxFoodUnitsConsumedThisPeriod = numpy.zeros(len(self.__FoxX), dtype = numpy.int64)
+    self.__FoxGrid[self.__FoxX + Padding, self.__FoxY + Padding] = numpy.arange(len(self.__FoxX))
+    FoxX, FoxY = self.__ChooseEmptyCells(self.__FoxGrid, Padding, NewFoxCount)
+    self.__AddFoxes(FoxX, FoxY)
+
+  def IsExtinct(self):
+    """
+    Returns:
+      bool: True if both warrens and foxes have died out, otherwise False
+    """
+    return len(self.__WarrenX) == 0 and len(self.__FoxX) == 0
+
+  def GetTimePeriod(self):
+    """Getter for self.__TimePeriod"""
+    return self.__TimePeriod
+
+  def GetWarrenCount(self):
+    """Number of living warrens"""
+    return len(self.__WarrenX)
+
+  def GetFoxCount(self):
+    """Number of living foxes"""
+    return len(self.__FoxX)
+
+  def GetRabbitCount(self):
+    """Number of rabbits across every warren"""
+    return len(self.__RabbitWarren)
+
+  def GetRabbitCountGrid(self):
+    """
+    Returns:
+      numpy.ndarray: Read-only LandscapeSize x LandscapeSize view of each cell's rabbit count
+    """
+    Grid = self.__RabbitCountGrid.view()
+    Grid.flags.writeable = False
+    return Grid
+
+  def GetFoxGrid(self):
+    """
+    Returns:
+      numpy.ndarray: LandscapeSize x LandscapeSize boolean grid, True where there is a fox
+    """
+    Padding = self.__HUNTING_RANGE
+    return self.__FoxGrid[Padding:Padding + self.__LandscapeSize, Padding:Padding + self.__LandscapeSize] >= 0